@@ -6,59 +6,40 @@ Merged from phase3_build_indices.py and phase3_build_indices_no_fill.py.
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 from typing import Dict, Any
 
 
-def calculate_diffusion_index(values):
+def diffusion_weights(values):
     """
-    Calculate diffusion index for market impact variables.
+    Turn market impact labels into diffusion index weights.
 
-    Formula: (% rise) + (0.5 * % neutral)
-
-    Scale:
-    - 100 = all 'rise'
-    - 50 = neutral/mixed
-    - 0 = all 'fall'
+    'rise' counts 1, 'neutral' counts 0.5, and 'fall' (or anything else,
+    including missing values) counts 0. The mean weight x 100 is the
+    diffusion index, (% rise) + (0.5 * % neutral): 100 = all 'rise',
+    50 = neutral/mixed, 0 = all 'fall'.
 
     Args:
-        values: Series with 'rise', 'fall', or 'neutral' values
+        values: Series or DataFrame with 'rise', 'fall', or 'neutral' values
 
     Returns:
-        Diffusion index (0-100)
+        Weights (floats) in the same shape as values
     """
-    if len(values) == 0:
-        return np.nan
-
-    counts = values.value_counts()
-    total = len(values)
-
-    pct_rise = counts.get('rise', 0) / total
-    pct_neutral = counts.get('neutral', 0) / total
-
-    diffusion = (pct_rise + 0.5 * pct_neutral) * 100
+    # Vectorised; on category columns only the codes are compared
+    return values.eq('rise') + 0.5 * values.eq('neutral')
 
-    return diffusion
 
-
-def aggregate_daily_scores(df, institution):
+def aggregate_daily_scores(inst_df, institution):
     """
     Aggregate speeches to daily frequency for one institution.
 
     Args:
-        df: DataFrame with all speeches
+        inst_df: DataFrame with the institution's speeches
         institution: 'United States' or 'Euro area'
 
     Returns:
         DataFrame with daily indices (sparse - no forward fill)
     """
-    inst_df = df[df['country'] == institution].copy()
-
-    print(f"\n  Processing {institution}:")
-    print(f"    Total speeches: {len(inst_df)}")
-    print(f"    Date range: {inst_df['date'].min().date()} to {inst_df['date'].max().date()}")
-
     # Continuous metrics (calculate mean)
     continuous_metrics = [
         'hawkish_dovish_score',
@@ -78,22 +59,25 @@ def aggregate_daily_scores(df, institution):
         'market_impact_currency'
     ]
 
-    # Group by date and aggregate
-    daily_continuous = inst_df.groupby('date')[continuous_metrics].mean()
-
-    # Calculate diffusion indices for market impact
-    daily_market = inst_df.groupby('date')[market_metrics].agg(calculate_diffusion_index)
+    # Market impact labels become weights (see diffusion_weights), so the
+    # diffusion index is their mean per date x 100
+    market_weights = diffusion_weights(inst_df[market_metrics])
+    market_weights.columns = [col.replace('market_impact_', '') + '_diffusion_index'
+                              for col in market_weights.columns]
 
-    # Rename market columns
-    daily_market.columns = [col.replace('market_impact_', '') + '_diffusion_index'
-                            for col in daily_market.columns]
+    # Group by date once and aggregate everything from it
+    by_date = pd.concat([inst_df[continuous_metrics], market_weights], axis=1).groupby(inst_df['date'])
+    daily_indices = by_date.mean()
+    daily_indices[market_weights.columns] *= 100
 
-    # Count speeches per day
-    daily_counts = inst_df.groupby('date').size().rename('speech_count')
-
-    # Combine all metrics
-    daily_indices = pd.concat([daily_continuous, daily_market, daily_counts], axis=1)
+    # Count speeches per day (the groups are already worked out for the
+    # mean, so counting them doesn't go over the dates again)
+    daily_indices['speech_count'] = by_date.size()
 
+    # Grouping sorts the dates, so the first and last are the date range
+    print(f"\n  Processing {institution}:")
+    print(f"    Total speeches: {len(inst_df)}")
+    print(f"    Date range: {daily_indices.index[0].date()} to {daily_indices.index[-1].date()}")
     print(f"    Unique dates with speeches: {len(daily_indices)}")
 
     return daily_indices
@@ -109,8 +93,8 @@ def create_forward_filled(daily_indices):
     Returns:
         DataFrame with all days filled (forward fill for gaps)
     """
-    start_date = daily_indices.index.min()
-    end_date = daily_indices.index.max()
+    start_date = daily_indices.index[0]  # Sorted by groupby
+    end_date = daily_indices.index[-1]
 
     # Create full date range
     full_date_range = pd.date_range(start=start_date, end=end_date, freq='D')
@@ -122,15 +106,19 @@ def create_forward_filled(daily_indices):
     print(f"      Days with speeches: {len(daily_indices)}")
     print(f"      Days to fill: {len(full_date_range) - len(daily_indices)}")
 
-    # Reindex to full date range
-    full_indices = daily_indices.reindex(full_date_range)
-
-    # Forward fill all columns except speech_count
-    cols_to_fill = [col for col in full_indices.columns if col != 'speech_count']
-    full_indices[cols_to_fill] = full_indices[cols_to_fill].ffill()
+    # Forward fill all columns except speech_count: each day takes the
+    # (already filled) row of the last date with speeches on or before it
+    cols_to_fill = [col for col in daily_indices.columns if col != 'speech_count']
+    filled = daily_indices[cols_to_fill].ffill()
+    last_speech_date = daily_indices.index.searchsorted(full_date_range, side='right') - 1
+    full_indices = pd.DataFrame(
+        filled.to_numpy()[last_speech_date], index=full_date_range, columns=cols_to_fill
+    )
 
     # Fill speech_count with 0 for days with no speeches
-    full_indices['speech_count'] = full_indices['speech_count'].fillna(0).astype(int)
+    full_indices['speech_count'] = (
+        daily_indices['speech_count'].reindex(full_date_range, fill_value=0).astype(int)
+    )
 
     # Reset index to make date a column
     full_indices = full_indices.reset_index().rename(columns={'index': 'date'})
@@ -170,9 +158,13 @@ class IndexBuilder:
 
         results_df['date'] = pd.to_datetime(results_df['date'])
 
+        # Split by institution once (country codes, not strings, compared)
+        results_df['country'] = results_df['country'].astype('category')
+        speeches_by_country = dict(list(results_df.groupby('country', observed=True)))
+
         # Build for Fed
         print("\nFed indices:")
-        fed_daily = aggregate_daily_scores(results_df, 'United States')
+        fed_daily = aggregate_daily_scores(speeches_by_country['United States'], 'United States')
 
         # Save sparse version
         fed_no_fill = fed_daily.reset_index()
@@ -188,7 +180,7 @@ class IndexBuilder:
 
         # Build for ECB
         print("\nECB indices:")
-        ecb_daily = aggregate_daily_scores(results_df, 'Euro area')
+        ecb_daily = aggregate_daily_scores(speeches_by_country['Euro area'], 'Euro area')
 
         # Save sparse version
         ecb_no_fill = ecb_daily.reset_index()
@@ -7,17 +7,30 @@ Merges all three visualization types:
 - Calendar heatmaps (sparse data)
 """
 
+import os
+import functools
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+
+matplotlib.use("Agg")  # Non-interactive backend, no GUI event loop
 import matplotlib.colors as mcolors
 import seaborn as sns
 import seaborn.objects as so
 import dayplot as dp
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pathlib import Path
 from typing import Dict, Any
 
 
+# Greens without the near-white low end, so single-speech days stay visible
+_DARK_GREENS = mcolors.LinearSegmentedColormap.from_list(
+    "DarkGreens", matplotlib.colormaps["Greens"](np.linspace(0.3, 1.0, 256))
+)
+
+
 def get_colormap_settings(var_name):
     """
     Get colormap and vcenter settings for a variable.
@@ -41,14 +54,83 @@ def get_colormap_settings(var_name):
     elif var_name in ["uncertainty", "forward_guidance_strength"]:
         return ("Greens", None, -1, 100)
     elif var_name == "speech_count":
-        base_cmap = plt.cm.get_cmap("Greens")
-        colors = base_cmap(np.linspace(0.3, 1.0, 256))
-        dark_greens = mcolors.LinearSegmentedColormap.from_list("DarkGreens", colors)
-        return (dark_greens, None, 1, 6)
+        return (_DARK_GREENS, None, 1, 6)
     else:
         return ("Greens", None, 0, 100)
 
 
+def threshold_colors(values, threshold, below_color, above_color):
+    """
+    Pick a bar colour for each value depending on which side of a threshold it is.
+
+    Args:
+        values: NumPy array of metric values
+        threshold: Values below this get below_color, the rest above_color
+        below_color: Colour for values under the threshold
+        above_color: Colour for values at or over the threshold
+
+    Returns:
+        NumPy array of colour strings, one per value
+    """
+    return np.where(values < threshold, below_color, above_color)
+
+
+_TITLE_REPLACEMENTS = (
+    ("Hawkish Dovish", "Hawkish/Dovish"),
+    ("Diffusion Index", "Diffusion"),
+    ("Topic ", ""),
+    ("Score", ""),
+)
+
+
+# Calendar figures: output name -> (figure title, metrics in row order)
+_CALENDAR_GROUPS = {
+    "policy_metrics": (
+        "Policy Metrics",
+        [
+            "hawkish_dovish_score",
+            "uncertainty",
+            "forward_guidance_strength",
+            "speech_count",
+        ],
+    ),
+    "topic_indices": (
+        "Topic Emphasis",
+        [
+            "topic_inflation",
+            "topic_growth",
+            "topic_financial_stability",
+            "topic_labor_market",
+            "topic_international",
+        ],
+    ),
+    "market_impact": (
+        "Market Impact",
+        [
+            "stocks_diffusion_index",
+            "bonds_diffusion_index",
+            "currency_diffusion_index",
+        ],
+    ),
+}
+
+
+# Index scores are bounded to -100..100 and speech counts are small, so
+# narrower dtypes halve memory without losing precision
+_INDEX_DTYPES = {
+    var: "int16" if var == "speech_count" else "float32"
+    for _, variables in _CALENDAR_GROUPS.values()
+    for var in variables
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _full_year_index(year):
+    """Every day of a calendar year, cached since it is reused per metric."""
+    return pd.date_range(start=f"{year}-01-01", end=f"{year}-12-31", freq="D")
+
+
+@functools.lru_cache(maxsize=None)
 def format_metric_title(var_name):
     """
     Format variable name into a readable title.
@@ -61,14 +143,7 @@ def format_metric_title(var_name):
     """
     title = var_name.replace("_", " ").title()
 
-    replacements = {
-        "Hawkish Dovish": "Hawkish/Dovish",
-        "Diffusion Index": "Diffusion",
-        "Topic ": "",
-        "Score": "",
-    }
-
-    for old, new in replacements.items():
+    for old, new in _TITLE_REPLACEMENTS:
         title = title.replace(old, new)
 
     return title.strip()
@@ -91,30 +166,95 @@ class Visualizer:
         self.indices_dir = Path(config["directories"]["indices"])
 
     def load_indices(self):
-        """Load all index files."""
+        """Load all index files (scores as float32, counts as int16)."""
+        files = {
+            "fed_filled": "fed_daily_indices.csv",
+            "fed_sparse": "fed_daily_indices_no_fill.csv",
+            "ecb_filled": "ecb_daily_indices.csv",
+            "ecb_sparse": "ecb_daily_indices_no_fill.csv",
+        }
         indices = {
-            "fed_filled": pd.read_csv(
-                self.indices_dir / "fed_daily_indices.csv", parse_dates=["date"]
-            ),
-            "fed_sparse": pd.read_csv(
-                self.indices_dir / "fed_daily_indices_no_fill.csv", parse_dates=["date"]
-            ),
-            "ecb_filled": pd.read_csv(
-                self.indices_dir / "ecb_daily_indices.csv", parse_dates=["date"]
-            ),
-            "ecb_sparse": pd.read_csv(
-                self.indices_dir / "ecb_daily_indices_no_fill.csv", parse_dates=["date"]
-            ),
+            key: pd.read_csv(
+                self.indices_dir / filename, parse_dates=["date"], dtype=_INDEX_DTYPES
+            )
+            for key, filename in files.items()
         }
         return indices
 
-    def create_bar_charts(self):
+    def _save(self, fig, path):
+        """
+        Save a figure as PNG.
+
+        Uses a low zlib level because deflate dominates encode time for
+        these large figures (files end up slightly bigger), and drops the
+        Software metadata entry.
+
+        Args:
+            fig: Matplotlib figure to save
+            path: Output PNG path
+        """
+        fig.savefig(
+            path,
+            dpi=self.config["charts"].get("dpi", 150),
+            bbox_inches="tight",
+            pil_kwargs={"compress_level": 1, "optimize": False},
+            metadata={"Software": None},
+        )
+
+    def _render(self, executor, method, *args):
+        """
+        Render one chart, either inline or on a worker process.
+
+        Args:
+            executor: ProcessPoolExecutor, or None to render in this process
+            method: Bound _create_* method that builds and saves the figure
+            *args: Arguments for the method
+
+        Returns:
+            Future if submitted to the executor, otherwise None
+        """
+        if executor is None:
+            method(*args)
+            return None
+        return executor.submit(method, *args)
+
+    def _fresh(self, out_path, inst):
+        """
+        Check whether a chart is already up to date (Make-style).
+
+        A chart is fresh when it is newer than both index CSVs for its
+        institution and this module. Only used when charts.incremental
+        is enabled.
+
+        Args:
+            out_path: Output PNG path
+            inst: Institution key ("fed" or "ecb")
+
+        Returns:
+            True if the chart can be skipped
+        """
+        if not self.config["charts"].get("incremental", True) or not out_path.exists():
+            return False
+
+        input_paths = [
+            self.indices_dir / f"{inst}_daily_indices.csv",
+            self.indices_dir / f"{inst}_daily_indices_no_fill.csv",
+            Path(__file__),
+        ]
+        out_mtime = out_path.stat().st_mtime
+        if all(out_mtime >= p.stat().st_mtime for p in input_paths):
+            print(f"  {out_path.name} is up to date, skipping")
+            return True
+        return False
+
+    def create_bar_charts(self, executor=None):
         """Create bar chart visualizations (uses sparse data)."""
         if not self.config["charts"]["create_bars"]:
-            return
+            return []
 
         print("\nCreating bar charts...")
         indices = self.load_indices()
+        futures = []
 
         for inst, inst_name in [
             ("fed", "Federal Reserve"),
@@ -123,25 +263,43 @@ class Visualizer:
             df = indices[f"{inst}_sparse"]
 
             # Policy metrics
-            self._create_policy_bars(df, inst, inst_name)
+            futures.append(
+                self._render(executor, self._create_policy_bars, df, inst, inst_name)
+            )
 
             # Topic indices
-            self._create_topic_bars(df, inst, inst_name)
+            futures.append(
+                self._render(executor, self._create_topic_bars, df, inst, inst_name)
+            )
 
             # Market impact
-            self._create_market_bars(df, inst, inst_name)
+            futures.append(
+                self._render(executor, self._create_market_bars, df, inst, inst_name)
+            )
 
-        print("  Bar charts complete")
+        status = "submitted" if executor is not None else "complete"
+        print(f"  Bar charts {status}")
+        return [f for f in futures if f is not None]
 
     def _create_policy_bars(self, df, inst, inst_name):
         """Create policy metrics bar chart."""
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        out_path = self.charts_dir / f"{inst}_policy_metrics_bars.png"
+        if self._fresh(out_path, inst):
+            return
+
+        fig = Figure(figsize=(14, 10), layout="constrained")
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(2, 2)
         fig.suptitle(f"{inst_name} - Policy Metrics", fontsize=16, fontweight="bold")
 
+        # Convert once; Matplotlib would otherwise convert each Series per call
+        dates = df["date"].to_numpy()
+
         # Hawkish/Dovish (diverging)
         ax = axes[0, 0]
-        colors = ["#d62728" if x < 0 else "#1f77b4" for x in df["hawkish_dovish_score"]]
-        ax.bar(df["date"], df["hawkish_dovish_score"], color=colors, width=1.5)
+        scores = df["hawkish_dovish_score"].to_numpy()
+        colors = threshold_colors(scores, 0, "#d62728", "#1f77b4")
+        ax.bar(dates, scores, color=colors, width=1.5)
         ax.axhline(y=0, color="black", linestyle="-", linewidth=0.5)
         ax.set_title("Hawkish/Dovish Score")
         ax.set_ylim(-100, 100)
@@ -175,7 +333,7 @@ class Visualizer:
 
         # Uncertainty
         ax = axes[0, 1]
-        ax.bar(df["date"], df["uncertainty"], color="#ff7f0e", width=1.5)
+        ax.bar(dates, df["uncertainty"].to_numpy(), color="#ff7f0e", width=1.5)
         ax.set_title("Uncertainty Level")
         ax.set_ylim(0, 100)
         ax.grid(True, alpha=0.3)
@@ -184,7 +342,12 @@ class Visualizer:
 
         # Forward Guidance
         ax = axes[1, 0]
-        ax.bar(df["date"], df["forward_guidance_strength"], color="#2ca02c", width=1.5)
+        ax.bar(
+            dates,
+            df["forward_guidance_strength"].to_numpy(),
+            color="#2ca02c",
+            width=1.5,
+        )
         ax.set_title("Forward Guidance Strength")
         ax.set_ylim(0, 100)
         ax.grid(True, alpha=0.3)
@@ -193,23 +356,22 @@ class Visualizer:
 
         # Speech count
         ax = axes[1, 1]
-        ax.bar(df["date"], df["speech_count"], color="#9467bd", width=1.5)
+        ax.bar(dates, df["speech_count"].to_numpy(), color="#9467bd", width=1.5)
         ax.set_title("Speeches per Day")
         ax.grid(True, alpha=0.3)
         for spine in ["top", "right", "bottom", "left"]:
             ax.spines[spine].set_visible(False)
-
-        plt.tight_layout()
-        plt.savefig(
-            self.charts_dir / f"{inst}_policy_metrics_bars.png",
-            dpi=300,
-            bbox_inches="tight",
-        )
-        plt.close()
+        self._save(fig, out_path)
 
     def _create_topic_bars(self, df, inst, inst_name):
         """Create topic indices bar chart."""
-        fig, axes = plt.subplots(3, 2, figsize=(12, 12))
+        out_path = self.charts_dir / f"{inst}_topic_indices_bars.png"
+        if self._fresh(out_path, inst):
+            return
+
+        fig = Figure(figsize=(12, 12), layout="constrained")
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(3, 2)
         fig.suptitle(f"{inst_name} - Topic Emphasis", fontsize=16, fontweight="bold")
 
         topics = [
@@ -221,12 +383,14 @@ class Visualizer:
         ]
 
         palette = sns.color_palette()
+        dates = df["date"].to_numpy()
+        values = {col: df[col].to_numpy() for col, _ in topics}
 
         for idx, (col, title) in enumerate(topics):
             row = idx // 2
             col_idx = idx % 2
             ax = axes[row, col_idx]
-            ax.bar(df["date"], df[col], color=palette[idx], width=1.5)
+            ax.bar(dates, values[col], color=palette[idx], width=1.5)
             ax.set_title(title)
             ax.set_ylim(0, 100)
             ax.grid(True, alpha=0.3)
@@ -235,18 +399,17 @@ class Visualizer:
 
         # Hide last subplot
         axes[2, 1].axis("off")
-
-        plt.tight_layout()
-        plt.savefig(
-            self.charts_dir / f"{inst}_topic_indices_bars.png",
-            dpi=300,
-            bbox_inches="tight",
-        )
-        plt.close()
+        self._save(fig, out_path)
 
     def _create_market_bars(self, df, inst, inst_name):
         """Create market impact diffusion index bars."""
-        fig, axes = plt.subplots(2, 2, figsize=(12, 8))
+        out_path = self.charts_dir / f"{inst}_market_impact_bars.png"
+        if self._fresh(out_path, inst):
+            return
+
+        fig = Figure(figsize=(12, 8), layout="constrained")
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(2, 2)
         fig.suptitle(
             f"{inst_name} - Market Impact Diffusion Indices",
             fontsize=16,
@@ -259,12 +422,15 @@ class Visualizer:
             ("currency_diffusion_index", f"{'USD' if inst == 'fed' else 'EUR'}"),
         ]
 
+        dates = df["date"].to_numpy()
+
         for idx, (col, title) in enumerate(markets):
             row = idx // 2
             col_idx = idx % 2
             ax = axes[row, col_idx]
-            colors = ["#C41E28" if x < 50 else "#048060" for x in df[col]]
-            ax.bar(df["date"], df[col], color=colors, width=1.5)
+            values = df[col].to_numpy()
+            colors = threshold_colors(values, 50, "#C41E28", "#048060")
+            ax.bar(dates, values, color=colors, width=1.5)
             ax.axhline(y=50, color="black", linestyle="--", linewidth=0.5, alpha=0.5)
             ax.set_title(title)
             ax.set_ylim(0, 100)
@@ -274,37 +440,43 @@ class Visualizer:
 
         # Hide the unused subplot
         axes[1, 1].axis("off")
+        self._save(fig, out_path)
 
-        plt.tight_layout()
-        plt.savefig(
-            self.charts_dir / f"{inst}_market_impact_bars.png",
-            dpi=300,
-            bbox_inches="tight",
-        )
-        plt.close()
-
-    def create_area_plots(self):
+    def create_area_plots(self, executor=None):
         """Create area plot visualizations (uses forward-filled data)."""
         if not self.config["charts"]["create_areas"]:
-            return
+            return []
 
         print("\nCreating area plots...")
         indices = self.load_indices()
+        futures = []
 
         for inst, inst_name in [
             ("fed", "Federal Reserve"),
             ("ecb", "European Central Bank"),
         ]:
             df = indices[f"{inst}_filled"]
-            self._create_policy_areas(df, inst, inst_name)
-            self._create_topic_areas(df, inst, inst_name)
+            futures.append(
+                self._render(executor, self._create_policy_areas, df, inst, inst_name)
+            )
+            futures.append(
+                self._render(executor, self._create_topic_areas, df, inst, inst_name)
+            )
 
-        print("  Area plots complete")
+        status = "submitted" if executor is not None else "complete"
+        print(f"  Area plots {status}")
+        return [f for f in futures if f is not None]
 
     def _create_policy_areas(self, df, inst, inst_name):
         """Create policy metrics area plots."""
+        out_path = self.charts_dir / f"{inst}_policy_metrics_area.png"
+        if self._fresh(out_path, inst):
+            return
+
         with sns.axes_style("whitegrid"):
-            fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+            fig = Figure(figsize=(14, 10), layout="constrained")
+            FigureCanvasAgg(fig)
+            axes = fig.subplots(2, 2)
             fig.suptitle(
                 f"{inst_name} - Policy Metrics (Continuous)",
                 fontsize=16,
@@ -316,25 +488,16 @@ class Visualizer:
             palette = sns.color_palette()
             blue = palette[0]
             red = palette[3]
-            ax.fill_between(
-                df["date"],
-                0,
-                df["hawkish_dovish_score"],
-                where=(df["hawkish_dovish_score"] >= 0),
-                color=red,
-                alpha=0.3,
-            )
-            ax.fill_between(
-                df["date"],
-                0,
-                df["hawkish_dovish_score"],
-                where=(df["hawkish_dovish_score"] < 0),
-                color=blue,
-                alpha=0.3,
-            )
-            ax.plot(
-                df["date"], df["hawkish_dovish_score"], color="#888888", linewidth=2
-            )
+            dates = df["date"].to_numpy()
+            scores = df["hawkish_dovish_score"].to_numpy()
+
+            # Masks on plain arrays; interpolate=True fills up to where the
+            # line crosses zero, so there are no gaps at sign changes
+            ax.fill_between(dates, 0, scores, where=scores >= 0, interpolate=True,
+                            color=red, alpha=0.3)
+            ax.fill_between(dates, 0, scores, where=scores < 0, interpolate=True,
+                            color=blue, alpha=0.3)
+            ax.plot(dates, scores, color="#888888", linewidth=2)
             ax.axhline(y=0, color="black", linestyle="-", linewidth=0.5)
             ax.set_title("Hawkish/Dovish Score")
             ax.set_ylim(-100, 100)
@@ -386,19 +549,18 @@ class Visualizer:
                     spine.set_visible(False)
 
             axes[1, 1].axis("off")
-
-            plt.tight_layout()
-            plt.savefig(
-                self.charts_dir / f"{inst}_policy_metrics_area.png",
-                dpi=300,
-                bbox_inches="tight",
-            )
-            plt.close()
+            self._save(fig, out_path)
 
     def _create_topic_areas(self, df, inst, inst_name):
         """Create topic emphasis area plots."""
+        out_path = self.charts_dir / f"{inst}_topic_indices_area.png"
+        if self._fresh(out_path, inst):
+            return
+
         with sns.axes_style("whitegrid"):
-            fig, axes = plt.subplots(3, 2, figsize=(12, 12))
+            fig = Figure(figsize=(12, 12), layout="constrained")
+            FigureCanvasAgg(fig)
+            axes = fig.subplots(3, 2)
             fig.suptitle(
                 f"{inst_name} - Topic Emphasis (Continuous)",
                 fontsize=16,
@@ -428,238 +590,81 @@ class Visualizer:
                     spine.set_visible(False)
 
             axes[2, 1].axis("off")
+            self._save(fig, out_path)
 
-            plt.tight_layout()
-            plt.savefig(
-                self.charts_dir / f"{inst}_topic_indices_area.png",
-                dpi=300,
-                bbox_inches="tight",
-            )
-            plt.close()
-
-    def create_calendar_heatmaps(self):
+    def create_calendar_heatmaps(self, executor=None):
         """Create calendar heatmap visualizations (uses sparse data)."""
         if not self.config["charts"]["create_calendars"]:
-            return
+            return []
 
         print("\nCreating calendar heatmaps...")
         indices = self.load_indices()
+        futures = []
 
         for inst in ["fed", "ecb"]:
             df = indices[f"{inst}_sparse"]
-            self._create_policy_calendar(df, inst)
-            self._create_topic_calendar(df, inst)
-            self._create_market_calendar(df, inst)
-
-        print("  Calendar heatmaps complete")
-
-    def _create_policy_calendar(self, df, inst):
-        """Create policy metrics calendar heatmap."""
-        inst_name = "Federal Reserve" if inst == "fed" else "European Central Bank"
-        variables = [
-            "hawkish_dovish_score",
-            "uncertainty",
-            "forward_guidance_strength",
-            "speech_count",
-        ]
-
-        years = sorted(df["date"].dt.year.unique())
-        n_metrics = len(variables)
-        n_rows = n_metrics * len(years)
-
-        fig, axes = plt.subplots(
-            nrows=n_rows,
-            ncols=1,
-            figsize=(16, 2.5 * n_rows),
-            gridspec_kw={"hspace": 0.4},
-        )
-
-        if n_rows == 1:
-            axes = [axes]
-
-        fig.suptitle(
-            f"{inst_name} - Policy Metrics (Calendar)",
-            fontsize=16,
-            fontweight="bold",
-            y=0.998,
-        )
-
-        ax_idx = 0
-        for var in variables:
-            metric_title = format_metric_title(var)
-            cmap, vcenter, vmin, vmax = get_colormap_settings(var)
-
-            for year in years:
-                ax = axes[ax_idx]
-                year_df = df[df["date"].dt.year == year].copy()
-
-                if len(year_df) > 0:
-                    dates = year_df["date"].tolist()
-                    values = year_df[var].tolist()
-
-                    if var in ["uncertainty", "forward_guidance_strength"]:
-                        values = [0.01 if v == 0 else v for v in values]
-
-                    start_date = f"{year}-01-01"
-                    end_date = f"{year}-12-31"
-
-                    if var == "speech_count":
-                        legend_bins_count = 6
-                        legend_labels_custom = "auto"
-                    elif var in ["uncertainty", "forward_guidance_strength"]:
-                        legend_bins_count = 5
-                        legend_labels_custom = None
-                    elif var == "hawkish_dovish_score":
-                        legend_bins_count = 11
-                        legend_labels_custom = "auto"
-                    else:
-                        legend_bins_count = 11
-                        legend_labels_custom = "auto"
-
-                    if vcenter is not None:
-                        full_dates = pd.date_range(
-                            start=start_date, end=end_date, freq="D"
-                        )
-                        date_series = pd.Series(values, index=dates)
-                        full_series = date_series.reindex(
-                            full_dates, fill_value=vcenter
-                        )
-
-                        dp.calendar(
-                            dates=full_series.index.tolist(),
-                            values=full_series.tolist(),
-                            start_date=start_date,
-                            end_date=end_date,
-                            cmap=cmap,
-                            vcenter=vcenter,
-                            vmin=vmin,
-                            vmax=vmax,
-                            edgecolor="white",
-                            edgewidth=0.5,
-                            legend=True,
-                            legend_bins=legend_bins_count,
-                            legend_labels=legend_labels_custom,
-                            ax=ax,
-                        )
-                    else:
-                        dp.calendar(
-                            dates=dates,
-                            values=values,
-                            start_date=start_date,
-                            end_date=end_date,
-                            cmap=cmap,
-                            vmin=vmin,
-                            vmax=vmax,
-                            color_for_none="#e8e8e8",
-                            edgecolor="white",
-                            edgewidth=0.5,
-                            legend=True,
-                            legend_bins=legend_bins_count,
-                            legend_labels=legend_labels_custom,
-                            ax=ax,
-                        )
 
-                ax.text(
-                    -4,
-                    3.5,
-                    str(year),
-                    size=16,
-                    rotation=90,
-                    color="#666",
-                    va="center",
-                    ha="center",
-                    weight="bold",
+            # Split by year once per institution, shared by all three figures
+            year_dfs = dict(tuple(df.groupby(df["date"].dt.year)))
+
+            for group in _CALENDAR_GROUPS:
+                futures.append(
+                    self._render(
+                        executor,
+                        self._create_calendar,
+                        inst,
+                        group,
+                        year_dfs,
+                    )
                 )
 
-                if year == years[0]:
-                    ax.text(
-                        1.02,
-                        0.5,
-                        metric_title,
-                        transform=ax.transAxes,
-                        size=14,
-                        va="center",
-                        ha="left",
-                        weight="bold",
-                        color="#333",
-                    )
+        status = "submitted" if executor is not None else "complete"
+        print(f"  Calendar heatmaps {status}")
+        return [f for f in futures if f is not None]
 
-                ax_idx += 1
+    def _create_calendar(self, inst, group, year_dfs):
+        """
+        Create one calendar heatmap figure (one row per metric and year).
 
-        plt.tight_layout(rect=[0, 0, 1, 0.995])
-        plt.savefig(
-            self.charts_dir / f"{inst}_policy_metrics_calendar.png",
-            dpi=300,
-            bbox_inches="tight",
-        )
-        plt.close()
+        Args:
+            inst: Institution key ("fed" or "ecb")
+            group: Key into _CALENDAR_GROUPS
+            year_dfs: Sparse data split by year, shared across groups
+        """
+        out_path = self.charts_dir / f"{inst}_{group}_calendar.png"
+        if self._fresh(out_path, inst):
+            return
 
-    def _create_topic_calendar(self, df, inst):
-        """Create topic indices calendar heatmap."""
         inst_name = "Federal Reserve" if inst == "fed" else "European Central Bank"
-        variables = [
-            "topic_inflation",
-            "topic_growth",
-            "topic_financial_stability",
-            "topic_labor_market",
-            "topic_international",
-        ]
+        title, variables = _CALENDAR_GROUPS[group]
 
-        years = sorted(df["date"].dt.year.unique())
-        n_metrics = len(variables)
-        n_rows = n_metrics * len(years)
+        years = sorted(year_dfs)
+        n_rows = len(variables) * len(years)
 
-        fig, axes = plt.subplots(
-            nrows=n_rows,
-            ncols=1,
-            figsize=(16, 2.5 * n_rows),
-            gridspec_kw={"hspace": 0.4},
-        )
+        fig = Figure(figsize=(16, 2.5 * n_rows), layout="constrained")
+        FigureCanvasAgg(fig)
+        fig.get_layout_engine().set(hspace=0.06)
+        axes = fig.subplots(nrows=n_rows, ncols=1)
 
         if n_rows == 1:
             axes = [axes]
 
         fig.suptitle(
-            f"{inst_name} - Topic Emphasis (Calendar)",
+            f"{inst_name} - {title} (Calendar)",
             fontsize=16,
             fontweight="bold",
-            y=0.998,
         )
 
         ax_idx = 0
         for var in variables:
             metric_title = format_metric_title(var)
-            cmap, vcenter, vmin, vmax = get_colormap_settings(var)
 
             for year in years:
                 ax = axes[ax_idx]
-                year_df = df[df["date"].dt.year == year].copy()
+                year_df = year_dfs[year]
 
                 if len(year_df) > 0:
-                    dates = year_df["date"].tolist()
-                    values = year_df[var].tolist()
-
-                    values = [0.01 if v == 0 else v for v in values]
-
-                    start_date = f"{year}-01-01"
-                    end_date = f"{year}-12-31"
-
-                    dp.calendar(
-                        dates=dates,
-                        values=values,
-                        start_date=start_date,
-                        end_date=end_date,
-                        cmap=cmap,
-                        vmin=vmin,
-                        vmax=vmax,
-                        color_for_none="#e8e8e8",
-                        edgecolor="white",
-                        edgewidth=0.5,
-                        legend=True,
-                        legend_bins=5,
-                        legend_labels=None,
-                        ax=ax,
-                    )
+                    self._render_calendar_panel(ax, year_df, var, year)
 
                 ax.text(
                     -4,
@@ -687,116 +692,72 @@ class Visualizer:
                     )
 
                 ax_idx += 1
+        self._save(fig, out_path)
 
-        plt.tight_layout(rect=[0, 0, 1, 0.995])
-        plt.savefig(
-            self.charts_dir / f"{inst}_topic_indices_calendar.png",
-            dpi=300,
-            bbox_inches="tight",
-        )
-        plt.close()
-
-    def _create_market_calendar(self, df, inst):
-        """Create market impact calendar heatmap."""
-        inst_name = "Federal Reserve" if inst == "fed" else "European Central Bank"
-        variables = [
-            "stocks_diffusion_index",
-            "bonds_diffusion_index",
-            "currency_diffusion_index",
-        ]
-
-        years = sorted(df["date"].dt.year.unique())
-        n_metrics = len(variables)
-        n_rows = n_metrics * len(years)
-
-        fig, axes = plt.subplots(
-            nrows=n_rows,
-            ncols=1,
-            figsize=(16, 2.5 * n_rows),
-            gridspec_kw={"hspace": 0.4},
-        )
-
-        if n_rows == 1:
-            axes = [axes]
-
-        fig.suptitle(
-            f"{inst_name} - Market Impact (Calendar)",
-            fontsize=16,
-            fontweight="bold",
-            y=0.998,
-        )
-
-        ax_idx = 0
-        for var in variables:
-            metric_title = format_metric_title(var)
-            cmap, vcenter, vmin, vmax = get_colormap_settings(var)
-
-            for year in years:
-                ax = axes[ax_idx]
-                year_df = df[df["date"].dt.year == year].copy()
-
-                if len(year_df) > 0:
-                    dates = year_df["date"].tolist()
-                    values = year_df[var].tolist()
-
-                    start_date = f"{year}-01-01"
-                    end_date = f"{year}-12-31"
-
-                    full_dates = pd.date_range(start=start_date, end=end_date, freq="D")
-                    date_series = pd.Series(values, index=dates)
-                    full_series = date_series.reindex(full_dates, fill_value=vcenter)
-
-                    dp.calendar(
-                        dates=full_series.index.tolist(),
-                        values=full_series.tolist(),
-                        start_date=start_date,
-                        end_date=end_date,
-                        cmap=cmap,
-                        vcenter=vcenter,
-                        vmin=vmin,
-                        vmax=vmax,
-                        edgecolor="white",
-                        edgewidth=0.5,
-                        legend=True,
-                        legend_bins=11,
-                        legend_labels="auto",
-                        ax=ax,
-                    )
-
-                ax.text(
-                    -4,
-                    3.5,
-                    str(year),
-                    size=16,
-                    rotation=90,
-                    color="#666",
-                    va="center",
-                    ha="center",
-                    weight="bold",
-                )
-
-                if year == years[0]:
-                    ax.text(
-                        1.02,
-                        0.5,
-                        metric_title,
-                        transform=ax.transAxes,
-                        size=14,
-                        va="center",
-                        ha="left",
-                        weight="bold",
-                        color="#333",
-                    )
+    def _render_calendar_panel(self, ax, year_df, var, year):
+        """
+        Draw one year of one metric onto a calendar axis.
 
-                ax_idx += 1
+        Diverging metrics (with a vcenter) are reindexed to every day of the
+        year so missing days show as neutral. Sequential metrics stay sparse
+        and missing days are drawn in grey.
+        """
+        cmap, vcenter, vmin, vmax = get_colormap_settings(var)
+        start_date = f"{year}-01-01"
+        end_date = f"{year}-12-31"
+
+        if vcenter is not None:
+            full_series = pd.Series(
+                year_df[var].values, index=year_df["date"].values
+            ).reindex(_full_year_index(year), fill_value=vcenter)
+
+            dp.calendar(
+                dates=full_series.index,
+                values=full_series.to_numpy(),
+                start_date=start_date,
+                end_date=end_date,
+                cmap=cmap,
+                vcenter=vcenter,
+                vmin=vmin,
+                vmax=vmax,
+                edgecolor="white",
+                edgewidth=0.5,
+                legend=True,
+                legend_bins=11,
+                legend_labels="auto",
+                ax=ax,
+            )
+            return
 
-        plt.tight_layout(rect=[0, 0, 1, 0.995])
-        plt.savefig(
-            self.charts_dir / f"{inst}_market_impact_calendar.png",
-            dpi=300,
-            bbox_inches="tight",
+        # dp.calendar iterates its inputs, so pass the column and array
+        # directly rather than boxing them into lists
+        values = year_df[var].to_numpy()
+
+        if var == "speech_count":
+            legend_bins_count = 6
+            legend_labels_custom = "auto"
+        else:
+            # Keep zero-valued days coloured (vmin is -1) rather than blank
+            values = np.where(values == 0, 0.01, values)
+            legend_bins_count = 5
+            legend_labels_custom = None
+
+        dp.calendar(
+            dates=year_df["date"],
+            values=values,
+            start_date=start_date,
+            end_date=end_date,
+            cmap=cmap,
+            vmin=vmin,
+            vmax=vmax,
+            color_for_none="#e8e8e8",
+            edgecolor="white",
+            edgewidth=0.5,
+            legend=True,
+            legend_bins=legend_bins_count,
+            legend_labels=legend_labels_custom,
+            ax=ax,
         )
-        plt.close()
 
     def create_all_charts(self):
         """Create all enabled visualizations."""
@@ -804,9 +765,24 @@ class Visualizer:
         print("CREATING VISUALIZATIONS")
         print("=" * 70)
 
-        self.create_bar_charts()
-        self.create_area_plots()
-        self.create_calendar_heatmaps()
+        if self.config["charts"].get("parallel", False):
+            # Each figure is independent, so render them on separate processes.
+            # Workers only receive the DataFrame and write their own PNG.
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = (
+                    self.create_bar_charts(executor)
+                    + self.create_area_plots(executor)
+                    + self.create_calendar_heatmaps(executor)
+                )
+
+                print(f"\nRendering {len(futures)} charts in parallel...")
+                for future in futures:
+                    # Re-raise any error from the worker
+                    future.result()
+        else:
+            self.create_bar_charts()
+            self.create_area_plots()
+            self.create_calendar_heatmaps()
 
         print("\n" + "=" * 70)
         print("VISUALIZATION COMPLETE")
@@ -8,19 +8,21 @@ This script handles data loading and sampling:
 
 For beginners:
 - Run this first to download and prepare the data
-- Output: sample_2022_2023.csv in data/processed/
+- Output: sample_2022_2023.parquet in data/processed/
 - No API calls, no costs
 - Usage: python phase1_data_prep.py
+- Add --export-csv to also write sample_2022_2023.csv for inspection
 """
 
+import argparse
 import sys
 from pathlib import Path
 
 # Add src directory to Python path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+import phase1_pipeline
 from config import Config
-from data_loader import DataLoader
 from utils import print_section_header
 
 
@@ -28,68 +30,29 @@ def main():
     """
     Main function that loads and samples the data.
     """
+    # Parse arguments
+    parser = argparse.ArgumentParser(
+        description="Load the speeches dataset and save a sample for batch processing"
+    )
+    parser.add_argument(
+        "--export-csv",
+        action="store_true",
+        help="Also save the sample as CSV (easier to open in a spreadsheet)",
+    )
+
+    args = parser.parse_args()
 
     print("=" * 70)
     print("PHASE 1 - PART 1: DATA PREPARATION".center(70))
     print("Central Bank Communication Sentiment Analysis".center(70))
     print("=" * 70)
 
-    # ============================================================
-    # STEP 1: Validate Configuration
-    # ============================================================
-    print_section_header("STEP 1: VALIDATE CONFIGURATION")
-
-    try:
-        Config.validate()
-    except ValueError as e:
-        print(f"\n❌ Configuration Error: {e}")
-        print("\nTo fix this:")
-        print("1. Copy .env.example to .env")
-        print("2. Add your OpenAI API key to .env")
-        print("3. Add your Hugging Face token to .env")
-        print("4. Run this script again")
+    # Steps 1-3: validate, load the sample years and save them
+    results = dict(phase1_pipeline.run(steps=("load", "sample"), export_csv=args.export_csv))
+    if "sample" not in results:
         return
-
-    # ============================================================
-    # STEP 2: Load Dataset
-    # ============================================================
-    print_section_header("STEP 2: LOAD DATASET FROM HUGGING FACE")
-
-    loader = DataLoader()
-
-    # Load the complete dataset
-    df = loader.load_from_huggingface()
-
-    # Show summary
-    loader.print_dataset_summary(df)
-
-    # ============================================================
-    # STEP 3: Sample 2 Years of Data
-    # ============================================================
-    print_section_header("STEP 3: SAMPLE TEST DATA")
-
-    # Sample 2022-2023 for testing
-    sample_df = loader.sample_data(
-        df, start_year=Config.SAMPLE_START_YEAR, end_year=Config.SAMPLE_END_YEAR
-    )
-
-    print(f"\n📋 Sample Data Summary:")
-    print(f"   Total speeches: {len(sample_df)}")
-
-    if "country" in sample_df.columns:
-        print(f"\n   By country (institution):")
-        for country, count in sample_df["country"].value_counts().items():
-            print(f"      {country}: {count}")
-
-    # Display columns available
-    print(f"\n   Available columns:")
-    for col in sample_df.columns:
-        print(f"      - {col}")
-
-    # Save sample for reference
-    sample_file = Config.PROCESSED_DATA_DIR / "sample_2022_2023.csv"
-    sample_df.to_csv(sample_file, index=False)
-    print(f"\n✓ Saved sample to: {sample_file}")
+    sample_df = results["load"]
+    sample_file = results["sample"]
 
     # ============================================================
     # SUMMARY
@@ -104,7 +67,7 @@ def main():
     print(
         f"   ✓ Sampled {len(sample_df)} speeches from {Config.SAMPLE_START_YEAR}-{Config.SAMPLE_END_YEAR}"
     )
-    print("   ✓ Saved sample to CSV file")
+    print("   ✓ Saved sample to Parquet file")
 
     print("\n📝 Next Step:")
     print("   Run: python phase1_batch_prep.py")
@@ -16,14 +16,14 @@ For beginners:
 
 import sys
 from pathlib import Path
+import pyarrow.parquet as pq
 
 # Add src directory to Python path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+import phase1_pipeline
 from config import Config
-from data_loader import DataLoader
-from batch_builder import BatchRequestBuilder
-from utils import print_section_header, save_json
+from utils import print_section_header
 
 
 def main():
@@ -36,171 +36,16 @@ def main():
     print("Central Bank Communication Sentiment Analysis".center(70))
     print("=" * 70)
 
-    # ============================================================
-    # STEP 1: Validate Configuration
-    # ============================================================
-    print_section_header("STEP 1: VALIDATE CONFIGURATION")
-
-    try:
-        Config.validate()
-    except ValueError as e:
-        print(f"\n❌ Configuration Error: {e}")
-        print("\nTo fix this:")
-        print("1. Copy .env.example to .env")
-        print("2. Add your OpenAI API key to .env")
-        print("3. Run this script again")
+    # Run every stage. If phase1_data_prep.py (or an earlier demo run)
+    # already saved the sample, reuse it and skip the download and sampling
+    results = dict(phase1_pipeline.run(reuse_sample=True, preview=False))
+    if "cost" not in results:
         return
-
-    # ============================================================
-    # STEP 2: Load Dataset
-    # ============================================================
-    print_section_header("STEP 2: LOAD DATASET FROM HUGGING FACE")
-
-    loader = DataLoader()
-
-    # Load the complete dataset
-    df = loader.load_from_huggingface()
-
-    # Show summary
-    loader.print_dataset_summary(df)
-
-    # ============================================================
-    # STEP 3: Sample 2 Years of Data
-    # ============================================================
-    print_section_header("STEP 3: SAMPLE TEST DATA")
-
-    # Sample 2022-2023 for testing
-    sample_df = loader.sample_data(
-        df,
-        start_year=Config.SAMPLE_START_YEAR,
-        end_year=Config.SAMPLE_END_YEAR
-    )
-
-    print(f"\n📋 Sample Data Summary:")
-    print(f"   Total speeches: {len(sample_df)}")
-
-    if 'institution' in sample_df.columns:
-        print(f"\n   By institution:")
-        for institution, count in sample_df['institution'].value_counts().items():
-            print(f"      {institution}: {count}")
-
-    # Save sample for reference
-    sample_file = Config.PROCESSED_DATA_DIR / "sample_2022_2023.csv"
-    sample_df.to_csv(sample_file, index=False)
-    print(f"\n✓ Saved sample to: {sample_file}")
-
-    # ============================================================
-    # STEP 4: Build Batch Request File
-    # ============================================================
-    print_section_header("STEP 4: BUILD BATCH REQUEST FILE")
-
-    # Determine column names (they might vary in the dataset)
-    # Common possibilities for column names
-    text_col = None
-    id_col = None
-    speaker_col = None
-    institution_col = None
-    date_col = None
-
-    # Find text column
-    for possible_name in ['text', 'content', 'speech', 'body']:
-        if possible_name in sample_df.columns:
-            text_col = possible_name
-            break
-
-    # Find ID column (or create one)
-    for possible_name in ['id', 'speech_id', 'index']:
-        if possible_name in sample_df.columns:
-            id_col = possible_name
-            break
-
-    if not id_col:
-        # Create ID column
-        sample_df['id'] = range(len(sample_df))
-        id_col = 'id'
-
-    # Find other columns
-    for col in sample_df.columns:
-        col_lower = col.lower()
-        if 'speaker' in col_lower and not speaker_col:
-            speaker_col = col
-        elif 'institution' in col_lower and not institution_col:
-            institution_col = col
-        elif 'date' in col_lower and not date_col:
-            date_col = col
-
-    # Validate we have required columns
-    if not text_col:
-        print("\n❌ Error: Could not find text column in dataset")
-        print(f"   Available columns: {list(sample_df.columns)}")
-        return
-
-    # Fill in missing columns with defaults
-    if not speaker_col:
-        sample_df['speaker'] = 'Unknown'
-        speaker_col = 'speaker'
-
-    if not institution_col:
-        sample_df['institution'] = 'Unknown'
-        institution_col = 'institution'
-
-    if not date_col:
-        sample_df['date'] = 'Unknown'
-        date_col = 'date'
-
-    print(f"\n📋 Using columns:")
-    print(f"   Text: {text_col}")
-    print(f"   ID: {id_col}")
-    print(f"   Speaker: {speaker_col}")
-    print(f"   Institution: {institution_col}")
-    print(f"   Date: {date_col}")
-
-    # Build batch file
-    builder = BatchRequestBuilder()
-    batch_file = Config.BATCH_INPUT_DIR / f"batch_sample_{Config.SAMPLE_START_YEAR}_{Config.SAMPLE_END_YEAR}.jsonl"
-
-    stats = builder.build_batch_file(
-        df=sample_df,
-        output_file=batch_file,
-        text_column=text_col,
-        id_column=id_col,
-        speaker_column=speaker_col,
-        institution_column=institution_col,
-        date_column=date_col
-    )
-
-    # Validate the batch file
-    print_section_header("VALIDATING BATCH FILE")
-    is_valid = builder.validate_batch_file(batch_file)
-
-    # ============================================================
-    # STEP 5: Cost Comparison Summary
-    # ============================================================
-    print_section_header("STEP 5: COST COMPARISON")
-
-    print("\n💰 DETAILED COST BREAKDOWN")
-    print("=" * 60)
-
-    print(f"\n📊 Processing {stats['num_requests']} speeches")
-    print(f"   Input tokens:  {stats['total_input_tokens']:,}")
-    print(f"   Output tokens: {stats['estimated_output_tokens']:,} (estimated)")
-
-    print(f"\n💵 BATCH API (50% discount):")
-    print(f"   Input cost:  ${stats['total_input_tokens']/1000 * Config.BATCH_INPUT_PRICE_PER_1K:.2f}")
-    print(f"   Output cost: ${stats['estimated_output_tokens']/1000 * Config.BATCH_OUTPUT_PRICE_PER_1K:.2f}")
-    print(f"   TOTAL:       ${stats['batch_cost_estimate']:.2f}")
-
-    print(f"\n💵 REAL-TIME API (standard pricing):")
-    print(f"   Input cost:  ${stats['total_input_tokens']/1000 * Config.REALTIME_INPUT_PRICE_PER_1K:.2f}")
-    print(f"   Output cost: ${stats['estimated_output_tokens']/1000 * Config.REALTIME_OUTPUT_PRICE_PER_1K:.2f}")
-    print(f"   TOTAL:       ${stats['realtime_cost_estimate']:.2f}")
-
-    print(f"\n✅ SAVINGS WITH BATCH API:")
-    print(f"   ${stats['savings']:.2f} ({stats['savings']/stats['realtime_cost_estimate']*100:.0f}% discount)")
-
-    # Save statistics
-    stats_file = Config.RESULTS_DIR / "phase1_statistics.json"
-    save_json(stats, stats_file)
+    sample_file = results["sample"]
+    stats = results["build"]
+    batch_file = phase1_pipeline.BATCH_FILE
+    stats_file = results["cost"]
+    num_speeches = pq.read_metadata(sample_file).num_rows
 
     # ============================================================
     # FINAL SUMMARY
@@ -214,7 +59,7 @@ def main():
 
     print("\n🎯 What we've demonstrated:")
     print("   ✓ Loaded ECB-FED speeches dataset from Hugging Face")
-    print(f"   ✓ Sampled {len(sample_df)} speeches from {Config.SAMPLE_START_YEAR}-{Config.SAMPLE_END_YEAR}")
+    print(f"   ✓ Sampled {num_speeches} speeches from {Config.SAMPLE_START_YEAR}-{Config.SAMPLE_END_YEAR}")
     print(f"   ✓ Created batch processing file with {stats['num_requests']} requests")
     print(f"   ✓ Compared costs: ${stats['batch_cost_estimate']:.2f} (batch) vs ${stats['realtime_cost_estimate']:.2f} (real-time)")
     print(f"   ✓ Validated batch file format")
@@ -12,14 +12,18 @@ For beginners:
 
 Usage:
     python phase2_batch_submit.py              # Auto-detect chunks or single batch
-    python phase2_batch_submit.py --all-chunks # Submit all chunks sequentially
+    python phase2_batch_submit.py --all-chunks # Submit all chunks
     python phase2_batch_submit.py --chunk 1    # Submit single chunk
 
 IMPORTANT: This script makes actual API calls and charges will apply!
 """
 
+import os
+import re
 import sys
 import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
 from datetime import datetime
@@ -29,9 +33,24 @@ import json
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config import Config
-from batch_processor import BatchProcessor
+from batch_processor import (
+    FINAL_STATUSES,
+    RETRYABLE_ERRORS,
+    BatchProcessor,
+    backoff_intervals,
+    retry_api_call_async,
+)
 from output_validator import OutputValidator
-from utils import print_section_header, save_json, load_json
+from utils import confirm, count_lines, load_chunk_manifest, print_section_header, save_json
+
+SEP = "=" * 70
+
+CHUNK_FILE_PATTERN = re.compile(r"batch_sample_2022_2023_chunk(\d+)\.jsonl$")
+
+
+def _banner(*titles):
+    """Build a banner (centred titles between separator lines) to print in one go."""
+    return "\n".join([SEP, *(title.center(70) for title in titles), SEP])
 
 
 def detect_chunks():
@@ -40,103 +59,266 @@ def detect_chunks():
     if not chunks_dir.exists():
         return None
 
-    # Find all chunk files
-    chunk_files = sorted(chunks_dir.glob("batch_sample_2022_2023_chunk*.jsonl"))
+    # Find all chunk files, in chunk number order (so chunk100 comes after
+    # chunk99, not after chunk10)
+    with os.scandir(chunks_dir) as entries:
+        numbered = [
+            (int(match.group(1)), entry.path)
+            for entry in entries
+            if (match := CHUNK_FILE_PATTERN.match(entry.name))
+        ]
+    chunk_files = [Path(path) for _, path in sorted(numbered)]
     return chunk_files if chunk_files else None
 
 
-def submit_single_chunk(chunk_num, chunk_file, processor):
+async def submit_chunks_concurrently(chunks, processor, wait=True):
     """
-    Submit a single chunk and wait for it to enter 'in_progress' state.
+    Upload, submit and monitor several chunks at once.
+
+    Args:
+        chunks: List of (chunk_num, chunk_file) pairs
+        processor: BatchProcessor to use
+        wait: If False, submit every chunk straight away without waiting
+              for running jobs to finish, then check all statuses once
 
     Returns:
-        Dictionary with chunk submission info
+        One result per chunk: its chunk info, or the error it raised
+
+    For beginners:
+    - This is an "async" function: while one step waits for OpenAI, the
+      others carry on (run it with asyncio.run)
+    - It works like a small assembly line with three stations:
+      1. Up to Config.UPLOAD_WORKERS uploaders send chunk files to OpenAI
+      2. A submitter starts a batch job for each uploaded file, as long as
+         fewer than Config.MAX_CONCURRENT_CHUNKS jobs are running
+      3. One poller checks all running jobs together (every few seconds
+         at first, slowing to every Config.BATCH_CHECK_INTERVAL seconds),
+         and frees a slot for the next job when one finishes
+    - Queues pass the work from one station to the next
+    - With wait=False there is no waiting at all: every chunk is submitted
+      as soon as it is uploaded (OpenAI queues them, as long as your
+      account's limits allow), and the poller has nothing to do
     """
-    print(f"\n{'='*70}")
-    print(f"CHUNK {chunk_num}".center(70))
-    print(f"{'='*70}")
+    to_upload = asyncio.Queue()
+    for chunk in chunks:
+        to_upload.put_nowait(chunk)
+    uploaded = asyncio.Queue()
+
+    # Info for every chunk (including ones submitted in earlier runs),
+    # saved to one file whenever a chunk is submitted or finishes
+    manifest_file = Config.CHUNK_MANIFEST_FILE
+    manifest = load_chunk_manifest(manifest_file)
+    manifest_lock = asyncio.Lock()
+
+    # Look up the settings and API calls the stations use once, up front
+    upload_file = processor.upload_batch_file_async
+    create_job = processor.create_batch_job_async
+    batch_timeout = Config.BATCH_TIMEOUT
+
+    slots = asyncio.Semaphore(Config.MAX_CONCURRENT_CHUNKS)
+    in_flight = {}  # batch_id -> chunk info, for jobs still running
+    results = {}  # chunk_num -> chunk info or error
+    submitting_done = asyncio.Event()
+    job_started = asyncio.Event()
+
+    async def check_status(batch_id):
+        """Check one job, retrying temporary API errors."""
+        return await retry_api_call_async(processor.check_batch_status_async, batch_id)
+
+    async def record(chunk_info):
+        """Save a chunk's info to the manifest, one save at a time."""
+        async with manifest_lock:
+            manifest[chunk_info["chunk_number"]] = chunk_info
+            # Save a copy, so chunk infos can keep changing while it's written
+            snapshot = {num: dict(info) for num, info in manifest.items()}
+            await asyncio.to_thread(save_json, snapshot, manifest_file)
+
+    async def uploader():
+        while not to_upload.empty():
+            chunk_num, chunk_file = to_upload.get_nowait()
+            try:
+                # Count requests in chunk
+                num_requests = count_lines(chunk_file)
 
-    # Count requests in chunk
-    with open(chunk_file, "r", encoding="utf-8") as f:
-        num_requests = sum(1 for _ in f)
+                print(f"   Chunk {chunk_num}: uploading {chunk_file.name} ({num_requests} speeches)")
+                file_id = await upload_file(chunk_file)
+                print(f"   Chunk {chunk_num}: uploaded (file ID: {file_id})")
+                await uploaded.put((chunk_num, chunk_file, num_requests, file_id))
+            except Exception as e:
+                results[chunk_num] = e
 
-    print(f"\nChunk file: {chunk_file.name}")
-    print(f"Speeches: {num_requests}")
+    async def upload_all():
+        num_uploaders = max(1, min(Config.UPLOAD_WORKERS, len(chunks)))
+        await asyncio.gather(*[uploader() for _ in range(num_uploaders)])
+        await uploaded.put(None)  # Tell the submitter there is nothing more
 
-    # Upload file
-    file_id = processor.upload_batch_file(chunk_file)
+    async def submitter():
+        while (item := await uploaded.get()) is not None:
+            chunk_num, chunk_file, num_requests, file_id = item
 
-    # Create batch job
-    batch_id = processor.create_batch_job(
-        file_id, description=f"Phase 2: ECB-FED Speeches 2022-2023 - Chunk {chunk_num}"
-    )
+            # Wait for a free slot (a running job to finish)
+            if wait:
+                await slots.acquire()
+            try:
+                batch_id = await create_job(
+                    file_id,
+                    description=f"Phase 2: ECB-FED Speeches 2022-2023 - Chunk {chunk_num}",
+                )
+            except Exception as e:
+                results[chunk_num] = e
+                if wait:
+                    slots.release()
+                continue
+
+            # Save chunk info
+            chunk_info = {
+                "chunk_number": chunk_num,
+                "batch_id": batch_id,
+                "file_id": file_id,
+                "submitted_at": datetime.now().isoformat(),
+                "chunk_file": str(chunk_file),
+                "num_requests": num_requests,
+                "status": "submitted",
+            }
+            await record(chunk_info)
+            print(f"   Chunk {chunk_num}: submitted (batch ID: {batch_id})")
+
+            if not wait:
+                results[chunk_num] = chunk_info
+                continue
+
+            in_flight[batch_id] = chunk_info
+            job_started.set()
+
+        submitting_done.set()
+        job_started.set()
+
+    async def poller():
+        waits = None
+        while not (submitting_done.is_set() and not in_flight):
+            if not in_flight:
+                # Nothing running yet - wait for the submitter
+                job_started.clear()
+                await job_started.wait()
+                waits = None
+                continue
+
+            # Check often at first, then less and less (see backoff_intervals)
+            if waits is None:
+                waits = backoff_intervals(
+                    Config.BATCH_CHECK_INITIAL_INTERVAL, Config.BATCH_CHECK_INTERVAL
+                )
+            await asyncio.sleep(next(waits))
+
+            # Check every running job in one go
+            batch_ids = list(in_flight)
+            statuses = await asyncio.gather(
+                *[check_status(batch_id) for batch_id in batch_ids],
+                return_exceptions=True,
+            )
 
-    # Save chunk info
-    chunk_info = {
-        "chunk_number": chunk_num,
-        "batch_id": batch_id,
-        "file_id": file_id,
-        "submitted_at": datetime.now().isoformat(),
-        "chunk_file": str(chunk_file),
-        "num_requests": num_requests,
-        "status": "submitted",
-    }
+            for batch_id, status_info in zip(batch_ids, statuses):
+                chunk_info = in_flight[batch_id]
+                submitted_at = datetime.fromisoformat(chunk_info["submitted_at"])
+                timed_out = (
+                    datetime.now() - submitted_at
+                ).total_seconds() > batch_timeout
+
+                if isinstance(status_info, Exception):
+                    # Temporary errors (still failing after the retries) are
+                    # tried again next round, until the job times out. Other
+                    # errors (e.g. a deleted batch or a revoked key) won't
+                    # go away, so give up on the job and free its slot
+                    if isinstance(status_info, RETRYABLE_ERRORS) and not timed_out:
+                        continue
+                    del in_flight[batch_id]
+                    slots.release()
+                    print(f"   Chunk {chunk_info['chunk_number']}: status check failed ({status_info})")
+                    results[chunk_info["chunk_number"]] = status_info
+                    continue
 
-    chunk_info_file = Config.RESULTS_DIR / f"phase2_chunk{chunk_num:02d}_info.json"
-    save_json(chunk_info, chunk_info_file)
+                if (
+                    status_info["status"] in FINAL_STATUSES
+                    or timed_out
+                ):
+                    del in_flight[batch_id]
+                    slots.release()
+
+                    # Update chunk info with current status
+                    chunk_info["status"] = status_info["status"]
+                    chunk_info["status_checked_at"] = datetime.now().isoformat()
+                    chunk_num = chunk_info["chunk_number"]
+                    await record(chunk_info)
+                    print(f"   Chunk {chunk_num}: {status_info['status']}")
+                    results[chunk_num] = chunk_info
 
-    print(f"\n   Batch ID: {batch_id}")
-    print(f"   Info saved: {chunk_info_file.name}")
+    try:
+        await asyncio.gather(upload_all(), submitter(), poller())
+    finally:
+        await processor.async_client.close()
 
-    # Wait for it to enter 'in_progress' state (exits validation queue)
-    print(f"\n   Waiting for chunk to start processing...")
-    status_info = processor.wait_for_in_progress(batch_id)
+    if not wait:
+        # One status check for everything we submitted
+        submitted = [info for info in results.values() if isinstance(info, dict)]
+        try:
+            statuses = await asyncio.to_thread(
+                processor.check_batch_statuses, [info["batch_id"] for info in submitted]
+            )
+        except Exception as e:
+            print(f"   Could not check batch statuses: {e}")
+            statuses = {}
 
-    # Update chunk info with current status
-    chunk_info["status"] = status_info["status"]
-    chunk_info["status_checked_at"] = datetime.now().isoformat()
-    save_json(chunk_info, chunk_info_file)
+        for chunk_info in submitted:
+            status_info = statuses.get(chunk_info["batch_id"])
+            if status_info is None:
+                continue
+            chunk_info["status"] = status_info["status"]
+            chunk_info["status_checked_at"] = datetime.now().isoformat()
+            chunk_num = chunk_info["chunk_number"]
+            await record(chunk_info)
+            print(f"   Chunk {chunk_num}: {status_info['status']}")
 
-    return chunk_info
+    return [results[chunk_num] for chunk_num, _ in chunks]
 
 
-def submit_all_chunks(chunk_files):
-    """
-    Submit all chunks using smart sequential approach.
+def submit_all_chunks(chunk_files, wait=True, rate_limit=None, assume_yes=False):
     """
-    print("=" * 70)
-    print("PHASE 2: CHUNKED BATCH SUBMISSION".center(70))
-    print("Central Bank Communication Sentiment Analysis".center(70))
-    print("=" * 70)
+    Submit all chunks, uploading them together and running up to
+    Config.MAX_CONCURRENT_CHUNKS batch jobs at a time.
 
-    print(f"\n   Found {len(chunk_files)} chunks to submit")
+    With wait=False, every chunk is submitted at once without waiting
+    for earlier jobs to finish. rate_limit overrides
+    Config.API_REQUESTS_PER_MINUTE. With assume_yes=True, the
+    confirmation prompt is skipped (for scripts and automation).
+    """
     print(
-        f"   Strategy: Smart sequential (submit, wait until processing starts, repeat)"
+        _banner(
+            "PHASE 2: CHUNKED BATCH SUBMISSION",
+            "Central Bank Communication Sentiment Analysis",
+        )
     )
+
+    print(f"\n   Found {len(chunk_files)} chunks to submit")
+    if wait:
+        print(
+            f"   Strategy: Upload all, then run {Config.MAX_CONCURRENT_CHUNKS} batch job(s) at a time"
+        )
+    else:
+        print("   Strategy: Upload and submit all chunks at once (--no-wait)")
     print(
         f"   Estimated time: ~{len(chunk_files) * 3:.0f}-{len(chunk_files) * 5:.0f} minutes (~{len(chunk_files) * 4 / 60:.1f} hours)"
     )
 
     # Calculate total cost estimate
-    total_requests = 0
-    for chunk_file in chunk_files:
-        with open(chunk_file, "r", encoding="utf-8") as f:
-            total_requests += sum(1 for _ in f)
+    # Count all chunk files at once: reading files is mostly waiting on the
+    # disk, so threads can overlap those waits
+    with ThreadPoolExecutor(max_workers=min(16, len(chunk_files))) as executor:
+        total_requests = sum(executor.map(count_lines, chunk_files))
 
     estimated_cost = total_requests * 0.0075  # Rough estimate
     print(f"\n   Total speeches: {total_requests}")
     print(f"   Estimated cost: ${estimated_cost:.2f}")
 
-    # Safety check
-    print("\n" + "=" * 70)
-    print("   WARNING: This will make REAL API calls".upper())
-    print("=" * 70)
-
-    response = input("\n   Type 'YES' to proceed with all chunks: ")
-    if response.upper() != "YES":
-        print("\n   Aborted by user. No charges incurred.")
-        return None
-
     # Validate configuration
     print_section_header("VALIDATE CONFIGURATION")
     try:
@@ -145,24 +327,46 @@ def submit_all_chunks(chunk_files):
         print(f"\n   Configuration Error: {e}")
         return None
 
+    processor = BatchProcessor(requests_per_minute=rate_limit)
+
+    # Safety check
+    print(f"\n{SEP}\n   WARNING: THIS WILL MAKE REAL API CALLS\n{SEP}")
+
+    if not assume_yes:
+        processor.warm_up()  # Connect to OpenAI while you type
+        response = input("\n   Type 'YES' to proceed with all chunks: ")
+        if response.upper() != "YES":
+            print("\n   Aborted by user. No charges incurred.")
+            return None
+
     # Submit all chunks
     print_section_header("SUBMITTING ALL CHUNKS")
-    processor = BatchProcessor()
     submitted_chunks = []
     skipped_chunks = []
+    chunks_to_submit = []
+
+    # Find chunks that were already submitted, and check all their
+    # statuses in one go
+    existing_batch_ids = {
+        i: chunk_info["batch_id"]
+        for i, chunk_info in load_chunk_manifest(Config.CHUNK_MANIFEST_FILE).items()
+        if i <= len(chunk_files)
+    }
+
+    try:
+        statuses = processor.check_batch_statuses(existing_batch_ids.values())
+    except Exception as e:
+        print(f"\n   Could not check existing batches: {e}")
+        statuses = {}
 
     for i, chunk_file in enumerate(chunk_files, 1):
         # Check if chunk was already submitted
-        chunk_info_file = Config.RESULTS_DIR / f"phase2_chunk{i:02d}_info.json"
-
-        if chunk_info_file.exists():
-            existing_info = load_json(chunk_info_file)
-            batch_id = existing_info["batch_id"]
+        if i in existing_batch_ids:
+            batch_id = existing_batch_ids[i]
 
             # Check current status
             try:
-                status = processor.check_batch_status(batch_id)
-                current_status = status["status"]
+                current_status = statuses[batch_id]["status"]
 
                 if current_status in ["in_progress", "completed"]:
                     print(f"\n   Chunk {i}: Already {current_status}, skipping")
@@ -175,36 +379,39 @@ def submit_all_chunks(chunk_files):
             except Exception as e:
                 print(f"\n   Chunk {i}: Error checking existing batch, will resubmit")
 
-        # Submit the chunk
-        try:
-            chunk_info = submit_single_chunk(i, chunk_file, processor)
-            submitted_chunks.append(chunk_info)
+        chunks_to_submit.append((i, chunk_file))
 
-            print(f"\n   Chunk {i}/{len(chunk_files)} submitted successfully!")
+    # Submit the chunks
+    results = asyncio.run(
+        submit_chunks_concurrently(chunks_to_submit, processor, wait=wait)
+    )
 
-            if chunk_info["status"] == "in_progress":
-                print(f"   Status: in_progress (out of queue, can submit next)")
-            else:
-                print(f"   Status: {chunk_info['status']}")
+    failed_chunks = []
+    for (i, chunk_file), result in zip(chunks_to_submit, results):
+        if isinstance(result, BaseException):
+            print(f"\n   Error submitting or monitoring chunk {i}: {result}")
+            failed_chunks.append(i)
+        else:
+            submitted_chunks.append(result)
 
-        except Exception as e:
-            print(f"\n   Error submitting chunk {i}: {e}")
-            print(
-                f"   Successfully submitted {len(submitted_chunks)}/{len(chunk_files)} chunks"
-            )
-            print(
-                f"   Skipped {len(skipped_chunks)} chunks (already processing/completed)"
-            )
-            return submitted_chunks
+    if failed_chunks:
+        print(
+            f"\n   Successfully submitted {len(submitted_chunks)}/{len(chunk_files)} chunks"
+        )
+        print(
+            f"   Skipped {len(skipped_chunks)} chunks (already processing/completed)"
+        )
+        print(f"   Failed: chunks {failed_chunks} (run again to retry them)")
+        return submitted_chunks
 
     # All chunks processed
-    print("\n" + "=" * 70)
-    print("SUBMISSION COMPLETE!".center(70))
-    print("=" * 70)
+    print("\n" + _banner("SUBMISSION COMPLETE!"))
 
-    print(f"\n   Newly submitted: {len(submitted_chunks)}")
-    print(f"   Skipped (already processing/completed): {len(skipped_chunks)}")
-    print(f"   Total chunks: {len(chunk_files)}")
+    print(
+        f"\n   Newly submitted: {len(submitted_chunks)}\n"
+        f"   Skipped (already processing/completed): {len(skipped_chunks)}\n"
+        f"   Total chunks: {len(chunk_files)}"
+    )
 
     if submitted_chunks:
         print(f"\n   YOU CAN NOW CLOSE YOUR LAPTOP")
@@ -212,11 +419,13 @@ def submit_all_chunks(chunk_files):
     else:
         print(f"\n   All chunks already submitted!")
 
-    print(f"\n   Next steps:")
-    print(f"   1. Check progress: python phase2_check_status.py --all-chunks")
-    print(f"   2. Download results: python phase2_download_results.py")
+    print(
+        "\n   Next steps:\n"
+        "   1. Check progress: python phase2_check_status.py --all-chunks\n"
+        "   2. Download results: python phase2_download_results.py"
+    )
 
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
 
     return submitted_chunks
 
@@ -230,9 +439,25 @@ def main():
         description="Submit batch jobs to OpenAI for sentiment analysis"
     )
     parser.add_argument(
-        "--all-chunks", action="store_true", help="Submit all chunks sequentially"
+        "--all-chunks", action="store_true", help="Submit all chunks"
     )
     parser.add_argument("--chunk", type=int, help="Submit a specific chunk number")
+    parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="Submit all chunks at once instead of waiting for each job to finish",
+    )
+    parser.add_argument(
+        "--yes",
+        "-y",
+        action="store_true",
+        help="Skip the confirmation prompts, and monitor a single batch without asking (for scripts and automation)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help=f"Max upload/submit requests per minute (default: {Config.API_REQUESTS_PER_MINUTE})",
+    )
 
     args = parser.parse_args()
 
@@ -246,7 +471,12 @@ def main():
             print("\n   Error: --all-chunks specified but no chunks found")
             print(f"   Run: python split_batch.py")
             return
-        submit_all_chunks(chunk_files)
+        submit_all_chunks(
+            chunk_files,
+            wait=not args.no_wait,
+            rate_limit=args.rate_limit,
+            assume_yes=args.yes,
+        )
         return
 
     elif args.chunk:
@@ -262,17 +492,21 @@ def main():
             print(f"   Valid chunks: 1-{len(chunk_files)}")
             return
 
-        processor = BatchProcessor()
+        processor = BatchProcessor(requests_per_minute=args.rate_limit)
         chunk_file = chunk_files[chunk_num - 1]
-        submit_single_chunk(chunk_num, chunk_file, processor)
+        (result,) = asyncio.run(
+            submit_chunks_concurrently(
+                [(chunk_num, chunk_file)], processor, wait=not args.no_wait
+            )
+        )
+        if isinstance(result, BaseException):
+            raise result
         return
 
     # Auto-detect mode (no explicit flags)
     if chunk_files:
         # Chunks exist, ask user
-        print("=" * 70)
-        print("CHUNK FILES DETECTED".center(70))
-        print("=" * 70)
+        print(_banner("CHUNK FILES DETECTED"))
 
         print(f"\n   Found {len(chunk_files)} chunk files")
         print(f"\n   Options:")
@@ -282,22 +516,12 @@ def main():
         return
 
     # No chunks, use original workflow
-    print("=" * 70)
-    print("PHASE 2: BATCH JOB SUBMISSION & PROCESSING".center(70))
-    print("Central Bank Communication Sentiment Analysis".center(70))
-    print("=" * 70)
-
-    # ============================================================
-    # SAFETY CHECK
-    # ============================================================
-    print("\n⚠️  WARNING: This script will make REAL API calls")
-    print("   Estimated cost: ~$2.32 for the 2022-2023 sample")
-    print("   Processing time: Up to 24 hours (typically 30min-4hrs)")
-
-    response = input("\n   Type 'YES' to proceed: ")
-    if response.upper() != "YES":
-        print("\n❌ Aborted by user. No charges incurred.")
-        return
+    print(
+        _banner(
+            "PHASE 2: BATCH JOB SUBMISSION & PROCESSING",
+            "Central Bank Communication Sentiment Analysis",
+        )
+    )
 
     # ============================================================
     # STEP 1: Validate Configuration
@@ -310,6 +534,22 @@ def main():
         print(f"\n❌ Configuration Error: {e}")
         return
 
+    processor = BatchProcessor()
+
+    # ============================================================
+    # SAFETY CHECK
+    # ============================================================
+    print("\n⚠️  WARNING: This script will make REAL API calls")
+    print("   Estimated cost: ~$2.32 for the 2022-2023 sample")
+    print("   Processing time: Up to 24 hours (typically 30min-4hrs)")
+
+    if not args.yes:
+        processor.warm_up()  # Connect to OpenAI while you type
+        response = input("\n   Type 'YES' to proceed: ")
+        if response.upper() != "YES":
+            print("\n❌ Aborted by user. No charges incurred.")
+            return
+
     # ============================================================
     # STEP 2: Check Batch File Exists
     # ============================================================
@@ -317,7 +557,10 @@ def main():
 
     batch_file = Config.BATCH_INPUT_DIR / "batch_sample_2022_2023.jsonl"
 
-    if not batch_file.exists():
+    # One stat() call both checks the file exists and gets its size
+    try:
+        file_size = batch_file.stat().st_size
+    except FileNotFoundError:
         print(f"\n❌ Error: Batch file not found!")
         print(f"   Expected: {batch_file}")
         print(f"\n   Please run phase1_batch_prep.py first to create the batch file.")
@@ -326,7 +569,7 @@ def main():
     print(f"✓ Batch file found: {batch_file}")
 
     # Show file size
-    file_size_mb = batch_file.stat().st_size / (1024 * 1024)
+    file_size_mb = file_size / (1024 * 1024)
     print(f"✓ File size: {file_size_mb:.2f} MB")
 
     # ============================================================
@@ -334,8 +577,6 @@ def main():
     # ============================================================
     print_section_header("STEP 3: UPLOAD & SUBMIT BATCH JOB")
 
-    processor = BatchProcessor()
-
     # Upload file
     file_id = processor.upload_batch_file(batch_file)
 
@@ -368,8 +609,8 @@ def main():
     print("   The batch job will continue processing on OpenAI's servers.")
     print("   To resume monitoring, run: python phase2_check_status.py")
 
-    response = input("\n   Monitor now? (Y/n): ")
-    if response.lower() == "n":
+    # (with --yes, nobody is asked and it monitors straight away)
+    if not confirm("\n   Monitor now? (Y/n): ", default=True, interactive=not args.yes):
         print("\n✅ Batch submitted successfully!")
         print(f"   Batch ID: {batch_id}")
         print(
@@ -466,7 +707,7 @@ def main():
         print(f"   Status: {status['status']}")
         print(f"   Please check the batch status and try again")
 
-    print("\n" + "=" * 70)
+    print("\n" + SEP)
 
 
 if __name__ == "__main__":
@@ -6,42 +6,55 @@ and downloads results if complete.
 
 For beginners:
 - Use this if you stopped monitoring or want to check back later
-- Reads the batch ID from phase2_batch_info.json or chunk info files
+- Reads the batch ID from phase2_batch_info.json or the chunk manifest
 - No additional charges (just checking status)
 
 Usage:
     python phase2_check_status.py              # Auto-detect chunks or single batch
     python phase2_check_status.py --all-chunks # Check all chunks
     python phase2_check_status.py --chunk 1    # Check specific chunk
+    python phase2_check_status.py --refresh    # Also re-check finished batches
+    python phase2_check_status.py --no-interactive  # Never ask; keep existing files
+    python phase2_check_status.py --force-download --force-parse  # Redo both
 """
 
 import sys
 import argparse
+import asyncio
 from pathlib import Path
 import pandas as pd
 from datetime import datetime
+from openai import APIError
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config import Config
-from batch_processor import BatchProcessor
+from batch_processor import RETRYABLE_ERRORS, BatchProcessor, retry_api_call
 from output_validator import OutputValidator
-from utils import print_section_header, save_json, load_json
+from utils import (
+    confirm, is_up_to_date, load_chunk_manifest, print_section_header, save_json, load_json
+)
 
 
 def detect_chunk_files():
-    """Detect if chunk info files exist."""
-    chunk_files = sorted(Config.RESULTS_DIR.glob("phase2_chunk*_info.json"))
-    return chunk_files if chunk_files else None
+    """Detect if chunks have been submitted (returns their chunk infos)."""
+    manifest = load_chunk_manifest(Config.CHUNK_MANIFEST_FILE)
+    return manifest if manifest else None
 
 
-def check_all_chunks_status():
-    """Check status of all chunks and display summary."""
-    chunk_files = detect_chunk_files()
+def check_all_chunks_status(refresh=False, chunks=None):
+    """
+    Check status of all chunks and display summary.
+
+    Finished batches are not asked about again unless refresh is True.
+    Pass chunks (from detect_chunk_files) if they are already loaded.
+    """
+    if chunks is None:
+        chunks = detect_chunk_files()
 
-    if not chunk_files:
-        print("\n   Error: No chunk info files found")
+    if not chunks:
+        print("\n   Error: No submitted chunks found")
         print(f"   Have you run: python phase2_batch_submit.py --all-chunks")
         return
 
@@ -50,40 +63,52 @@ def check_all_chunks_status():
     print("=" * 70)
 
     processor = BatchProcessor()
+    if refresh:
+        processor.forget_statuses()
+
+    # Check all chunks at once: each check mostly waits on the network,
+    # so the waits overlap on one event loop
+    statuses = asyncio.run(processor.check_batch_statuses_async(
+        chunk_info['batch_id'] for chunk_info in chunks.values()
+    ))
 
     # Collect status for all chunks
     chunk_statuses = []
-    for chunk_file in chunk_files:
-        chunk_info = load_json(chunk_file)
+    for chunk_info in chunks.values():
         chunk_num = chunk_info['chunk_number']
         batch_id = chunk_info['batch_id']
 
-        try:
-            status = processor.check_batch_status(batch_id)
+        status = statuses[batch_id]
+
+        if isinstance(status, Exception):
+            if not isinstance(status, APIError):
+                raise status
+            # Temporary errors (still failing after retrying) don't mean the
+            # batch failed, so they get their own status
+            print(f"\n   Error checking chunk {chunk_num}: {status}")
             chunk_statuses.append({
                 'chunk': chunk_num,
                 'batch_id': batch_id,
-                'status': status['status'],
-                'total': status['request_counts'].get('total', 0) if status['request_counts'] else 0,
-                'completed': status['request_counts'].get('completed', 0) if status['request_counts'] else 0,
-                'failed': status['request_counts'].get('failed', 0) if status['request_counts'] else 0
+                'status': 'transient_error' if isinstance(status, RETRYABLE_ERRORS) else 'error',
+                'total': 0,
+                'completed': 0,
+                'failed': 0
             })
-        except Exception as e:
-            print(f"\n   Error checking chunk {chunk_num}: {e}")
+        else:
             chunk_statuses.append({
                 'chunk': chunk_num,
                 'batch_id': batch_id,
-                'status': 'error',
-                'total': 0,
-                'completed': 0,
-                'failed': 0
+                'status': status['status'],
+                'total': status['request_counts'].get('total', 0) if status['request_counts'] else 0,
+                'completed': status['request_counts'].get('completed', 0) if status['request_counts'] else 0,
+                'failed': status['request_counts'].get('failed', 0) if status['request_counts'] else 0
             })
 
     # Display table
     print(f"\n{'Chunk':<8} {'Status':<15} {'Progress':<15} {'Batch ID':<40}")
     print("-" * 70)
 
-    status_counts = {'completed': 0, 'in_progress': 0, 'failed': 0, 'other': 0}
+    status_counts = {'completed': 0, 'in_progress': 0, 'failed': 0, 'unreachable': 0, 'other': 0}
 
     for cs in chunk_statuses:
         progress = f"{cs['completed']}/{cs['total']}" if cs['total'] > 0 else "N/A"
@@ -96,6 +121,8 @@ def check_all_chunks_status():
             status_counts['in_progress'] += 1
         elif cs['status'] == 'failed':
             status_counts['failed'] += 1
+        elif cs['status'] == 'transient_error':
+            status_counts['unreachable'] += 1
         else:
             status_counts['other'] += 1
 
@@ -109,6 +136,8 @@ def check_all_chunks_status():
     print(f"   Completed: {status_counts['completed']}")
     print(f"   In progress: {status_counts['in_progress']}")
     print(f"   Failed: {status_counts['failed']}")
+    if status_counts['unreachable'] > 0:
+        print(f"   Couldn't check: {status_counts['unreachable']}")
 
     if status_counts['completed'] == total_chunks:
         print(f"\n   ALL CHUNKS COMPLETED!")
@@ -116,26 +145,34 @@ def check_all_chunks_status():
         print(f"   python phase2_download_results.py")
     elif status_counts['in_progress'] > 0:
         print(f"\n   Some chunks still processing. Check back later.")
+    elif status_counts['unreachable'] > 0:
+        print(f"\n   Some chunks couldn't be checked (temporary API errors). Try again later.")
     elif status_counts['failed'] > 0:
         print(f"\n   Some chunks failed. Check error details.")
 
     print("\n" + "=" * 70)
 
 
-def check_single_chunk_status(chunk_num):
-    """Check status of a specific chunk."""
-    chunk_file = Config.RESULTS_DIR / f"phase2_chunk{chunk_num:02d}_info.json"
+def check_single_chunk_status(chunk_num, refresh=False, chunks=None):
+    """
+    Check status of a specific chunk.
+
+    A finished batch is not asked about again unless refresh is True.
+    Pass chunks (from detect_chunk_files) if they are already loaded.
+    """
+    if chunks is None:
+        chunks = detect_chunk_files()
+    chunk_info = (chunks or {}).get(chunk_num)
 
-    if not chunk_file.exists():
-        print(f"\n   Error: Chunk {chunk_num} info file not found")
-        print(f"   Expected: {chunk_file}")
+    if chunk_info is None:
+        print(f"\n   Error: Chunk {chunk_num} info not found")
+        print(f"   Expected in: {Config.CHUNK_MANIFEST_FILE}")
         return
 
     print("=" * 70)
     print(f"CHUNK {chunk_num} STATUS".center(70))
     print("=" * 70)
 
-    chunk_info = load_json(chunk_file)
     batch_id = chunk_info['batch_id']
 
     print(f"\n   Batch ID: {batch_id}")
@@ -143,7 +180,9 @@ def check_single_chunk_status(chunk_num):
     print(f"   Speeches: {chunk_info['num_requests']}")
 
     processor = BatchProcessor()
-    status = processor.check_batch_status(batch_id)
+    if refresh:
+        processor.forget_statuses()
+    status = retry_api_call(processor.check_batch_status, batch_id)
 
     print(f"\n   Status: {status['status']}")
 
@@ -180,32 +219,52 @@ def main():
         type=int,
         help='Check status of specific chunk'
     )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ask OpenAI again about batches already known to be finished'
+    )
+    parser.add_argument(
+        '--force-download',
+        action='store_true',
+        help='Download the results again even if they already exist'
+    )
+    parser.add_argument(
+        '--force-parse',
+        action='store_true',
+        help='Parse the results again even if the parsed CSV is up to date'
+    )
+    parser.add_argument(
+        '--no-interactive',
+        action='store_true',
+        help="Never ask questions; keep existing files unless --force-* is given"
+    )
 
     args = parser.parse_args()
 
-    # Detect if chunks exist
-    chunk_files = detect_chunk_files()
+    # Detect if chunks exist (loaded once, and passed on below)
+    chunks = detect_chunk_files()
 
     # Determine mode
     if args.all_chunks:
-        check_all_chunks_status()
+        check_all_chunks_status(args.refresh, chunks)
         return
 
     elif args.chunk:
-        check_single_chunk_status(args.chunk)
+        check_single_chunk_status(args.chunk, args.refresh, chunks)
         return
 
     # Auto-detect mode
-    if chunk_files:
+    if chunks:
         # Chunks exist, use chunk mode
         print("=" * 70)
         print("CHUNK FILES DETECTED".center(70))
         print("=" * 70)
 
-        print(f"\n   Found {len(chunk_files)} chunk info files")
+        print(f"\n   Found {len(chunks)} submitted chunks")
         print(f"\n   Checking all chunks...")
         print()
-        check_all_chunks_status()
+        check_all_chunks_status(args.refresh, chunks)
         return
 
     # No chunks, use original workflow
@@ -240,7 +299,9 @@ def main():
     print_section_header("STEP 2: CHECK CURRENT STATUS")
 
     processor = BatchProcessor()
-    status = processor.check_batch_status(batch_id)
+    if args.refresh:
+        processor.forget_statuses()
+    status = retry_api_call(processor.check_batch_status, batch_id)
 
     print(f"\n📊 Batch Status: {status['status']}")
 
@@ -267,13 +328,14 @@ def main():
         # Check if already downloaded
         if results_file.exists():
             print(f"ℹ️  Results file already exists: {results_file}")
-            response = input("   Download again? (y/N): ")
-            if response.lower() != 'y':
+            if not confirm("   Download again? (y/N): ",
+                           force=args.force_download,
+                           interactive=not args.no_interactive):
                 print("   Skipping download, using existing file")
             else:
-                processor.download_results(batch_id, results_file)
+                retry_api_call(processor.download_results, batch_id, results_file)
         else:
-            processor.download_results(batch_id, results_file)
+            retry_api_call(processor.download_results, batch_id, results_file)
 
         # ============================================================
         # STEP 4: Parse Results
@@ -282,16 +344,15 @@ def main():
 
         parsed_csv = Config.RESULTS_DIR / "sentiment_results_2022_2023.csv"
 
-        # Check if already parsed
-        if parsed_csv.exists():
-            print(f"ℹ️  Parsed results already exist: {parsed_csv}")
-            response = input("   Parse again? (y/N): ")
-            if response.lower() != 'y':
-                print("   Skipping parse, loading existing file")
-                results_df = pd.read_csv(parsed_csv)
-            else:
-                results_df = processor.parse_results(results_file, parsed_csv)
+        # Reuse the parsed results if they were made from the current
+        # results file (results downloaded again are always parsed again)
+        if is_up_to_date(parsed_csv, results_file) and not args.force_parse:
+            print(f"ℹ️  Parsed results are up to date: {parsed_csv}")
+            print("   Skipping parse, loading existing file (--force-parse to redo)")
+            results_df = pd.read_csv(parsed_csv)
         else:
+            if parsed_csv.exists() and not args.force_parse:
+                print(f"ℹ️  Results file is newer than {parsed_csv.name}, parsing again")
             results_df = processor.parse_results(results_file, parsed_csv)
 
         # ============================================================
@@ -7,30 +7,200 @@ into a single dataset, and runs validation.
 For beginners:
 - Use this after all chunks are completed
 - No additional charges (just downloading results)
-- Merges all chunk CSVs into one master file
+- Merges all chunk results into one master CSV file
+- Chunks are downloaded together, and each is parsed in a separate
+  process as soon as it arrives
 
 Usage:
-    python phase2_download_results.py
+    python phase2_download_results.py                      # Download and merge
+    python phase2_download_results.py --keep-intermediates # Also save each chunk's CSV
+    python phase2_download_results.py --refresh            # Re-check finished batches too
 """
 
+import argparse
+import asyncio
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from openai import APIError
 from datetime import datetime
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config import Config
-from batch_processor import BatchProcessor
+from batch_processor import (
+    RESULT_COLUMNS, RETRYABLE_ERRORS, BatchProcessor, retry_api_call, split_jsonl
+)
 from output_validator import OutputValidator
-from utils import print_section_header, save_json, load_json
+from utils import is_up_to_date, load_chunk_manifest, load_json, print_section_header, save_json
+
+
+# Column types of the parsed results. The market impact labels (rise, fall,
+# neutral) are stored as categories, so each label is kept once rather than
+# once per speech; the other text columns stay plain text, the scores numbers
+LABEL_COLUMNS = ["market_impact_stocks", "market_impact_bonds", "market_impact_currency"]
+TEXT_COLUMNS = ["speech_id", "market_impact_reasoning", "summary", "key_sentences"]
+RESULT_SCHEMA = pa.schema([
+    (name, pa.dictionary(pa.int32(), pa.string())) if name in LABEL_COLUMNS
+    else (name, pa.string()) if name in TEXT_COLUMNS
+    else (name, pa.float64())
+    for name in RESULT_COLUMNS
+])
+
+
+def _read_chunk_csv(parsed_csv):
+    """
+    Read a chunk's saved CSV with the result column types (see RESULT_SCHEMA).
+
+    Empty text counts as missing, like pandas' read_csv. If a column doesn't
+    fit its type (e.g. text in a score column), the types are worked out
+    from the file instead.
+    """
+    try:
+        return pa_csv.read_csv(parsed_csv, convert_options=pa_csv.ConvertOptions(
+            column_types=RESULT_SCHEMA, strings_can_be_null=True
+        ))
+    except pa.ArrowInvalid:
+        return pa_csv.read_csv(parsed_csv, convert_options=pa_csv.ConvertOptions(
+            strings_can_be_null=True
+        ))
+
+
+def _parse_and_validate(results_file, output_csv, start, end):
+    """
+    Parse (part of) a results file and validate it, in a worker process.
+
+    Returns:
+        (DataFrame from BatchProcessor.parse_results, its validation results)
+    """
+    df = BatchProcessor.parse_results(results_file, output_csv, start, end)
+    return df, OutputValidator().validate_batch_results(df)
+
+
+def _concat_sorted(tables):
+    """
+    Join pyarrow tables into one, sorted by speech_id.
+
+    Chunks cover separate ranges of speeches, so each one is sorted on its
+    own and the chunks are put in order of their first speech_id - no need
+    to sort the whole merged table. If the ranges overlap (or a speech_id is
+    missing), the merged table is sorted after all.
+    """
+    tables = [table.sort_by("speech_id") for table in tables]
+    ranges = []
+    for table in tables:
+        ids = table.column("speech_id")
+        if ids.null_count:
+            break
+        bounds = pc.min_max(ids)
+        ranges.append((bounds["min"].as_py(), bounds["max"].as_py(), table))
+    else:
+        ranges = [r for r in ranges if r[0] is not None]  # Skip empty chunks
+        try:
+            ranges.sort(key=lambda r: r[0])
+            if all(prev[1] < cur[0] for prev, cur in zip(ranges, ranges[1:])):
+                return pa.concat_tables([table for _, _, table in ranges] or tables)
+        except TypeError:
+            pass  # speech_ids of different types can't be compared
+    return pa.concat_tables(tables).sort_by("speech_id")
+
+
+def _merge_chunks(parsed_chunks):
+    """
+    Combine the parsed chunks into one DataFrame, sorted by speech_id.
+
+    Args:
+        parsed_chunks: One table per chunk, either a pandas DataFrame (just
+                       parsed) or a pyarrow Table (read from its saved CSV)
+
+    Returns:
+        The merged DataFrame
+    """
+    # Combine and sort in pyarrow (joining tables doesn't copy the data,
+    # see _concat_sorted), then turn the result into a pandas DataFrame.
+    # Every chunk is given the same column types first, so the labels come
+    # out as categories
+    try:
+        tables = [
+            (chunk if isinstance(chunk, pa.Table)
+             else pa.Table.from_pandas(chunk, preserve_index=False)).cast(RESULT_SCHEMA)
+            for chunk in parsed_chunks
+        ]
+        return _concat_sorted(tables).to_pandas()
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, ValueError):
+        # Some column mixes types (e.g. text in a number column), which
+        # only pandas can hold together
+        merged_df = pd.concat(
+            [
+                chunk.to_pandas() if isinstance(chunk, pa.Table) else chunk
+                for chunk in parsed_chunks
+            ],
+            ignore_index=True,
+        )
+        merged_df.sort_values('speech_id', inplace=True, ignore_index=True)
+        return merged_df
+
+
+def _already_merged(chunks, merged_csv, validation_file):
+    """
+    Check whether an earlier run already merged and validated every chunk.
+
+    Args:
+        chunks: The chunk manifest
+        merged_csv: Merged results file
+        validation_file: Validation report of the merge
+
+    Returns:
+        The saved validation report if nothing changed since, otherwise None
+    """
+    results_files = [
+        Config.BATCH_OUTPUT_DIR / f"chunk{chunk_info['chunk_number']:02d}_results.jsonl"
+        for chunk_info in chunks.values()
+    ]
+    if not is_up_to_date(validation_file, merged_csv):
+        return None
+    if not all(is_up_to_date(merged_csv, results_file) for results_file in results_files):
+        return None
+
+    # The merge must have included every chunk (not e.g. only the ones
+    # finished at the time)
+    report = load_json(validation_file)
+    if report.get('chunks_merged') != len(chunks) or report.get('total_chunks') != len(chunks):
+        return None
+    return report
 
 
 def main():
     """
     Download and merge all chunk results.
     """
+    # Parse arguments
+    parser = argparse.ArgumentParser(
+        description="Download, merge and validate chunk results"
+    )
+    parser.add_argument(
+        "--keep-intermediates",
+        action="store_true",
+        help="Also save each chunk's parsed results as chunkNN_parsed.csv",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ask OpenAI again about batches already known to be finished",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Download, merge and validate again even if already up to date",
+    )
+    args = parser.parse_args()
 
     print("=" * 70)
     print("PHASE 2: DOWNLOAD & MERGE CHUNK RESULTS".center(70))
@@ -40,54 +210,85 @@ def main():
     # ============================================================
     # STEP 1: Find All Chunk Info Files
     # ============================================================
-    print_section_header("STEP 1: FIND CHUNK INFO FILES")
+    print_section_header("STEP 1: FIND SUBMITTED CHUNKS")
 
-    chunk_files = sorted(Config.RESULTS_DIR.glob("phase2_chunk*_info.json"))
+    chunks = load_chunk_manifest(Config.CHUNK_MANIFEST_FILE)
 
-    if not chunk_files:
-        print("\n   Error: No chunk info files found")
+    if not chunks:
+        print("\n   Error: No submitted chunks found")
         print(f"   Have you run: python phase2_batch_submit.py --all-chunks")
         return
 
-    print(f"\n   Found {len(chunk_files)} chunk info files")
+    print(f"\n   Found {len(chunks)} submitted chunks")
+
+    merged_csv = Config.RESULTS_DIR / "sentiment_results_2022_2023.csv"
+    validation_file = Config.RESULTS_DIR / "phase2_validation_report.json"
+
+    # Nothing to do if every chunk was already merged and validated, and no
+    # results file changed since (use --force to redo it anyway)
+    report = None if args.force else _already_merged(chunks, merged_csv, validation_file)
+    if report:
+        validation_results = report['validation_results']
+        print(f"\n   Already up to date: all {len(chunks)} chunks merged into {merged_csv.name}")
+        print(f"   Validated at: {report['validated_at']}")
+        print(f"   Total speeches: {validation_results['total_speeches']}")
+        print(f"   Validation rate: {validation_results['validation_rate']:.1f}%")
+        print(f"\n   Use --force to download, merge and validate again")
+        print("\n" + "=" * 70)
+        return
 
     # ============================================================
     # STEP 2: Check Which Chunks Are Completed
     # ============================================================
     print_section_header("STEP 2: CHECK CHUNK STATUS")
 
+    # Batches already known to be finished are not asked about again
+    # (unless --refresh is given)
     processor = BatchProcessor()
+    if args.refresh:
+        processor.forget_statuses()
     completed_chunks = []
     in_progress_chunks = []
     failed_chunks = []
+    unreachable_chunks = []  # Couldn't be checked because of temporary API errors
 
-    for chunk_file in chunk_files:
-        chunk_info = load_json(chunk_file)
-        chunk_num = chunk_info['chunk_number']
-        batch_id = chunk_info['batch_id']
+    # Check all chunks at once: each check mostly waits on the network,
+    # so the waits overlap on one event loop
+    statuses = asyncio.run(processor.check_batch_statuses_async(
+        chunk_info['batch_id'] for chunk_info in chunks.values()
+    ))
 
-        try:
-            status = processor.check_batch_status(batch_id)
-
-            if status['status'] == 'completed':
-                completed_chunks.append((chunk_num, chunk_info, status))
-                print(f"   Chunk {chunk_num:2d}: completed")
-            elif status['status'] in ['in_progress', 'validating']:
-                in_progress_chunks.append(chunk_num)
-                print(f"   Chunk {chunk_num:2d}: {status['status']}")
-            else:
-                failed_chunks.append(chunk_num)
-                print(f"   Chunk {chunk_num:2d}: {status['status']}")
-
-        except Exception as e:
-            print(f"   Chunk {chunk_num:2d}: error - {e}")
+    for chunk_info in chunks.values():
+        chunk_num = chunk_info['chunk_number']
+        status = statuses[chunk_info['batch_id']]
+
+        if isinstance(status, RETRYABLE_ERRORS):
+            # Still failing after retrying, but the batch itself may be fine
+            unreachable_chunks.append(chunk_num)
+            print(f"   Chunk {chunk_num:2d}: couldn't check ({status}), try again later")
+        elif isinstance(status, APIError):
+            # e.g. OpenAI doesn't know the batch ID
+            failed_chunks.append(chunk_num)
+            print(f"   Chunk {chunk_num:2d}: error - {status}")
+        elif isinstance(status, Exception):
+            raise status
+        elif status['status'] == 'completed':
+            completed_chunks.append((chunk_num, chunk_info, status))
+            print(f"   Chunk {chunk_num:2d}: completed")
+        elif status['status'] in ['in_progress', 'validating']:
+            in_progress_chunks.append(chunk_num)
+            print(f"   Chunk {chunk_num:2d}: {status['status']}")
+        else:
             failed_chunks.append(chunk_num)
+            print(f"   Chunk {chunk_num:2d}: {status['status']}")
 
     # Summary
     print(f"\n   Summary:")
     print(f"      Completed: {len(completed_chunks)}")
     print(f"      In progress: {len(in_progress_chunks)}")
     print(f"      Failed: {len(failed_chunks)}")
+    if unreachable_chunks:
+        print(f"      Couldn't check: {len(unreachable_chunks)}")
 
     if not completed_chunks:
         print(f"\n   No completed chunks to download. Exiting.")
@@ -102,52 +303,121 @@ def main():
     # ============================================================
     print_section_header("STEP 3: DOWNLOAD RESULTS")
 
+    # Parsing a chunk uses the CPU while downloading mostly waits on the
+    # network, so with several CPU cores each chunk is parsed (and
+    # validated) in another process as soon as it has downloaded. Big files
+    # are split into parts that are parsed side by side. (No processes are
+    # started unless a parse is actually sent to them.)
+    workers = Config.BATCH_WORKERS or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers)
+    parsing = {}  # chunk_num -> parses (one per part) running in the background
+
+    # Each chunk's parsed CSV is only saved with --keep-intermediates
+    # (existing ones from earlier runs are still reused)
+    def chunk_csv(chunk_num):
+        return Config.RESULTS_DIR / f"chunk{chunk_num:02d}_parsed.csv"
+
+    def parse_in_background(chunk_num, results_file):
+        if workers > 1 and not is_up_to_date(chunk_csv(chunk_num), results_file):
+            parts = split_jsonl(results_file, Config.PARSE_PART_BYTES)
+            # A file parsed in one go saves its own CSV; split files are
+            # saved once their parts are put back together (STEP 4)
+            if args.keep_intermediates and len(parts) == 1:
+                output_csv = chunk_csv(chunk_num)
+            else:
+                output_csv = None
+            parsing[chunk_num] = [
+                executor.submit(_parse_and_validate, results_file, output_csv, start, end)
+                for start, end in parts
+            ]
+
     downloaded_files = []
+    downloads = {}  # download running in a thread -> (chunk_num, results_file)
 
-    for chunk_num, chunk_info, status in completed_chunks:
-        batch_id = chunk_info['batch_id']
+    # Downloads mostly wait on the network, so several run at once in threads
+    with ThreadPoolExecutor(
+        max_workers=min(Config.DOWNLOAD_WORKERS, len(completed_chunks))
+    ) as downloader:
+        for chunk_num, chunk_info, status in completed_chunks:
+            batch_id = chunk_info['batch_id']
 
-        # Define output file
-        results_file = Config.BATCH_OUTPUT_DIR / f"chunk{chunk_num:02d}_results.jsonl"
+            # Define output file
+            results_file = Config.BATCH_OUTPUT_DIR / f"chunk{chunk_num:02d}_results.jsonl"
 
-        # Check if already downloaded
-        if results_file.exists():
-            print(f"\n   Chunk {chunk_num:2d}: Already downloaded ({results_file.name})")
-            downloaded_files.append((chunk_num, results_file))
-        else:
-            try:
-                print(f"\n   Chunk {chunk_num:2d}: Downloading...")
-                processor.download_results(batch_id, results_file)
+            # Check if already downloaded
+            if results_file.exists():
+                print(f"\n   Chunk {chunk_num:2d}: Already downloaded ({results_file.name})")
                 downloaded_files.append((chunk_num, results_file))
-                print(f"               Saved to {results_file.name}")
+                parse_in_background(chunk_num, results_file)
+            else:
+                print(f"\n   Chunk {chunk_num:2d}: Downloading...")
+                future = downloader.submit(
+                    retry_api_call, processor.download_results, batch_id, results_file
+                )
+                downloads[future] = (chunk_num, results_file)
+
+        # Handle each download as soon as it finishes
+        for future in as_completed(downloads):
+            chunk_num, results_file = downloads[future]
+            try:
+                future.result()
             except Exception as e:
-                print(f"               Error: {e}")
+                print(f"\n   Chunk {chunk_num:2d}: Error: {e}")
+                continue
+            print(f"\n   Chunk {chunk_num:2d}: Saved to {results_file.name}")
+            downloaded_files.append((chunk_num, results_file))
+            parse_in_background(chunk_num, results_file)
+
+    downloaded_files.sort()
 
     # ============================================================
     # STEP 4: Parse Each Chunk to CSV
     # ============================================================
     print_section_header("STEP 4: PARSE CHUNK RESULTS")
 
-    parsed_dfs = []
+    # Existing chunk CSVs are read with pyarrow's fast CSV reader, with the
+    # column types given up front (see _read_chunk_csv)
+    parsed_chunks = []
+    validations = []  # Validation results from the background parses
+    all_validated = True  # Whether every chunk was validated in the background
 
     for chunk_num, results_file in downloaded_files:
-        parsed_csv = Config.RESULTS_DIR / f"chunk{chunk_num:02d}_parsed.csv"
+        parsed_csv = chunk_csv(chunk_num)
 
-        # Check if already parsed
-        if parsed_csv.exists():
+        # Check if already parsed from this results file (and not just
+        # parsed in the background)
+        if is_up_to_date(parsed_csv, results_file) and chunk_num not in parsing:
             print(f"\n   Chunk {chunk_num:2d}: Loading existing CSV ({parsed_csv.name})")
-            df = pd.read_csv(parsed_csv)
-            parsed_dfs.append(df)
+            parsed_chunks.append(_read_chunk_csv(parsed_csv))
+            all_validated = False
         else:
             try:
                 print(f"\n   Chunk {chunk_num:2d}: Parsing...")
-                df = processor.parse_results(results_file, parsed_csv)
-                parsed_dfs.append(df)
+                if chunk_num in parsing:
+                    results = [part.result() for part in parsing[chunk_num]]
+                    parts = [df for df, _ in results]
+                    validations.extend(validation for _, validation in results)
+                    if len(parts) == 1:
+                        df = parts[0]
+                    else:
+                        # Re-check column types, as one part may only have
+                        # seen e.g. missing values in a column
+                        df = pd.concat(parts, ignore_index=True).infer_objects()
+                        if args.keep_intermediates:
+                            df.to_csv(parsed_csv, index=False)
+                else:
+                    df = processor.parse_results(
+                        results_file, parsed_csv if args.keep_intermediates else None
+                    )
+                    all_validated = False
+                parsed_chunks.append(df)
                 print(f"               Parsed {len(df)} speeches")
             except Exception as e:
                 print(f"               Error: {e}")
 
-    if not parsed_dfs:
+    executor.shutdown()
+
+    if not parsed_chunks:
         print(f"\n   Error: No chunk results could be parsed")
         return
 
@@ -156,20 +426,44 @@ def main():
     # ============================================================
     print_section_header("STEP 5: MERGE ALL CHUNKS")
 
-    # Combine all DataFrames
-    merged_df = pd.concat(parsed_dfs, ignore_index=True)
+    # Combine all chunks, sorted by speech_id
+    merged_df = _merge_chunks(parsed_chunks)
 
-    # Sort by speech_id
-    merged_df = merged_df.sort_values('speech_id').reset_index(drop=True)
+    # Let go of the per-chunk tables so only the merged one stays in memory
+    chunks_merged = len(parsed_chunks)
+    parsed_chunks.clear()
 
     print(f"\n   Total speeches merged: {len(merged_df)}")
-    print(f"   From {len(parsed_dfs)} chunks")
+    print(f"   From {chunks_merged} chunks")
 
-    # Save merged results
-    merged_csv = Config.RESULTS_DIR / "sentiment_results_2022_2023.csv"
-    merged_df.to_csv(merged_csv, index=False)
+    # Save merged results. pyarrow writes CSV much faster than pandas, and
+    # a Parquet copy is saved too (Phase 3 loads it much faster)
+    merged_parquet = merged_csv.with_suffix(".parquet")
+    try:
+        merged_table = pa.Table.from_pandas(merged_df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Some column mixes types (see _merge_chunks), so only pandas can
+        # write it; remove any older Parquet copy so it isn't used instead
+        merged_df.to_csv(merged_csv, index=False)
+        merged_parquet.unlink(missing_ok=True)
+    else:
+        pa_csv.write_csv(
+            merged_table,
+            merged_csv,
+            write_options=pa_csv.WriteOptions(quoting_style="needed"),
+        )
+        # Columns with no values at all are stored as numbers, the way
+        # reading them back from the CSV would give them
+        merged_table = merged_table.cast(pa.schema([
+            pa.field(field.name, pa.float64()) if pa.types.is_null(field.type) else field
+            for field in merged_table.schema
+        ]))
+        pq.write_table(merged_table, merged_parquet, compression="zstd")
+        del merged_table
 
     print(f"\n   Saved merged results to: {merged_csv.name}")
+    if merged_parquet.exists():
+        print(f"   Parquet copy: {merged_parquet.name}")
 
     # ============================================================
     # STEP 6: Validate Merged Results
@@ -178,8 +472,12 @@ def main():
 
     validator = OutputValidator()
 
-    # Run validation
-    validation_results = validator.validate_batch_results(merged_df)
+    # Chunks parsed in the background were validated there too (while the
+    # other chunks downloaded), so then their results only need adding up
+    if all_validated:
+        validation_results = OutputValidator.combine_batch_results(validations)
+    else:
+        validation_results = validator.validate_batch_results(merged_df)
     validator.print_validation_report(validation_results)
 
     # Check distributions
@@ -187,15 +485,15 @@ def main():
     validator.print_distribution_report(distributions)
 
     # Save validation report
-    validation_file = Config.RESULTS_DIR / "phase2_validation_report.json"
     validation_report = {
         'validation_results': validation_results,
         'distributions': distributions,
         'validated_at': datetime.now().isoformat(),
-        'chunks_merged': len(parsed_dfs),
-        'total_chunks': len(chunk_files),
+        'chunks_merged': chunks_merged,
+        'total_chunks': len(chunks),
         'in_progress_chunks': len(in_progress_chunks),
-        'failed_chunks': len(failed_chunks)
+        'failed_chunks': len(failed_chunks),
+        'unreachable_chunks': len(unreachable_chunks)
     }
     save_json(validation_report, validation_file)
 
@@ -227,6 +525,9 @@ def main():
     if in_progress_chunks:
         print(f"\n   Note: {len(in_progress_chunks)} chunks still processing")
         print(f"   You can run this script again later to include them")
+    if unreachable_chunks:
+        print(f"\n   Note: {len(unreachable_chunks)} chunks couldn't be checked (temporary API errors)")
+        print(f"   Run this script again later to include them")
 
     print(f"\n   Next Steps:")
     print(f"      1. Review the validation report")
@@ -0,0 +1,96 @@
+"""
+Phase 3: Build All Daily Time Series Indices
+Central Bank Communication Sentiment Analysis
+
+Builds both kinds of daily indices for Fed and ECB from one load of the
+prepared data:
+- Forward-filled (as phase3_build_indices.py): every day, gaps carry the
+  last value forward
+- No forward fill (as phase3_build_indices_no_fill.py): only dates with
+  actual speeches
+
+For beginners:
+- Running the two scripts one after the other loads (or prepares) the same
+  data twice; this script does it once and reuses it for both
+- The output files are the same as the two scripts make
+
+Usage: python phase3_build_all.py [--no-cache] [--save-prepared]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src directory to Python path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import phase3_indices_core
+
+
+def main():
+    """Main execution function"""
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(
+        description="Build daily Fed and ECB indices, forward-filled and without forward fill"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Prepare the data from the sentiment results instead of loading phase3_prepared_data",
+    )
+    parser.add_argument(
+        "--save-prepared",
+        action="store_true",
+        help="Also save the data prepared here (as phase3_data_prep.py does)",
+    )
+    args = parser.parse_args()
+
+    print("\n" + "=" * 70)
+    print("PHASE 3: BUILD ALL DAILY TIME SERIES INDICES".center(70))
+    print("Central Bank Communication Sentiment Analysis".center(70))
+    print("=" * 70)
+
+    # Load the prepared data once
+    df = phase3_indices_core.load_data(no_cache=args.no_cache, save_prepared=args.save_prepared)
+    if df is None:
+        return
+
+    # Build each kind of index from the same data
+    output_files = {}
+    for fill, title in ((True, "FORWARD-FILLED INDICES"), (False, "NO FORWARD FILL INDICES")):
+        print("\n" + "#" * 70)
+        print(title.center(70))
+        print("#" * 70)
+
+        output_files[fill] = phase3_indices_core.run(df, fill=fill)
+
+    # ============================================================
+    # FINAL SUMMARY
+    # ============================================================
+    print("\n" + "=" * 70)
+    print("DAILY INDICES BUILD COMPLETE".center(70))
+    print("=" * 70)
+
+    print(f"\nOutput files created:")
+    for files in output_files.values():
+        for output_file in files.values():
+            print(f"   - {output_file}")
+
+    print(f"\nIndex features:")
+    print(f"   - Multiple speeches: Averaged within same day")
+    print(f"   - Market impact: Diffusion index (0-100, 50=neutral)")
+    print(f"   - *_daily_indices: All days, gaps forward-filled (for analysis)")
+    print(f"   - *_daily_indices_no_fill: Only dates with speeches (for visualization)")
+
+    print(f"\nNext steps:")
+    print(f"   1. Load indices for analysis:")
+    print(f"      fed = pd.read_parquet('data/results/fed_daily_indices.parquet')")
+    print(f"      ecb = pd.read_parquet('data/results/ecb_daily_indices.parquet')")
+    print(f"   2. Create visualizations (phase3_visualize_indices.py)")
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
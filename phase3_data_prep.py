@@ -10,30 +10,38 @@ For beginners:
 - Creates a ready-to-analyze dataset
 
 Usage: python phase3_data_prep.py
+
+The index build scripts can also call prepare_data() directly, to get the
+prepared dataset without saving and re-reading it.
 """
 
 import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from datetime import datetime
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config import Config
-from utils import print_section_header
+from utils import print_section_header, load_json, save_table
 
 
-def main():
-    """
-    Prepare and merge sentiment data with speech metadata.
+def prepare_data():
     """
+    Load and merge sentiment data with speech metadata (STEPs 1-6).
 
-    print("=" * 70)
-    print("PHASE 3: DATA PREPARATION".center(70))
-    print("Central Bank Communication Sentiment Analysis".center(70))
-    print("=" * 70)
+    Returns:
+        The prepared DataFrame (one row per speech, sorted by date), or None
+        if the sentiment results or speech metadata are missing
+
+    For beginners:
+    - This does all the work but doesn't save anything, so other scripts
+      (e.g. phase3_build_indices.py) can use the data straight away
+    """
 
     # ============================================================
     # STEP 1: Load Sentiment Results
@@ -42,19 +50,48 @@ def main():
 
     sentiment_file = Config.RESULTS_DIR / "sentiment_results_2022_2023.csv"
 
+    # Use the Parquet copy saved by phase2_download_results (much faster to
+    # load), unless the CSV was re-made after it (e.g. by phase2_check_status)
+    parquet_file = sentiment_file.with_suffix(".parquet")
+    if parquet_file.exists() and (
+        not sentiment_file.exists()
+        or parquet_file.stat().st_mtime >= sentiment_file.stat().st_mtime
+    ):
+        sentiment_file = parquet_file
+
     if not sentiment_file.exists():
         print(f"\nERROR Error: Sentiment results not found!")
         print(f"   Expected: {sentiment_file}")
         print(f"\n   Run: python phase2_download_results.py")
-        return
+        return None
 
-    sentiment_df = pd.read_csv(sentiment_file)
+    if sentiment_file.suffix == ".parquet":
+        sentiment_df = pd.read_parquet(sentiment_file)
+    else:
+        sentiment_df = pd.read_csv(sentiment_file)
 
     print(f"\nOK Loaded sentiment results")
     print(f"   File: {sentiment_file.name}")
     print(f"   Speeches: {len(sentiment_df)}")
     print(f"   Columns: {len(sentiment_df.columns)}")
 
+    # Speeches with identical text were only sent to the API once
+    # (see BatchRequestBuilder.write_chunk) - copy their scores back
+    duplicates_file = Config.BATCH_INPUT_DIR / (
+        f"batch_sample_{Config.SAMPLE_START_YEAR}_{Config.SAMPLE_END_YEAR}_duplicates.json"
+    )
+    if duplicates_file.exists():
+        # (speeches that already have their own results are left alone, in
+        # case the list is older than the results)
+        duplicates = load_json(duplicates_file)
+        scored = set(sentiment_df['speech_id'])
+        duplicates = {dup: orig for dup, orig in duplicates.items() if dup not in scored}
+        copies = sentiment_df.set_index('speech_id').reindex(list(duplicates.values()))
+        copies.index = list(duplicates.keys())
+        copies = copies.dropna(how='all').rename_axis('speech_id').reset_index()
+        sentiment_df = pd.concat([sentiment_df, copies], ignore_index=True)
+        print(f"   Restored scores for {len(copies)} duplicate speeches")
+
     # ============================================================
     # STEP 2: Load Speech Metadata
     # ============================================================
@@ -69,12 +106,26 @@ def main():
         print(f"\nERROR Error: Speech metadata not found!")
         print(f"   Expected: {metadata_file}")
         print(f"\n   Run: python phase1_data_prep.py")
-        return
+        return None
 
+    # Only the metadata columns are needed - skip the long speech text
+    # columns (text, mistral_ocr, clean_text), which make up most of the file
+    metadata_columns = ["date", "author", "country", "title"]
     if metadata_file.suffix == ".parquet":
-        metadata_df = pd.read_parquet(metadata_file)
+        metadata_df = pd.read_parquet(metadata_file, columns=metadata_columns)
     else:
-        metadata_df = pd.read_csv(metadata_file)
+        # PyArrow's multithreaded CSV reader skips the unused text columns
+        # without building Python strings for them. Speeches contain line
+        # breaks, so newlines_in_values must be switched on
+        metadata_df = pa_csv.read_csv(
+            metadata_file,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=metadata_columns,
+                column_types={col: pa.string() for col in metadata_columns},
+                strings_can_be_null=True,
+            ),
+        ).to_pandas()
 
     print(f"\nOK Loaded speech metadata")
     print(f"   File: {metadata_file.name}")
@@ -95,24 +146,26 @@ def main():
 
     # Extract row number from speech_id (e.g., "speech_88" -> 88)
     print(f"\n   Extracting row indices from speech_id...")
-    sentiment_df['row_index'] = sentiment_df['speech_id'].str.extract(r'speech_(\d+)').astype(int)
-
-    # Add row index to metadata
-    metadata_df = metadata_df.reset_index(drop=True)
-    metadata_df['row_index'] = metadata_df.index
-
-    # Merge on row_index to ensure correct alignment
-    print(f"   Merging on row_index to ensure correct alignment...")
-    merged_df = pd.merge(
-        metadata_df[["row_index", "date", "author", "country", "title"]],
-        sentiment_df,
-        on='row_index',
-        how='inner'
+    # (cutting off the fixed "speech_" prefix is much cheaper than matching
+    # a regular expression on every ID)
+    sentiment_df['row_index'] = pd.to_numeric(sentiment_df['speech_id'].str.removeprefix('speech_'))
+
+    # Look up each speech's metadata row by its number. The row number is
+    # the row's position, so the rows can be picked directly instead of
+    # matching them up with a merge (join). Speeches are put in metadata
+    # order first (as a merge would), and numbers with no metadata row
+    # are left out
+    print(f"   Aligning on row_index to ensure correct alignment...")
+    sentiment_df = sentiment_df.sort_values('row_index', kind='stable')
+    sentiment_df = sentiment_df[sentiment_df['row_index'].between(0, len(metadata_df) - 1)]
+    merged_df = pd.concat(
+        [
+            metadata_df[metadata_columns].iloc[sentiment_df['row_index']].reset_index(drop=True),
+            sentiment_df.drop(columns=['row_index']).reset_index(drop=True),
+        ],
+        axis=1,
     )
 
-    # Drop the temporary row_index column
-    merged_df = merged_df.drop(columns=['row_index'])
-
     print(f"\nOK Merged datasets")
     print(f"   Final rows: {len(merged_df)}")
     print(f"   Final columns: {len(merged_df.columns)}")
@@ -133,7 +186,9 @@ def main():
         merged_df = merged_df.dropna(subset=["date"])
 
     # Sort chronologically
-    merged_df = merged_df.sort_values("date").reset_index(drop=True)
+    # (a stable sort keeps speeches on the same day in metadata order, and
+    # is quick on data that is already mostly in date order)
+    merged_df = merged_df.sort_values("date", kind="stable", ignore_index=True)
 
     print(f"\nOK Dates parsed and sorted")
     print(
@@ -185,10 +240,13 @@ def main():
         print(f"      {institution}: {count}")
 
     # Time coverage
-    speeches_by_month = merged_df.groupby(merged_df["date"].dt.to_period("M")).size()
+    # (counting plain NumPy months, e.g. 2022-01, is much cheaper than
+    # grouping by pandas Period objects)
+    months, counts = np.unique(
+        merged_df["date"].to_numpy().astype("datetime64[M]"), return_counts=True
+    )
     print(f"\n   Speeches by month:")
-    for period, count in speeches_by_month.items():
-        print(f"      {period}: {count}")
+    print("\n".join(f"      {month}: {count}" for month, count in zip(months, counts)))
 
     # Score distributions
     print(f"\n   Score statistics:")
@@ -206,22 +264,43 @@ def main():
         f"std={merged_df['forward_guidance_strength'].std():.1f}"
     )
 
+    return merged_df
+
+
+def main():
+    """
+    Prepare and merge sentiment data with speech metadata.
+    """
+
+    print("=" * 70)
+    print("PHASE 3: DATA PREPARATION".center(70))
+    print("Central Bank Communication Sentiment Analysis".center(70))
+    print("=" * 70)
+
+    merged_df = prepare_data()
+    if merged_df is None:
+        return
+
     # ============================================================
     # STEP 7: Save Prepared Dataset
     # ============================================================
     print_section_header("STEP 7: SAVE PREPARED DATASET")
 
+    # Saved as CSV plus a Parquet copy, which Phase 3 scripts load much
+    # faster (see load_table)
     output_file = Config.RESULTS_DIR / "phase3_prepared_data.csv"
-    merged_df.to_csv(output_file, index=False)
+    save_table(merged_df, output_file, date_format="%Y-%m-%d")
 
     print(f"\nOK Saved prepared dataset")
     print(f"   File: {output_file}")
+    print(f"   Parquet copy: {output_file.with_suffix('.parquet').name}")
     print(f"   Rows: {len(merged_df)}")
     print(f"   Columns: {len(merged_df.columns)}")
     print(
         f"\n   NOTE: When loading this CSV, use parse_dates=['date'] to preserve datetime type:"
     )
     print(f"   df = pd.read_csv('{output_file.name}', parse_dates=['date'])")
+    print(f"   (or load the Parquet copy, which keeps it: pd.read_parquet(...))")
 
     # ============================================================
     # STEP 8: Show Sample Data
@@ -260,7 +339,7 @@ def main():
     print(f"\nNext steps:")
     print(f"   1. Explore the data in Jupyter:")
     print(
-        f"      df = pd.read_csv('data/results/phase3_prepared_data.csv', parse_dates=['date'])"
+        f"      df = pd.read_parquet('data/results/phase3_prepared_data.parquet')"
     )
     print(f"   2. Decide on aggregation strategy (daily/weekly/monthly)")
     print(f"   3. Choose which indices to build")
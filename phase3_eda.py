@@ -21,7 +21,7 @@ import numpy as np
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config import Config
-from utils import print_section_header
+from utils import load_table, print_section_header
 
 
 def main():
@@ -47,7 +47,7 @@ def main():
         print(f"\n   Run: python phase3_data_prep.py")
         return
 
-    df = pd.read_csv(data_file, parse_dates=['date'])
+    df = load_table(data_file, parse_dates=['date'])
 
     print(f"\nOK Loaded prepared dataset")
     print(f"   File: {data_file.name}")
@@ -5,12 +5,12 @@ Central Bank Communication Sentiment Analysis
 Creates area-filled time series charts for Fed and ECB separately.
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import seaborn.objects as so
 from pathlib import Path
 from src.config import Config
+from src.utils import load_table
 
 
 def format_title_with_scale(var_name):
@@ -192,8 +192,8 @@ def main():
     fed_file = Config.RESULTS_DIR / "fed_daily_indices.csv"
     ecb_file = Config.RESULTS_DIR / "ecb_daily_indices.csv"
 
-    fed_df = pd.read_csv(fed_file, parse_dates=['date'])
-    ecb_df = pd.read_csv(ecb_file, parse_dates=['date'])
+    fed_df = load_table(fed_file, parse_dates=['date'])
+    ecb_df = load_table(ecb_file, parse_dates=['date'])
 
     print(f"   Fed: {len(fed_df)} days ({fed_df['date'].min().date()} to {fed_df['date'].max().date()})")
     print(f"   ECB: {len(ecb_df)} days ({ecb_df['date'].min().date()} to {ecb_df['date'].max().date()})")
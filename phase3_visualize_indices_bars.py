@@ -7,12 +7,12 @@ Creates bar chart visualizations for Fed and ECB separately.
 - Standard bars for other metrics
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from pathlib import Path
 from src.config import Config
+from src.utils import load_table
 
 
 def create_bar_charts(df, institution_name, variables, output_filename, suptitle, reports_dir):
@@ -253,8 +253,8 @@ def main():
     fed_file = Config.RESULTS_DIR / "fed_daily_indices_no_fill.csv"
     ecb_file = Config.RESULTS_DIR / "ecb_daily_indices_no_fill.csv"
 
-    fed_df = pd.read_csv(fed_file, parse_dates=['date'])
-    ecb_df = pd.read_csv(ecb_file, parse_dates=['date'])
+    fed_df = load_table(fed_file, parse_dates=['date'])
+    ecb_df = load_table(ecb_file, parse_dates=['date'])
 
     print(f"   Fed: {len(fed_df)} dates with speeches ({fed_df['date'].min().date()} to {fed_df['date'].max().date()})")
     print(f"   ECB: {len(ecb_df)} dates with speeches ({ecb_df['date'].min().date()} to {ecb_df['date'].max().date()})")
@@ -15,6 +15,7 @@ import matplotlib.colors as mcolors
 import dayplot as dp
 from pathlib import Path
 from src.config import Config
+from src.utils import load_table
 
 
 def get_colormap_settings(var_name):
@@ -271,8 +272,8 @@ def main():
     fed_file = Config.RESULTS_DIR / "fed_daily_indices_no_fill.csv"
     ecb_file = Config.RESULTS_DIR / "ecb_daily_indices_no_fill.csv"
 
-    fed_df = pd.read_csv(fed_file, parse_dates=["date"])
-    ecb_df = pd.read_csv(ecb_file, parse_dates=["date"])
+    fed_df = load_table(fed_file, parse_dates=["date"])
+    ecb_df = load_table(ecb_file, parse_dates=["date"])
 
     print(f"   Fed: {len(fed_df)} dates with speeches")
     print(f"   ECB: {len(ecb_df)} dates with speeches")
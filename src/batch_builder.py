@@ -10,12 +10,14 @@ For beginners:
 - OpenAI processes all requests together (batch processing)
 """
 
-import json
+import os
+import orjson
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from config import Config
-from utils import estimate_tokens, print_section_header, print_progress_bar
+from utils import estimate_tokens, print_section_header, print_progress_bar, save_json
 
 
 class BatchRequestBuilder:
@@ -112,12 +114,116 @@ class BatchRequestBuilder:
         - Creates one request per speech
         - Saves them all to a JSONL file
         - Returns statistics about what was created
+        - For files too big for memory, use open_batch_file(),
+          write_chunk() and close_batch_file() instead
         """
 
         print_section_header("BUILDING BATCH REQUEST FILE")
 
         print(f"\n📝 Creating batch requests for {len(df)} speeches...")
 
+        self.open_batch_file(output_file)
+        try:
+            self.write_chunk(
+                df,
+                text_column=text_column,
+                id_column=id_column,
+                speaker_column=speaker_column,
+                institution_column=institution_column,
+                date_column=date_column,
+                total_rows=len(df)
+            )
+        except BaseException:
+            self.abort_batch_file()
+            raise
+
+        return self.close_batch_file()
+
+    def open_batch_file(self, output_file: Path):
+        """
+        Start a batch file that will be filled chunk by chunk.
+
+        Args:
+            output_file: Where to save the JSONL file
+
+        For beginners:
+        - Call this once, then write_chunk() for each piece of the data,
+          then close_batch_file() to get the statistics
+        - If something goes wrong part way, call abort_batch_file() instead
+        - Only one chunk of speeches needs to be in memory at a time
+        - Requests go to a temporary ".tmp" file that only replaces
+          output_file once it is complete, so an interrupted run never
+          leaves a half-written batch file that could be submitted
+        """
+        self._output_file = output_file
+        self._temp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+        # Binary mode with a 1 MB buffer: orjson already produces UTF-8 bytes
+        # (this also overwrites any .tmp file left behind by a crashed run)
+        self._file = open(self._temp_file, 'wb', buffering=1 << 20)
+
+        # Statistics tracking (summed across all chunks)
+        self._rows_seen = 0
+        self._num_requests = 0
+        self._validation_errors = 0
+        self._total_input_tokens = 0
+        self._total_output_tokens_estimate = 0
+
+        # Hash of (institution, speech text) -> custom_id of the first speech
+        # with that text, and duplicate custom_id -> the custom_id that was
+        # actually sent
+        self._seen_hashes = {}
+        self._duplicates = {}
+
+    def write_chunk(self, df: pd.DataFrame,
+                    text_column: str = 'text',
+                    id_column: str = 'id',
+                    speaker_column: str = 'speaker',
+                    institution_column: str = 'institution',
+                    date_column: str = 'date',
+                    total_rows: Optional[int] = None):
+        """
+        Write the requests for one chunk of speeches to the open batch file.
+
+        Args:
+            df: DataFrame containing this chunk of speeches
+            text_column: Name of column with speech text
+            id_column: Name of column with speech IDs
+            speaker_column: Name of column with speaker names
+            institution_column: Name of column with institution
+            date_column: Name of column with dates
+            total_rows: Total speeches across all chunks, if known (for the
+                progress bar)
+        """
+        encoded = self.encode_chunk(df, text_column, id_column, speaker_column,
+                                    institution_column, date_column)
+        self.write_encoded(encoded, total_rows=total_rows)
+
+    def encode_chunk(self, df: pd.DataFrame,
+                     text_column: str = 'text',
+                     id_column: str = 'id',
+                     speaker_column: str = 'speaker',
+                     institution_column: str = 'institution',
+                     date_column: str = 'date') -> List[tuple]:
+        """
+        Turn one chunk of speeches into ready-to-write JSONL lines.
+
+        This does the slow part (building prompts and JSON) without touching
+        the batch file, so several chunks can be encoded at the same time in
+        separate processes (see encode_chunk_in_worker() below).
+
+        Args:
+            df: DataFrame containing this chunk of speeches
+            text_column, id_column, speaker_column, institution_column,
+            date_column: Column names, as for write_chunk()
+
+        Returns:
+            One (speech_id, text_hash, line, prompt_tokens, original_tokens,
+            problem) tuple per speech; text_hash is None for empty speeches,
+            original_tokens is only set if the speech was truncated, problem
+            only if the request is invalid
+            (longest prompts first if Config.SORT_REQUESTS_BY_LENGTH is on)
+        """
+
         # Check that all required columns exist
         required_cols = [text_column, id_column, speaker_column,
                         institution_column, date_column]
@@ -125,15 +231,27 @@ class BatchRequestBuilder:
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
 
-        # Statistics tracking
-        total_input_tokens = 0
-        total_output_tokens_estimate = 0  # We estimate ~500 tokens output per speech
-        OUTPUT_TOKENS_ESTIMATE = 500
-
-        # Create requests
-        requests = []
-
-        for idx, row in df.iterrows():
+        # Hash every speech text at once so repeated speeches (e.g. reissued
+        # press releases) are only sent to the API once. The institution is
+        # part of the hash, so speeches from different institutions are
+        # never merged, and empty or missing texts get no hash (None) so
+        # they are never treated as copies of each other
+        text_hashes = pd.util.hash_pandas_object(
+            df[[institution_column, text_column]], index=False
+        ).to_numpy()
+        has_text = df[text_column].fillna('').astype(str).str.strip().ne('').to_numpy()
+
+        # Truncate very long speeches to avoid token limits
+        # Measuring and slicing the whole column at once means we never
+        # estimate tokens for text that won't be sent (the sliced text is
+        # only used for speeches that are over the limit)
+        text_lengths = df[text_column].str.len().fillna(0).astype(int).to_numpy()
+        short_texts = df[text_column].str.slice(0, Config.MAX_CHARS_ESTIMATE)
+
+        encoded = []
+        for text_hash, text_found, text_length, short_text, (idx, row) in zip(
+            text_hashes, has_text, text_lengths, short_texts, df.iterrows()
+        ):
             # Create unique ID for this speech
             speech_id = f"speech_{row[id_column]}"
 
@@ -143,16 +261,11 @@ class BatchRequestBuilder:
             institution = str(row[institution_column])
             date = str(row[date_column])
 
-            # Truncate very long speeches to avoid token limits
-            # GPT-4o has a 128K token context window, but we'll be conservative
-            MAX_SPEECH_TOKENS = 8000
-            estimated_tokens = estimate_tokens(speech_text)
-
-            if estimated_tokens > MAX_SPEECH_TOKENS:
-                # Truncate to fit within limits
-                char_limit = MAX_SPEECH_TOKENS * 4  # Roughly 4 chars per token
-                speech_text = speech_text[:char_limit] + "\n\n[Speech truncated due to length]"
-                print(f"   ⚠️  Truncated speech {speech_id} (was {estimated_tokens} tokens)")
+            estimated_tokens = text_length // 4  # Same rule as estimate_tokens()
+            original_tokens = None
+            if estimated_tokens > Config.MAX_INPUT_TOKENS:
+                speech_text = short_text + "\n\n[Speech truncated due to length]"
+                original_tokens = int(estimated_tokens)
 
             # Create the request
             request = self.create_single_request(
@@ -163,55 +276,120 @@ class BatchRequestBuilder:
                 date=date
             )
 
-            requests.append(request)
+            # Estimate tokens for this request (reusing the prompt we just
+            # built rather than formatting the whole speech a second time)
+            prompt_tokens = estimate_tokens(request["body"]["messages"][1]["content"])
 
-            # Estimate tokens for this request
-            prompt_tokens = estimate_tokens(
-                Config.get_sentiment_prompt(speech_text, speaker, institution, date)
-            )
-            total_input_tokens += prompt_tokens
-            total_output_tokens_estimate += OUTPUT_TOKENS_ESTIMATE
-
-            # Progress bar
-            print_progress_bar(
-                idx + 1, len(df),
-                prefix="Creating requests:",
-                suffix=f"{idx + 1}/{len(df)} speeches"
-            )
+            # Check the request now, while we still have it as a dictionary,
+            # rather than reading the whole file back afterwards
+            problem = self._validate_request(request, prompt_tokens)
 
-        # Write to JSONL file
-        print(f"\n💾 Writing {len(requests)} requests to {output_file}...")
+            text_hash = int(text_hash) if text_found else None
+            encoded.append((speech_id, text_hash, orjson.dumps(request),
+                            prompt_tokens, original_tokens, problem))
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for request in requests:
-                # Write each request as a JSON line
-                f.write(json.dumps(request) + '\n')
+        # Longest prompts first, so they don't end up as stragglers at the
+        # end of the batch (results are matched back by custom_id, so the
+        # order in the file doesn't matter otherwise)
+        if Config.SORT_REQUESTS_BY_LENGTH:
+            encoded.sort(key=lambda item: item[3], reverse=True)
 
-        print(f"✓ Batch file created successfully!")
+        return encoded
 
-        # Calculate cost estimates
-        batch_cost = (
-            (total_input_tokens / 1000) * Config.BATCH_INPUT_PRICE_PER_1K +
-            (total_output_tokens_estimate / 1000) * Config.BATCH_OUTPUT_PRICE_PER_1K
-        )
+    def write_encoded(self, encoded: List[tuple], total_rows: Optional[int] = None):
+        """
+        Write lines from encode_chunk() to the open batch file.
 
-        realtime_cost = (
-            (total_input_tokens / 1000) * Config.REALTIME_INPUT_PRICE_PER_1K +
-            (total_output_tokens_estimate / 1000) * Config.REALTIME_OUTPUT_PRICE_PER_1K
-        )
+        Args:
+            encoded: The list returned by encode_chunk()
+            total_rows: Total speeches across all chunks, if known (for the
+                progress bar)
+
+        For beginners:
+        - Chunks must be written in their original order, one at a time,
+          so duplicates are always matched to the first copy of a speech
+        """
+
+        for speech_id, text_hash, line, prompt_tokens, original_tokens, problem in encoded:
+            self._rows_seen += 1
+
+            # Progress bar (counts every row, including skipped duplicates)
+            if total_rows:
+                print_progress_bar(
+                    self._rows_seen, total_rows,
+                    prefix="Creating requests:",
+                    suffix=f"{self._rows_seen}/{total_rows} speeches"
+                )
+
+            # Skip speeches we have already seen, remembering which request
+            # they share so their scores can be copied back later (empty
+            # speeches have no hash and are always sent)
+            if text_hash is not None:
+                original_id = self._seen_hashes.get(text_hash)
+                if original_id is not None:
+                    self._duplicates[speech_id] = original_id
+                    continue
+                self._seen_hashes[text_hash] = speech_id
+
+            if original_tokens is not None:
+                print(f"   ⚠️  Truncated speech {speech_id} (was {original_tokens} tokens)")
+
+            if problem is not None:
+                self._validation_errors += 1
+                print(f"   ❌ Invalid request {speech_id}: {problem}")
+
+            self._file.write(line)
+            self._file.write(b'\n')
+            self._num_requests += 1
+
+            self._total_input_tokens += prompt_tokens
+            self._total_output_tokens_estimate += Config.OUTPUT_TOKENS_ESTIMATE
+
+        if not total_rows:
+            print(f"   Written {self._num_requests} requests so far...")
+
+    def close_batch_file(self) -> Dict[str, Any]:
+        """
+        Finish the batch file and summarise what was written.
 
-        savings = realtime_cost - batch_cost
+        Returns:
+            Dictionary with statistics about the batch file
+        """
+        # Make sure everything is on disk, then swap the finished file in
+        # (os.replace is atomic: readers see the old file or the new one)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        output_file = self._output_file
+        os.replace(self._temp_file, output_file)
+
+        print(f"\n✓ Batch file created successfully! ({output_file})")
+
+        # Save which speeches were skipped as duplicates (phase3_data_prep.py
+        # uses this to copy the scores back onto them). A list left over from
+        # an earlier build of this file is removed, so it is never applied to
+        # the new batch
+        duplicates_file = output_file.with_name(f"{output_file.stem}_duplicates.json")
+        if self._duplicates:
+            print(f"🔁 Skipped {len(self._duplicates)} speeches with duplicate text")
+            save_json(self._duplicates, duplicates_file)
+        else:
+            duplicates_file.unlink(missing_ok=True)
+            duplicates_file = None
 
         # Summary statistics
-        stats = {
-            'num_requests': len(requests),
-            'total_input_tokens': total_input_tokens,
-            'estimated_output_tokens': total_output_tokens_estimate,
-            'batch_cost_estimate': batch_cost,
-            'realtime_cost_estimate': realtime_cost,
-            'savings': savings,
+        stats = self.estimate_costs(
+            self._num_requests, self._total_input_tokens,
+            self._total_output_tokens_estimate
+        )
+        savings = stats['savings']
+        realtime_cost = stats['realtime_cost_estimate']
+        stats.update({
+            'validation_errors': self._validation_errors,
+            'num_duplicates': len(self._duplicates),
+            'duplicates_file': str(duplicates_file) if duplicates_file else None,
             'output_file': str(output_file)
-        }
+        })
 
         # Print summary
         print("\n" + "=" * 60)
@@ -229,12 +407,105 @@ class BatchRequestBuilder:
 
         return stats
 
-    def validate_batch_file(self, file_path: Path) -> bool:
+    @staticmethod
+    def _validate_request(request: Dict[str, Any], prompt_tokens: int) -> Optional[str]:
+        """
+        Check one request before it is written to the batch file.
+
+        Args:
+            request: Request from create_single_request()
+            prompt_tokens: Estimated tokens in the prompt
+
+        Returns:
+            A description of the problem, or None if the request is valid
+        """
+        for field in ['custom_id', 'method', 'url', 'body']:
+            if field not in request:
+                return f"Missing required field '{field}'"
+
+        for field in ['model', 'messages']:
+            if field not in request['body']:
+                return f"Missing required field 'body.{field}'"
+
+        if prompt_tokens > Config.MODEL_CONTEXT_TOKENS:
+            return f"Prompt too long ({prompt_tokens} tokens)"
+
+        return None
+
+    def abort_batch_file(self):
+        """
+        Stop writing a batch file and throw away what was written so far.
+
+        For beginners:
+        - Any existing batch file from an earlier, complete run is kept
+        """
+        self._file.close()
+        self._temp_file.unlink(missing_ok=True)
+        print(f"\n⚠️  Batch file not finished - discarded partial output ({self._temp_file.name})")
+
+    @staticmethod
+    def estimate_costs(num_requests: int, total_input_tokens: int,
+                       total_output_tokens_estimate: int) -> Dict[str, Any]:
+        """
+        Work out the Batch and real-time API costs for a set of requests.
+
+        Args:
+            num_requests: Number of requests
+            total_input_tokens: Estimated prompt tokens across all requests
+            total_output_tokens_estimate: Estimated response tokens
+
+        Returns:
+            Dictionary with the token counts and cost estimates
+        """
+
+        # Every prompt starts with the same instructions before the speech;
+        # OpenAI can cache that prefix if it is long enough. The first
+        # request pays full price for it, later ones can hit the cache
+        marker = "\x00"
+        prompt = Config.get_sentiment_prompt(marker, marker, marker, marker)
+        prefix_tokens = estimate_tokens(prompt[:prompt.index(marker)])
+        if prefix_tokens < Config.PROMPT_CACHE_MIN_TOKENS:
+            prefix_tokens = 0
+        cached_input_tokens = prefix_tokens * max(num_requests - 1, 0)
+
+        # Calculate cost estimates for every API and token type at once:
+        # price table (APIs x token types) times token counts per type
+        apis = list(Config.API_PRICES_PER_1K)
+        prices_per_1k = np.array([Config.API_PRICES_PER_1K[api] for api in apis])
+        tokens = np.array([
+            total_input_tokens - cached_input_tokens,
+            cached_input_tokens,
+            total_output_tokens_estimate,
+        ])
+        costs = prices_per_1k * (tokens / 1000)
+        totals = costs.sum(axis=1)
+
+        cost_breakdown = {
+            api: dict(zip(["input", "cached_input", "output"], row.tolist()))
+            for api, row in zip(apis, costs)
+        }
+        batch_cost = float(totals[apis.index("batch")])
+        realtime_cost = float(totals[apis.index("realtime")])
+
+        return {
+            'num_requests': num_requests,
+            'total_input_tokens': total_input_tokens,
+            'estimated_output_tokens': total_output_tokens_estimate,
+            'cached_input_tokens': cached_input_tokens,
+            'cost_breakdown': cost_breakdown,
+            'batch_cost_estimate': batch_cost,
+            'realtime_cost_estimate': realtime_cost,
+            'savings': realtime_cost - batch_cost,
+        }
+
+    def validate_batch_file(self, file_path: Path, reread: bool = False) -> bool:
         """
         Validate that a batch file is correctly formatted.
 
         Args:
             file_path: Path to the JSONL file to validate
+            reread: Read the file back and check every line, even if this
+                builder just wrote (and already checked) it
 
         Returns:
             True if valid
@@ -243,29 +514,42 @@ class BatchRequestBuilder:
         - This checks that the file we created is correct
         - Catches errors before we upload to OpenAI
         - Saves time and prevents wasted API calls
+        - Requests are already checked as they are written, so for a file
+          this builder just made we only report the result
         """
 
         print(f"\n🔍 Validating batch file: {file_path}")
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Check each line is valid JSON
-            for i, line in enumerate(lines, 1):
-                try:
-                    request = json.loads(line)
-
-                    # Check required fields exist
-                    required_fields = ['custom_id', 'method', 'url', 'body']
-                    for field in required_fields:
-                        if field not in request:
-                            raise ValueError(f"Line {i}: Missing required field '{field}'")
-
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Line {i}: Invalid JSON - {e}")
+        if not reread and Path(file_path) == getattr(self, '_output_file', None):
+            if self._validation_errors:
+                print(f"❌ Validation failed: {self._validation_errors} invalid requests")
+                return False
+            print(f"✓ Batch file is valid! ({self._num_requests} requests)")
+            return True
 
-            print(f"✓ Batch file is valid! ({len(lines)} requests)")
+        try:
+            num_requests = 0
+
+            # Read one line at a time (in binary, for orjson), so even a very
+            # large batch file never has to fit in memory all at once
+            with open(file_path, 'rb') as f:
+                # Check each line is valid JSON
+                for num_requests, line in enumerate(f, 1):
+                    try:
+                        request = orjson.loads(line)
+
+                        # Check required fields exist
+                        required_fields = ['custom_id', 'method', 'url', 'body']
+                        for field in required_fields:
+                            if field not in request:
+                                raise ValueError(
+                                    f"Line {num_requests}: Missing required field '{field}'"
+                                )
+
+                    except orjson.JSONDecodeError as e:
+                        raise ValueError(f"Line {num_requests}: Invalid JSON - {e}")
+
+            print(f"✓ Batch file is valid! ({num_requests} requests)")
             return True
 
         except Exception as e:
@@ -273,6 +557,24 @@ class BatchRequestBuilder:
             return False
 
 
+def encode_chunk_in_worker(job: tuple) -> List[tuple]:
+    """
+    Encode one chunk of speeches in a worker process.
+
+    Args:
+        job: (df, text_column, id_column, speaker_column, institution_column,
+            date_column), the arguments for BatchRequestBuilder.encode_chunk()
+
+    Returns:
+        The encoded lines, ready for BatchRequestBuilder.write_encoded()
+
+    For beginners:
+    - Worker processes can only run plain module-level functions,
+      so this wraps the builder method
+    """
+    return BatchRequestBuilder().encode_chunk(*job)
+
+
 # Example usage
 if __name__ == "__main__":
     """
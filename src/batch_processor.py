@@ -13,16 +13,203 @@ For beginners:
 - This module manages that entire workflow for you
 """
 
-import json
+import asyncio
+import os
+import random
+import threading
 import time
+import orjson
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict, Any
-from openai import OpenAI
+from typing import Optional, Dict, Any, List, Tuple
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 from config import Config
 from utils import print_section_header, save_json, load_json
 
 
+def backoff_intervals(initial: float, maximum: float, multiplier: float = None):
+    """
+    Generate wait times between status checks that grow over time.
+
+    Args:
+        initial: First wait (seconds)
+        maximum: Longest wait (seconds)
+        multiplier: How much longer each wait is than the one before
+
+    Yields:
+        Seconds to wait before the next check
+
+    For beginners:
+    - A batch job that has been running for an hour is unlikely to finish
+      in the next few seconds, so we check less and less often
+      (e.g. 5s, 7.5s, 11s, ... up to once a minute)
+    - A little randomness ("jitter") stops many waiting scripts from all
+      asking OpenAI at exactly the same moment
+    """
+    multiplier = multiplier or Config.BATCH_CHECK_BACKOFF
+    interval = min(initial, maximum)
+    while True:
+        yield interval + random.uniform(0, interval * 0.1)
+        interval = min(maximum, interval * multiplier)
+
+
+# Errors that are usually temporary, so the call is worth trying again
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+
+def retry_api_call(func, *args, attempts: Optional[int] = None, **kwargs):
+    """
+    Call an OpenAI API function, trying again if it fails for a temporary reason.
+
+    Args:
+        func: The function to call (e.g. processor.check_batch_status)
+        *args, **kwargs: Passed on to func
+        attempts: Most tries in total (default: Config.API_RETRY_ATTEMPTS)
+
+    Returns:
+        Whatever func returns
+
+    For beginners:
+    - Network hiccups, rate limits and OpenAI server errors usually go away
+      after a short wait, so we wait and try again instead of giving up
+    - Each wait is longer than the last (see backoff_intervals)
+    - Other errors (e.g. a wrong batch ID) are raised straight away
+    """
+    attempts = attempts or Config.API_RETRY_ATTEMPTS
+    waits = backoff_intervals(
+        Config.API_RETRY_INITIAL_WAIT, Config.API_RETRY_MAX_WAIT, multiplier=2
+    )
+    for attempt in range(1, attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except RETRYABLE_ERRORS as e:
+            if attempt == attempts:
+                raise
+            wait = next(waits)
+            print(f"⚠️  Temporary API error ({e}), retrying in {wait:.0f}s...")
+            time.sleep(wait)
+
+
+async def retry_api_call_async(func, *args, attempts: Optional[int] = None, **kwargs):
+    """
+    Async version of retry_api_call, for async API functions.
+
+    Waiting between tries doesn't hold up other tasks running at the same time.
+    """
+    attempts = attempts or Config.API_RETRY_ATTEMPTS
+    waits = backoff_intervals(
+        Config.API_RETRY_INITIAL_WAIT, Config.API_RETRY_MAX_WAIT, multiplier=2
+    )
+    for attempt in range(1, attempts + 1):
+        try:
+            return await func(*args, **kwargs)
+        except RETRYABLE_ERRORS as e:
+            if attempt == attempts:
+                raise
+            wait = next(waits)
+            print(f"⚠️  Temporary API error ({e}), retrying in {wait:.0f}s...")
+            await asyncio.sleep(wait)
+
+
+# Batch statuses that never change again, so they can be remembered
+FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Columns of the parsed results table (see BatchProcessor.parse_results)
+RESULT_COLUMNS = [
+    "speech_id",
+    "hawkish_dovish_score",
+    "topic_inflation",
+    "topic_growth",
+    "topic_financial_stability",
+    "topic_labor_market",
+    "topic_international",
+    "uncertainty",
+    "forward_guidance_strength",
+    "market_impact_stocks",
+    "market_impact_bonds",
+    "market_impact_currency",
+    "market_impact_reasoning",
+    "summary",
+    "key_sentences",
+]
+
+
+def split_jsonl(file_path: Path, part_bytes: int) -> List[Tuple[int, int]]:
+    """
+    Split a JSONL file into byte ranges of about part_bytes each.
+
+    Args:
+        file_path: Path to the JSONL file
+        part_bytes: Roughly how many bytes each part should hold
+
+    Returns:
+        List of (start, end) byte offsets; every part ends at a line break
+
+    For beginners:
+    - Each line of a JSONL file is a separate result, so different parts
+      of one big file can be parsed by different processes at once
+    - We jump ahead part_bytes and then to the end of that line, so no
+      result is ever cut in half
+    """
+
+    size = os.path.getsize(file_path)
+    ranges = []
+    start = 0
+
+    with open(file_path, "rb") as f:
+        while start < size:
+            f.seek(min(start + part_bytes, size))
+            f.readline()  # Move on to the end of the line we landed in
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+
+    return ranges or [(0, 0)]
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter for async code.
+
+    Args:
+        capacity: Most tokens that can be used in a burst
+        refill_rate: Tokens added back per second
+
+    For beginners:
+    - Think of a bucket holding up to `capacity` tokens that slowly refills
+    - Each request takes tokens out; if there aren't enough, it waits until
+      the bucket has refilled
+    - This keeps us under OpenAI's rate limits, instead of sending requests
+      until they are rejected and then retrying
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    async def acquire(self, tokens: float = 1):
+        """Wait until `tokens` are available, then use them."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate
+        )
+        self.updated_at = now
+
+        # Reserve the tokens straight away (the balance may go negative), so
+        # callers are served in the order they asked, then wait off the debt
+        self.tokens -= min(tokens, self.capacity)
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.refill_rate)
+
+
 class BatchProcessor:
     """
     Manages batch processing jobs with OpenAI's Batch API.
@@ -34,12 +221,16 @@ class BatchProcessor:
     4. Download results → Parse and save
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self, api_key: Optional[str] = None, requests_per_minute: Optional[float] = None
+    ):
         """
         Initialize the batch processor.
 
         Args:
             api_key: OpenAI API key (if not provided, uses from config)
+            requests_per_minute: Limit for async uploads and batch creation
+                                 (if not provided, uses from config)
 
         For beginners:
         - Creates connection to OpenAI's servers
@@ -56,6 +247,42 @@ class BatchProcessor:
         # Initialize OpenAI client
         self.client = OpenAI(api_key=self.api_key)
 
+        # Async client, used to submit several chunks at the same time
+        # (see the *_async methods below)
+        self.async_client = AsyncOpenAI(api_key=self.api_key)
+
+        # Rate limits for the async methods (requests, and megabytes uploaded)
+        requests_per_minute = requests_per_minute or Config.API_REQUESTS_PER_MINUTE
+        self.request_bucket = TokenBucket(requests_per_minute, requests_per_minute / 60)
+        self.upload_bucket = TokenBucket(
+            Config.UPLOAD_MB_PER_MINUTE, Config.UPLOAD_MB_PER_MINUTE / 60
+        )
+
+        # Final statuses of finished batches, saved between runs
+        # (see _cached_status); loaded the first time they are needed
+        self.status_cache_file = Config.RESULTS_DIR / ".status_cache.json"
+        self._status_cache = None
+        self._status_cache_lock = threading.Lock()
+
+    def warm_up(self):
+        """
+        Connect to OpenAI in the background.
+
+        For beginners:
+        - The first request to a server is the slowest (it has to connect
+          and set up encryption first)
+        - Call this before waiting for something else, like the user typing
+          YES, so the next request can reuse the open connection
+        """
+
+        def ping():
+            try:
+                self.client.models.list()
+            except Exception:
+                pass  # Only a warm-up; real requests report their own errors
+
+        threading.Thread(target=ping, daemon=True).start()
+
     def upload_batch_file(self, file_path: Path) -> str:
         """
         Upload a batch file to OpenAI.
@@ -147,64 +374,166 @@ class BatchProcessor:
         - Batch jobs take time to complete (up to 24 hours)
         - This function checks if it's done yet
         - Returns information about progress
+        - Once a batch has finished, its status is remembered, so checking
+          it again (even in a later run) doesn't need to ask OpenAI
         """
 
+        cached = self._cached_status(batch_id)
+        if cached is not None:
+            return cached
+
         try:
             batch = self.client.batches.retrieve(batch_id)
+            return self._remember_status(self._status_info(batch))
 
-            status_info = {
-                "id": batch.id,
-                "status": batch.status,  # validating, in_progress, completed, failed, etc.
-                "created_at": batch.created_at,
-                "completed_at": batch.completed_at,
-                "failed_at": batch.failed_at,
-                "request_counts": (
-                    {
-                        "total": batch.request_counts.total,
-                        "completed": batch.request_counts.completed,
-                        "failed": batch.request_counts.failed,
-                    }
-                    if batch.request_counts
+        except Exception as e:
+            print(f"❌ Error checking batch status: {e}")
+            raise
+
+    def _cached_status(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the remembered final status of a batch, or None if unknown.
+        """
+        with self._status_cache_lock:
+            if self._status_cache is None:
+                self._status_cache = (
+                    load_json(self.status_cache_file)
+                    if self.status_cache_file.exists()
                     else {}
-                ),
-                "output_file_id": batch.output_file_id,
-                "error_file_id": batch.error_file_id,
-            }
+                )
+            return self._status_cache.get(batch_id)
+
+    def forget_statuses(self):
+        """
+        Forget all remembered final statuses, so every batch is asked about
+        again (final statuses found after this are remembered afresh).
+        """
+        with self._status_cache_lock:
+            self._status_cache = {}
+
+    def _remember_status(self, status_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Remember a batch's status if it is final (see FINAL_STATUSES).
+
+        Returns:
+            The same status information, so calls can be chained
+        """
+        if status_info["status"] in FINAL_STATUSES:
+            self._cached_status(status_info["id"])  # Make sure the cache is loaded
+            with self._status_cache_lock:
+                self._status_cache[status_info["id"]] = status_info
+                save_json(self._status_cache, self.status_cache_file, verbose=False)
+        return status_info
 
-            return status_info
+    @staticmethod
+    def _status_info(batch) -> Dict[str, Any]:
+        """
+        Turn a batch object from OpenAI into a plain status dictionary.
+        """
+        return {
+            "id": batch.id,
+            "status": batch.status,  # validating, in_progress, completed, failed, etc.
+            "created_at": batch.created_at,
+            "completed_at": batch.completed_at,
+            "failed_at": batch.failed_at,
+            "request_counts": (
+                {
+                    "total": batch.request_counts.total,
+                    "completed": batch.request_counts.completed,
+                    "failed": batch.request_counts.failed,
+                }
+                if batch.request_counts
+                else {}
+            ),
+            "output_file_id": batch.output_file_id,
+            "error_file_id": batch.error_file_id,
+        }
+
+    def check_batch_statuses(self, batch_ids) -> Dict[str, Dict[str, Any]]:
+        """
+        Check the status of several batch jobs at once.
+
+        Args:
+            batch_ids: The batch IDs to check
+
+        Returns:
+            Dictionary mapping each batch ID to its status information
+            (as from check_batch_status)
 
+        For beginners:
+        - Instead of asking OpenAI about each batch separately, this lists
+          your recent batches (100 per request) and picks out the ones we want
+        - Any batch not found in the list (e.g. a very old one) is checked
+          on its own
+        """
+        statuses = {}
+        wanted = set()
+        for batch_id in batch_ids:
+            cached = self._cached_status(batch_id)
+            if cached is not None:
+                statuses[batch_id] = cached
+            else:
+                wanted.add(batch_id)
+        if not wanted:
+            return statuses
+
+        try:
+            # The SDK fetches further pages automatically; newest come first,
+            # so we can stop as soon as we have found every batch we need
+            for batch in self.client.batches.list(limit=100):
+                if batch.id in wanted:
+                    statuses[batch.id] = self._remember_status(self._status_info(batch))
+                    if wanted <= statuses.keys():
+                        break
         except Exception as e:
-            print(f"❌ Error checking batch status: {e}")
-            raise
+            print(f"⚠️  Could not list batches ({e}), checking one by one")
+
+        for batch_id in wanted - statuses.keys():
+            statuses[batch_id] = self.check_batch_status(batch_id)
+
+        return statuses
 
     def wait_for_completion(
-        self, batch_id: str, check_interval: int = None, timeout: int = None
+        self,
+        batch_id: str,
+        check_interval: int = None,
+        timeout: int = None,
+        initial_interval: float = None,
+        multiplier: float = None,
     ) -> Dict[str, Any]:
         """
         Wait for a batch job to complete, with progress updates.
 
         Args:
             batch_id: The batch ID to monitor
-            check_interval: How often to check status (seconds)
+            check_interval: Longest time between status checks (seconds)
             timeout: Maximum time to wait (seconds)
+            initial_interval: First time between status checks (seconds);
+                the wait then grows by `multiplier` up to check_interval
+            multiplier: How fast the wait grows (see backoff_intervals)
 
         Returns:
             Final batch status information
 
         For beginners:
         - This function waits for your batch to finish
-        - It checks every minute (by default) if it's done
+        - It checks often at first, then about once a minute (by default)
         - Shows progress in the console
         - Stops when job completes or times out
         """
 
         check_interval = check_interval or Config.BATCH_CHECK_INTERVAL
         timeout = timeout or Config.BATCH_TIMEOUT
+        waits = backoff_intervals(
+            initial_interval or Config.BATCH_CHECK_INITIAL_INTERVAL,
+            check_interval,
+            multiplier,
+        )
 
         print_section_header("MONITORING BATCH JOB")
         print(f"\n⏳ Waiting for batch job to complete...")
         print(f"   Batch ID: {batch_id}")
-        print(f"   Check interval: {check_interval} seconds")
+        print(f"   Check interval: up to {check_interval} seconds")
         print(f"   Timeout: {timeout / 3600:.1f} hours")
         print(f"\n   (This can take up to 24 hours. The API runs in the background.)")
 
@@ -259,11 +588,12 @@ class BatchProcessor:
                 return status_info
 
             # Wait before checking again
+            wait = next(waits)
             print(
-                f"   Waiting {check_interval} seconds... (elapsed: {elapsed / 60:.1f} min)",
+                f"   Waiting {wait:.0f} seconds... (elapsed: {elapsed / 60:.1f} min)",
                 end="\r",
             )
-            time.sleep(check_interval)
+            time.sleep(wait)
 
         return status_info
 
@@ -273,6 +603,8 @@ class BatchProcessor:
         wait_for_completion: bool = False,
         timeout: int = 86400,
         poll_interval: int = 60,
+        initial_interval: float = None,
+        multiplier: float = None,
     ) -> Dict[str, Any]:
         """
         Wait for batch to complete or start processing.
@@ -282,7 +614,11 @@ class BatchProcessor:
             wait_for_completion: If True, wait until fully completed (slow but safe)
                                 If False, wait until processing starts (faster but risky)
             timeout: Maximum time to wait in seconds (default 24 hours)
-            poll_interval: How often to check in seconds (default 60 seconds)
+            poll_interval: Longest time between checks in seconds (default 60 seconds)
+            initial_interval: First time between checks in seconds (default
+                2 seconds when waiting for processing to start, as validation
+                usually takes under 30 seconds)
+            multiplier: How fast the wait grows (see backoff_intervals)
 
         Returns:
             Current batch status information
@@ -290,6 +626,9 @@ class BatchProcessor:
 
         start_time = time.time()
         last_status = None
+        waits = self._processing_waits(
+            wait_for_completion, poll_interval, initial_interval, multiplier
+        )
 
         if wait_for_completion:
             print(f"   Waiting for batch to COMPLETE (safe mode, may take hours)...")
@@ -346,13 +685,29 @@ class BatchProcessor:
                     return status_info
 
             # Wait before checking again
-            time.sleep(poll_interval)
+            time.sleep(next(waits))
 
         # Return current status even if timeout
         return self.check_batch_status(batch_id)
 
+    @staticmethod
+    def _processing_waits(wait_for_completion, poll_interval, initial_interval, multiplier):
+        """
+        Wait times for wait_for_completion_or_processing (sync and async).
+        """
+        if initial_interval is None:
+            initial_interval = (
+                Config.BATCH_CHECK_INITIAL_INTERVAL if wait_for_completion else 2
+            )
+        return backoff_intervals(initial_interval, poll_interval, multiplier)
+
     def wait_for_in_progress(
-        self, batch_id: str, timeout: int = 86400, poll_interval: int = 60
+        self,
+        batch_id: str,
+        timeout: int = 86400,
+        poll_interval: int = 60,
+        initial_interval: float = None,
+        multiplier: float = None,
     ) -> Dict[str, Any]:
         """
         DEPRECATED: Use wait_for_completion_or_processing instead.
@@ -363,7 +718,126 @@ class BatchProcessor:
             wait_for_completion=True,  # Use safe mode by default
             timeout=timeout,
             poll_interval=poll_interval,
+            initial_interval=initial_interval,
+            multiplier=multiplier,
+        )
+
+    # ==================== ASYNC VERSIONS ====================
+    # The same steps as above, but using `await` so several chunks can be
+    # uploaded and monitored at the same time instead of one after another.
+    # The work is waiting on the network, so this needs no extra CPU.
+
+    async def upload_batch_file_async(self, file_path: Path) -> str:
+        """
+        Upload a batch file to OpenAI (async version of upload_batch_file).
+        """
+        await self.request_bucket.acquire()
+        await self.upload_bucket.acquire(Path(file_path).stat().st_size / 1_000_000)
+
+        with open(file_path, "rb") as f:
+            file_response = await self.async_client.files.create(
+                file=f, purpose="batch"
+            )
+        return file_response.id
+
+    async def create_batch_job_async(
+        self, file_id: str, description: Optional[str] = None
+    ) -> str:
+        """
+        Create a batch processing job (async version of create_batch_job).
+        """
+        await self.request_bucket.acquire()
+        batch_response = await self.async_client.batches.create(
+            input_file_id=file_id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={
+                "description": description or "Central bank speech sentiment analysis"
+            },
         )
+        return batch_response.id
+
+    async def check_batch_status_async(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Check the status of a batch job (async version of check_batch_status).
+        """
+        cached = self._cached_status(batch_id)
+        if cached is not None:
+            return cached
+
+        batch = await self.async_client.batches.retrieve(batch_id)
+        return self._remember_status(self._status_info(batch))
+
+    async def check_batch_statuses_async(
+        self, batch_ids, max_concurrent: int = 16
+    ) -> Dict[str, Any]:
+        """
+        Check the status of many batch jobs at the same time.
+
+        Args:
+            batch_ids: IDs of the batches to check
+            max_concurrent: Most checks waiting on OpenAI at the same time
+
+        Returns:
+            Dictionary mapping each batch ID to its status information, or
+            to the error it raised (after retrying temporary errors)
+
+        For beginners:
+        - Each check mostly waits on the network, so all checks wait
+          together on one event loop instead of one after another
+        - Run it from normal code with asyncio.run(...)
+        """
+        slots = asyncio.Semaphore(max_concurrent)
+
+        async def check(batch_id):
+            async with slots:
+                return await retry_api_call_async(self.check_batch_status_async, batch_id)
+
+        batch_ids = list(batch_ids)
+        statuses = await asyncio.gather(
+            *(check(batch_id) for batch_id in batch_ids), return_exceptions=True
+        )
+        return dict(zip(batch_ids, statuses))
+
+    async def wait_for_completion_or_processing_async(
+        self,
+        batch_id: str,
+        wait_for_completion: bool = False,
+        timeout: int = 86400,
+        poll_interval: int = 60,
+        initial_interval: float = None,
+        multiplier: float = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait for batch to complete or start processing (async version of
+        wait_for_completion_or_processing, with less printing as several
+        batches may be waiting at once).
+        """
+        start_time = time.time()
+        waits = self._processing_waits(
+            wait_for_completion, poll_interval, initial_interval, multiplier
+        )
+
+        while time.time() - start_time <= timeout:
+            status_info = await self.check_batch_status_async(batch_id)
+            current_status = status_info["status"]
+
+            if current_status in ["failed", "completed", "expired", "cancelled"]:
+                return status_info
+
+            total_requests = status_info["request_counts"].get("total", 0)
+            if (
+                not wait_for_completion
+                and current_status != "validating"
+                and total_requests > 0
+            ):
+                return status_info
+
+            # Wait before checking again (other chunks carry on meanwhile)
+            await asyncio.sleep(next(waits))
+
+        # Return current status even if timeout
+        return await self.check_batch_status_async(batch_id)
 
     def download_results(self, batch_id: str, output_file: Path) -> Path:
         """
@@ -398,12 +872,18 @@ class BatchProcessor:
             if not output_file_id:
                 raise ValueError("No output file available")
 
-            # Download the file
-            file_content = self.client.files.content(output_file_id)
-
-            # Save to disk
-            with open(output_file, "wb") as f:
-                f.write(file_content.content)
+            # Stream the file to disk 1 MB at a time, so a large results
+            # file never has to fit in memory. We write to a temporary file
+            # and rename it at the end, so an interrupted download doesn't
+            # leave a partial file that looks "already downloaded"
+            output_file = Path(output_file)
+            tmp_file = output_file.with_name(output_file.name + ".tmp")
+            with self.client.files.with_streaming_response.content(
+                output_file_id
+            ) as response, open(tmp_file, "wb") as f:
+                for chunk in response.iter_bytes(chunk_size=1 << 20):
+                    f.write(chunk)
+            os.replace(tmp_file, output_file)
 
             print(f"✓ Results saved to: {output_file}")
 
@@ -413,13 +893,21 @@ class BatchProcessor:
             print(f"❌ Error downloading results: {e}")
             raise
 
-    def parse_results(self, results_file: Path, output_csv: Path) -> pd.DataFrame:
+    @staticmethod
+    def parse_results(
+        results_file: Path,
+        output_csv: Optional[Path] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> pd.DataFrame:
         """
         Parse batch results into a structured DataFrame.
 
         Args:
             results_file: Path to the JSONL results file
-            output_csv: Where to save the parsed CSV
+            output_csv: Where to save the parsed CSV (None = don't save)
+            start: Byte offset to start parsing at (see split_jsonl)
+            end: Byte offset to stop parsing at (None = end of the file)
 
         Returns:
             DataFrame with parsed sentiment analysis results
@@ -432,11 +920,19 @@ class BatchProcessor:
 
         print(f"\n📊 Parsing results...")
 
-        results = []
+        # One list per column; the table is built from them in one go at
+        # the end (faster than building it from one dictionary per row)
+        columns = {name: [] for name in RESULT_COLUMNS}
 
-        with open(results_file, "r", encoding="utf-8") as f:
+        # Binary mode: orjson reads bytes directly and is much faster than json
+        with open(results_file, "rb") as f:
+            f.seek(start)
+            position = start
             for line in f:
-                result = json.loads(line)
+                if end is not None and position >= end:
+                    break
+                position += len(line)
+                result = orjson.loads(line)
 
                 # Extract the data we need
                 custom_id = result["custom_id"]
@@ -450,55 +946,34 @@ class BatchProcessor:
 
                     # Parse the JSON response from GPT
                     try:
-                        sentiment_data = json.loads(message_content)
-
-                        # Flatten the nested structure
-                        flat_result = {
-                            "speech_id": custom_id,
-                            "hawkish_dovish_score": sentiment_data.get(
-                                "hawkish_dovish_score"
-                            ),
-                            "topic_inflation": sentiment_data.get("topics", {}).get(
-                                "inflation"
-                            ),
-                            "topic_growth": sentiment_data.get("topics", {}).get(
-                                "growth"
-                            ),
-                            "topic_financial_stability": sentiment_data.get(
-                                "topics", {}
-                            ).get("financial_stability"),
-                            "topic_labor_market": sentiment_data.get("topics", {}).get(
-                                "labor_market"
-                            ),
-                            "topic_international": sentiment_data.get("topics", {}).get(
-                                "international"
-                            ),
-                            "uncertainty": sentiment_data.get("uncertainty"),
-                            "forward_guidance_strength": sentiment_data.get(
-                                "forward_guidance_strength"
-                            ),
-                            "market_impact_stocks": sentiment_data.get(
-                                "market_impact", {}
-                            ).get("stocks"),
-                            "market_impact_bonds": sentiment_data.get(
-                                "market_impact", {}
-                            ).get("bonds"),
-                            "market_impact_currency": sentiment_data.get(
-                                "market_impact", {}
-                            ).get("currency"),
-                            "market_impact_reasoning": sentiment_data.get(
-                                "market_impact", {}
-                            ).get("reasoning"),
-                            "summary": sentiment_data.get("summary"),
-                            "key_sentences": "|".join(
-                                sentiment_data.get("key_sentences", [])
-                            ),
-                        }
-
-                        results.append(flat_result)
-
-                    except json.JSONDecodeError as e:
+                        sentiment_data = orjson.loads(message_content)
+                    except orjson.JSONDecodeError as e:
                         print(f"   ⚠️  Failed to parse response for {custom_id}: {e}")
+                        continue
+
+                    # Flatten the nested structure (same order as RESULT_COLUMNS)
+                    topics = sentiment_data.get("topics", {})
+                    market_impact = sentiment_data.get("market_impact", {})
+                    row = (
+                        custom_id,
+                        sentiment_data.get("hawkish_dovish_score"),
+                        topics.get("inflation"),
+                        topics.get("growth"),
+                        topics.get("financial_stability"),
+                        topics.get("labor_market"),
+                        topics.get("international"),
+                        sentiment_data.get("uncertainty"),
+                        sentiment_data.get("forward_guidance_strength"),
+                        market_impact.get("stocks"),
+                        market_impact.get("bonds"),
+                        market_impact.get("currency"),
+                        market_impact.get("reasoning"),
+                        sentiment_data.get("summary"),
+                        "|".join(sentiment_data.get("key_sentences", [])),
+                    )
+
+                    for values, value in zip(columns.values(), row):
+                        values.append(value)
 
                 else:
                     print(
@@ -506,13 +981,14 @@ class BatchProcessor:
                     )
 
         # Create DataFrame
-        df = pd.DataFrame(results)
+        df = pd.DataFrame(columns)
 
         print(f"✓ Parsed {len(df)} results")
 
         # Save to CSV
-        df.to_csv(output_csv, index=False)
-        print(f"✓ Saved to: {output_csv}")
+        if output_csv is not None:
+            df.to_csv(output_csv, index=False)
+            print(f"✓ Saved to: {output_csv}")
 
         return df
 
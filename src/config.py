@@ -13,6 +13,7 @@ For beginners:
 - It also keeps secrets (like API keys) separate from code
 """
 
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -54,6 +55,9 @@ class Config:
     ]:
         directory.mkdir(parents=True, exist_ok=True)
 
+    # Info about every submitted chunk (batch ID, status, ...) in one file
+    CHUNK_MANIFEST_FILE = RESULTS_DIR / "phase2_chunks_manifest.json"
+
     # ==================== OPENAI API SETTINGS ====================
     # Settings for connecting to OpenAI's API
 
@@ -68,6 +72,22 @@ class Config:
     # We use 0.3 for consistency while allowing some flexibility
     TEMPERATURE = 0.3
 
+    # Longest speech we send to the model (in estimated tokens)
+    # GPT-4o has a 128K token context window, but we'll be conservative
+    # Longer speeches are cut down to this length before the request is built
+    MAX_INPUT_TOKENS = 8000
+    MAX_CHARS_ESTIMATE = MAX_INPUT_TOKENS * 4  # Roughly 4 chars per token
+    MODEL_CONTEXT_TOKENS = 128000  # Hard limit: longer prompts are rejected
+
+    # We estimate ~500 tokens output per speech (the JSON scores)
+    OUTPUT_TOKENS_ESTIMATE = 500
+
+    # How to estimate tokens for the cost comparison
+    # "fast":  count characters in the speech column only (no batch file needed)
+    # "exact": build the batch file and count the real prompts
+    COST_PREVIEW_MODE = "exact"
+    CHARS_PER_TOKEN = 4  # Rough average for English text
+
     # ==================== HUGGING FACE SETTINGS ====================
     # Settings for accessing Hugging Face datasets
 
@@ -86,16 +106,71 @@ class Config:
     SAMPLE_START_YEAR = 2022
     SAMPLE_END_YEAR = 2023
 
+    # Possible column names for each piece of information we need,
+    # in order of preference (the first one found in the dataset is used)
+    COLUMN_CANDIDATES = {
+        "text": ["clean_text", "text", "content", "speech", "body"],
+        "id": ["id", "speech_id", "index"],
+        "speaker": ["author", "speaker"],
+        "institution": ["country", "institution"],
+        "date": ["date"],
+    }
+
+    # How much of the sample file to read at once when building batch files
+    # Only one chunk of speeches is held in memory at a time, so lower these
+    # if you run out of memory on a very large dataset
+    PARQUET_CHUNK_ROWS = 512  # Speeches per chunk (Parquet sample)
+    CSV_CHUNK_BYTES = 16 * 1024 * 1024  # 16 MB, several hundred speeches (CSV sample)
+
+    # Write the longest requests of each chunk first
+    # (set to False to keep the batch file in the same order as the sample)
+    SORT_REQUESTS_BY_LENGTH = True
+
+    # How many processes build batch requests (Phase 1) or parse downloaded
+    # results (Phase 2) at the same time
+    # (None = one per CPU core, 1 = no extra processes)
+    BATCH_WORKERS = None
+
+    # Downloaded results files bigger than this are split into parts of
+    # about this size, so several processes can parse one file (Phase 2)
+    PARSE_PART_BYTES = 64 * 1024 * 1024  # 64 MB
+
     # ==================== BATCH PROCESSING SETTINGS ====================
     # Settings specific to OpenAI's Batch API
 
     # How long to wait between checking if batch is complete (in seconds)
-    BATCH_CHECK_INTERVAL = 60  # Check every 60 seconds
+    # Checks start quickly and slow down by BATCH_CHECK_BACKOFF each time,
+    # up to BATCH_CHECK_INTERVAL (5s, 7.5s, 11s, ... 60s)
+    BATCH_CHECK_INITIAL_INTERVAL = 5
+    BATCH_CHECK_INTERVAL = 60  # Check at least every 60 seconds
+    BATCH_CHECK_BACKOFF = 1.5
+
+    # Retries for temporary API errors (network problems, rate limits,
+    # OpenAI server errors): waits double each time (1s, 2s, 4s, ... 60s)
+    API_RETRY_ATTEMPTS = 6
+    API_RETRY_INITIAL_WAIT = 1
+    API_RETRY_MAX_WAIT = 60
 
     # Maximum time to wait for batch completion (in seconds)
     # 24 hours = 86400 seconds
     BATCH_TIMEOUT = 86400
 
+    # How many chunk batch jobs may run at the same time
+    # OpenAI limits how many tokens can be queued at once (about 90K tokens,
+    # which is why split_batch.py makes 80K-token chunks), so keep this at 1
+    # unless your account has a higher limit. Uploads always run together.
+    MAX_CONCURRENT_CHUNKS = 1
+
+    # How many chunk files to upload (or results files to download) at the
+    # same time
+    UPLOAD_WORKERS = 8
+    DOWNLOAD_WORKERS = 8
+
+    # Client-side rate limits for uploads and batch creation, so we slow
+    # down before OpenAI starts rejecting requests (HTTP 429)
+    API_REQUESTS_PER_MINUTE = 50
+    UPLOAD_MB_PER_MINUTE = 100
+
     # ==================== PROMPT TEMPLATES ====================
 
     @staticmethod
@@ -217,13 +292,31 @@ IMPORTANT: The market_impact values MUST be exactly "rise", "fall", or "neutral"
     BATCH_INPUT_PRICE_PER_1K = 0.00125  # $0.00125 per 1K input tokens
     BATCH_OUTPUT_PRICE_PER_1K = 0.005  # $0.005 per 1K output tokens
 
+    # Prompt caching: when many requests start with the same text, OpenAI
+    # charges less for that repeated start (the "prefix") after the first time
+    # It only kicks in once the shared prefix is at least 1,024 tokens long
+    REALTIME_CACHED_INPUT_PRICE_PER_1K = 0.00125  # $0.00125 per 1K cached tokens
+    BATCH_CACHED_INPUT_PRICE_PER_1K = BATCH_INPUT_PRICE_PER_1K  # No extra discount
+    PROMPT_CACHE_MIN_TOKENS = 1024
+
+    # The same prices as a table, so all costs can be worked out in one go
+    # Rows are the APIs, columns are [input, cached input, output]
+    API_PRICES_PER_1K = {
+        "batch": [BATCH_INPUT_PRICE_PER_1K, BATCH_CACHED_INPUT_PRICE_PER_1K,
+                  BATCH_OUTPUT_PRICE_PER_1K],
+        "realtime": [REALTIME_INPUT_PRICE_PER_1K, REALTIME_CACHED_INPUT_PRICE_PER_1K,
+                     REALTIME_OUTPUT_PRICE_PER_1K],
+    }
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def validate():
         """
         Check if configuration is valid before running the project.
 
         This is like a pre-flight checklist - making sure everything
-        is set up correctly before we start.
+        is set up correctly before we start. A successful check is
+        remembered, so calling it again in the same run does nothing.
 
         Raises:
             ValueError: If configuration is invalid
@@ -11,11 +11,13 @@ For beginners:
 """
 
 import pandas as pd
+import pyarrow.parquet as pq
 from datasets import load_dataset
 from pathlib import Path
 from typing import Optional
 from huggingface_hub import login
 from config import Config
+from utils import is_up_to_date
 
 
 class DataLoader:
@@ -114,6 +116,62 @@ class DataLoader:
             print(f"❌ Error loading dataset: {e}")
             raise
 
+    def load_years(self, start_year: int, end_year: int,
+                   force_download: bool = False) -> pd.DataFrame:
+        """
+        Load only the speeches from a range of years.
+
+        Args:
+            start_year: First year to include (e.g., 2022)
+            end_year: Last year to include (e.g., 2023)
+            force_download: If True, download the full dataset again
+
+        Returns:
+            DataFrame with speeches from start_year to end_year
+
+        For beginners:
+        - The full dataset has decades of speeches, but we usually only
+          need a couple of years
+        - The year filter is applied while reading the Parquet file, so the
+          other years never get loaded into memory
+        - The result is cached as its own small file for the next run
+          (made again if the full dataset is downloaded again)
+        """
+
+        # Small cached file holding just these years, and the full dataset
+        # it is made from
+        shard_file = self.raw_data_dir / f"ecb_fed_{start_year}_{end_year}.parquet"
+        local_file = self.raw_data_dir / "ecb_fed_speeches.parquet"
+
+        # Reuse the small file unless the full dataset was saved again since
+        if (shard_file.exists() and not force_download
+                and (not local_file.exists() or is_up_to_date(shard_file, local_file))):
+            print(f"📂 Loading {start_year}-{end_year} speeches from: {shard_file}")
+            df = pd.read_parquet(shard_file)
+            print(f"✓ Loaded {len(df)} speeches from local storage")
+            return df
+
+        # Make sure the full dataset is saved locally first
+        if force_download or not local_file.exists():
+            self.load_from_huggingface(force_download=force_download)
+
+        print(f"📂 Reading {start_year}-{end_year} speeches from: {local_file}")
+        if "year" in pq.read_schema(local_file).names:
+            df = pd.read_parquet(
+                local_file,
+                filters=[("year", ">=", start_year), ("year", "<=", end_year)]
+            )
+            print(f"✓ Loaded {len(df)} speeches")
+        else:
+            # No 'year' column to filter on while reading: load everything
+            # and let sample_data work out the years from the dates
+            df = self.sample_data(pd.read_parquet(local_file), start_year, end_year)
+
+        print(f"💾 Caching to: {shard_file}")
+        df.to_parquet(shard_file, index=False)
+
+        return df
+
     def get_dataset_info(self, df: pd.DataFrame) -> dict:
         """
         Get summary information about the dataset.
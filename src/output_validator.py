@@ -10,6 +10,8 @@ For beginners:
 """
 
 import json
+from collections import Counter
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Tuple
 from pathlib import Path
@@ -168,6 +170,49 @@ class OutputValidator:
 
         return is_valid, errors
 
+    def _numeric_errors(self, results_df: pd.DataFrame, column: str, label: str,
+                        valid_range: Tuple[float, float]) -> np.ndarray:
+        """
+        Check one numeric score column for every speech at once.
+
+        Returns an array with an error message (or None) for each row.
+
+        For beginners:
+        - Instead of looping over speeches, we compare the whole column
+          against the valid range in one go (this is much faster)
+        """
+
+        n = len(results_df)
+        errors = np.full(n, None, dtype=object)
+        low, high = valid_range
+
+        if column not in results_df.columns:
+            errors[:] = f"{label} must be numeric, got: {type(None)}"
+            return errors
+
+        original = values = results_df[column]
+        wrong_type = np.zeros(n, dtype=bool)
+        if not pd.api.types.is_numeric_dtype(values):
+            # Mixed column (e.g. a stray string) - only this rare case looks
+            # at the individual values
+            is_numeric = np.fromiter(
+                (isinstance(v, (int, float, np.number)) for v in values),
+                dtype=bool, count=n
+            )
+            wrong_type = ~is_numeric & values.notna().to_numpy()
+            errors[wrong_type] = [f"{label} must be numeric, got: {type(v)}"
+                                  for v in values[wrong_type]]
+            values = pd.to_numeric(values.where(is_numeric), errors='coerce')
+
+        missing = values.isna().to_numpy() & ~wrong_type
+        errors[missing] = f"{label} is missing"
+
+        out_of_range = (values.notna() & ~values.between(low, high)).to_numpy()
+        errors[out_of_range] = [f"{label} out of range [{low}, {high}]: {v}"
+                                for v in original[out_of_range]]
+
+        return errors
+
     def validate_batch_results(self, results_df: pd.DataFrame) -> Dict[str, Any]:
         """
         Validate an entire batch of results.
@@ -180,6 +225,8 @@ class OutputValidator:
 
         For beginners:
         - This checks ALL speeches at once
+        - Each check runs on a whole column (pandas/NumPy) instead of
+          looping over speeches one by one
         - Gives you a report of how many passed/failed
         - Lists any problems found
         """
@@ -194,46 +241,92 @@ class OutputValidator:
             'error_summary': {}
         }
 
-        # Validate each speech
-        for idx, row in results_df.iterrows():
-            speech_id = row.get('speech_id', f'unknown_{idx}')
-
-            # Reconstruct the output dict from DataFrame columns
-            output = {
-                'hawkish_dovish_score': row.get('hawkish_dovish_score'),
-                'topics': {
-                    'inflation': row.get('topic_inflation'),
-                    'growth': row.get('topic_growth'),
-                    'financial_stability': row.get('topic_financial_stability'),
-                    'labor_market': row.get('topic_labor_market'),
-                    'international': row.get('topic_international')
-                },
-                'uncertainty': row.get('uncertainty'),
-                'forward_guidance_strength': row.get('forward_guidance_strength'),
-                'key_sentences': row.get('key_sentences', '').split('|') if pd.notna(row.get('key_sentences')) else [],
-                'market_impact': {
-                    'stocks': row.get('market_impact_stocks'),
-                    'bonds': row.get('market_impact_bonds'),
-                    'currency': row.get('market_impact_currency'),
-                    'reasoning': row.get('market_impact_reasoning')
-                },
-                'summary': row.get('summary', '')
-            }
-
-            is_valid, errors = self.validate_single_output(output, speech_id)
+        # One array of error messages (or None) per check, in the same
+        # order as validate_single_output() reports them
+        checks = [
+            self._numeric_errors(results_df, 'hawkish_dovish_score',
+                                 'hawkish_dovish_score',
+                                 self.score_ranges['hawkish_dovish_score'])
+        ]
 
-            if is_valid:
-                validation_results['valid_speeches'] += 1
+        for topic_field in self.required_topic_fields:
+            checks.append(self._numeric_errors(
+                results_df, f'topic_{topic_field}', f"Topic '{topic_field}'",
+                self.score_ranges['topic_scores']
+            ))
+
+        for field in ['uncertainty', 'forward_guidance_strength']:
+            checks.append(self._numeric_errors(
+                results_df, field, field, self.score_ranges[field]
+            ))
+
+        # Key sentences: a missing value means no sentences were returned
+        key_sentence_errors = np.full(total_speeches, None, dtype=object)
+        if 'key_sentences' in results_df.columns:
+            key_sentence_errors[results_df['key_sentences'].isna().to_numpy()] = \
+                "key_sentences is empty"
+        else:
+            key_sentence_errors[:] = "key_sentences is empty"
+        checks.append(key_sentence_errors)
+
+        # Market impact values must be one of rise/fall/neutral
+        for field in ['stocks', 'bonds', 'currency']:
+            market_errors = np.full(total_speeches, None, dtype=object)
+            column = f'market_impact_{field}'
+            if column in results_df.columns:
+                values = results_df[column]
+                bad = (~values.isin(self.valid_market_values)).to_numpy()
+                bad_values = values[bad]
             else:
-                validation_results['invalid_speeches'] += 1
-                validation_results['errors_by_speech'][speech_id] = errors
+                bad = np.ones(total_speeches, dtype=bool)
+                bad_values = [None] * total_speeches
+            market_errors[bad] = [
+                f"market_impact.{field} must be one of {self.valid_market_values}, "
+                f"got: {value}"
+                for value in bad_values
+            ]
+            checks.append(market_errors)
+
+        # Summary must be a non-empty string
+        summary_errors = np.full(total_speeches, None, dtype=object)
+        if 'summary' in results_df.columns:
+            summary = results_df['summary']
+            try:
+                # Non-string values (e.g. NaN) come back as NaN from .str
+                stripped = summary.astype(object).str.strip()
+            except AttributeError:
+                # No strings at all (e.g. a column that is entirely empty)
+                stripped = pd.Series(np.nan, index=results_df.index)
+            not_string = stripped.isna().to_numpy()
+            summary_errors[not_string] = [f"summary must be a string, got: {type(v)}"
+                                          for v in summary[not_string]]
+            summary_errors[(stripped == '').to_numpy()] = "summary is empty"
+        else:
+            summary_errors[:] = "summary is empty"
+        checks.append(summary_errors)
+
+        # Combine the checks: rows x checks, None where the check passed
+        all_errors = np.column_stack(checks)
+        invalid = pd.notna(all_errors).any(axis=1)
+
+        validation_results['invalid_speeches'] = int(invalid.sum())
+        validation_results['valid_speeches'] = total_speeches - validation_results['invalid_speeches']
+
+        # Only the (hopefully few) invalid rows need their messages collected
+        if 'speech_id' in results_df.columns:
+            speech_ids = results_df['speech_id'].to_numpy()[invalid]
+        else:
+            speech_ids = [f'unknown_{idx}' for idx in results_df.index[invalid]]
 
-                # Count error types
-                for error in errors:
-                    error_type = error.split(':')[0]  # Get first part of error message
-                    if error_type not in validation_results['error_summary']:
-                        validation_results['error_summary'][error_type] = 0
-                    validation_results['error_summary'][error_type] += 1
+        error_summary = Counter()
+        for speech_id, row_errors in zip(speech_ids, all_errors[invalid]):
+            errors = [error for error in row_errors if error is not None]
+            validation_results['errors_by_speech'][speech_id] = errors
+
+            # Count error types (first part of each error message)
+            error_summary.update(error.split(':')[0] for error in errors)
+
+        validation_results['error_summary'] = dict(error_summary)
 
         # Calculate validation rate
         if total_speeches > 0:
@@ -243,6 +336,51 @@ class OutputValidator:
 
         return validation_results
 
+    @staticmethod
+    def combine_batch_results(partial_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine validation results for parts of a dataset into one.
+
+        Args:
+            partial_results: Outputs of validate_batch_results(), e.g. one per chunk
+
+        Returns:
+            The same statistics as validating all the parts together
+
+        For beginners:
+        - Each speech is checked on its own, so every chunk can be validated
+          separately (even in another process) and the counts added up
+        """
+
+        combined = {
+            'total_speeches': 0,
+            'valid_speeches': 0,
+            'invalid_speeches': 0,
+            'validation_rate': 0.0,
+            'errors_by_speech': {},
+            'error_summary': {}
+        }
+        error_summary = Counter()
+
+        for partial in partial_results:
+            for key in ('total_speeches', 'valid_speeches', 'invalid_speeches'):
+                combined[key] += partial[key]
+            combined['errors_by_speech'].update(partial['errors_by_speech'])
+            error_summary.update(partial['error_summary'])
+
+        # List speeches in speech_id order, like the merged results
+        combined['errors_by_speech'] = dict(
+            sorted(combined['errors_by_speech'].items(), key=lambda item: str(item[0]))
+        )
+        combined['error_summary'] = dict(error_summary)
+
+        if combined['total_speeches'] > 0:
+            combined['validation_rate'] = (
+                combined['valid_speeches'] / combined['total_speeches'] * 100
+            )
+
+        return combined
+
     def print_validation_report(self, validation_results: Dict[str, Any]):
         """
         Print a nicely formatted validation report.
@@ -0,0 +1,435 @@
+"""
+Shared Phase 1 pipeline used by phase1_data_prep.py, phase1_batch_prep.py
+and phase1_demo.py.
+
+Phase 1 is split into stages:
+- "load":   Load the sample years of the ECB-FED speeches dataset
+- "sample": Summarise the sample and save it to sample_2022_2023.parquet
+- "build":  Stream the saved sample into the batch request file
+- "cost":   Show the cost comparison and save the statistics
+
+For beginners:
+- run() is a generator: it does one stage, hands back the result with
+  `yield`, then carries on with the next stage when asked
+- Each stage saves its output to a file, so a later stage can be run on its
+  own (e.g. phase1_batch_prep.py only runs "build" and "cost")
+- The scripts just pick which stages they need
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from config import Config
+from batch_builder import BatchRequestBuilder, encode_chunk_in_worker
+from utils import print_cost_comparison, print_section_header, resolve_columns, save_json
+
+ALL_STAGES = ("load", "sample", "build", "cost")
+
+# Where each stage saves its output
+SAMPLE_FILE = Config.PROCESSED_DATA_DIR / "sample_2022_2023.parquet"
+BATCH_FILE = (
+    Config.BATCH_INPUT_DIR
+    / f"batch_sample_{Config.SAMPLE_START_YEAR}_{Config.SAMPLE_END_YEAR}.jsonl"
+)
+STATS_FILE = Config.RESULTS_DIR / "phase1_statistics.json"
+
+
+def run(steps: Sequence[str] = ALL_STAGES, reuse_sample: bool = False,
+        export_csv: bool = False, preview: bool = None) -> Iterator[Tuple[str, Any]]:
+    """
+    Run the chosen Phase 1 stages in order.
+
+    Args:
+        steps: Which stages to run (any of ALL_STAGES)
+        reuse_sample: Skip "load" and "sample" if the sample file already exists
+        export_csv: Also save the sample as CSV in the "sample" stage
+        preview: Skip "build" and estimate the costs from the speech lengths
+            alone (defaults to Config.COST_PREVIEW_MODE == "fast")
+
+    Yields:
+        (stage_name, payload) for each stage that finished:
+        "load" -> the sample DataFrame, "sample" -> the sample file,
+        "build" -> the batch file statistics, "preview" -> the estimated
+        statistics (instead of "build"), "cost" -> the statistics file
+
+    For beginners:
+    - If something goes wrong (e.g. missing API key) the problem is printed
+      and the generator simply stops, so later stages don't run
+    """
+
+    # ============================================================
+    # STEP 1: Validate Configuration
+    # ============================================================
+    print_section_header("STEP 1: VALIDATE CONFIGURATION")
+
+    try:
+        Config.validate()
+    except ValueError as e:
+        print(f"\n❌ Configuration Error: {e}")
+        print("\nTo fix this:")
+        print("1. Copy .env.example to .env")
+        print("2. Add your OpenAI API key to .env")
+        print("3. Add your Hugging Face token to .env")
+        print("4. Run this script again")
+        return
+
+    if reuse_sample and SAMPLE_FILE.exists() and "sample" in steps:
+        # An earlier run already saved the sample: skip the download
+        print_section_header("STEPS 2-3: REUSE SAVED SAMPLE")
+        print(f"📂 Using sample data from: {SAMPLE_FILE}")
+        print("   (delete this file to re-sample)")
+        steps = [step for step in steps if step not in ("load", "sample")]
+        yield "sample", SAMPLE_FILE
+
+    if preview is None:
+        preview = Config.COST_PREVIEW_MODE == "fast"
+
+    sample_df = None
+    stats = None
+
+    for step in steps:
+        if step == "load":
+            sample_df = _load_sample()
+            yield "load", sample_df
+
+        elif step == "sample":
+            if sample_df is None:
+                sample_df = _load_sample()
+            yield "sample", _save_sample(sample_df, export_csv)
+
+        elif step == "build":
+            if preview:
+                continue
+            stats = _build_batch_file()
+            if stats is None:
+                return
+            yield "build", stats
+
+        elif step == "cost":
+            if stats is None:
+                stats = _preview_costs() if preview else _build_batch_file()
+                if stats is None:
+                    return
+                if preview:
+                    yield "preview", stats
+            yield "cost", _compare_costs(stats)
+
+        else:
+            raise ValueError(f"Unknown Phase 1 stage: {step!r} (expected one of {ALL_STAGES})")
+
+
+def _load_sample() -> pd.DataFrame:
+    """
+    Stage "load": load only the sample years from the dataset.
+    """
+    print_section_header("STEP 2: LOAD DATASET FROM HUGGING FACE")
+
+    # Imported here so the later stages work without the Hugging Face
+    # libraries installed
+    from data_loader import DataLoader
+
+    loader = DataLoader()
+
+    # Load only the sample years (2022-2023 for testing); the rest of the
+    # dataset is filtered out while reading and never loaded into memory
+    sample_df = loader.load_years(
+        start_year=Config.SAMPLE_START_YEAR, end_year=Config.SAMPLE_END_YEAR
+    )
+
+    # Show summary
+    loader.print_dataset_summary(sample_df)
+
+    return sample_df
+
+
+def _save_sample(sample_df: pd.DataFrame, export_csv: bool) -> Path:
+    """
+    Stage "sample": summarise the sample and save it for the later stages.
+    """
+    print_section_header("STEP 3: SAMPLE TEST DATA")
+
+    print(f"\n📋 Sample Data Summary:")
+    print(f"   Total speeches: {len(sample_df)}")
+
+    if "country" in sample_df.columns:
+        print(f"\n   By country (institution):")
+        for country, count in sample_df["country"].value_counts().items():
+            print(f"      {country}: {count}")
+
+    # Display columns available
+    print(f"\n   Available columns:")
+    for col in sample_df.columns:
+        print(f"      - {col}")
+
+    # Save sample as Parquet: much smaller than CSV for long speech texts,
+    # and later steps can read just the columns they need
+    sample_df.to_parquet(SAMPLE_FILE, engine="pyarrow", compression="zstd", index=False)
+    print(f"\n✓ Saved sample to: {SAMPLE_FILE}")
+
+    if export_csv:
+        csv_file = SAMPLE_FILE.with_suffix(".csv")
+        sample_df.to_csv(csv_file, index=False)
+        print(f"✓ Saved CSV copy to: {csv_file}")
+
+    return SAMPLE_FILE
+
+
+def _find_sample_file():
+    """
+    Find the saved sample and read its column names.
+
+    Returns:
+        (sample_file, available_columns), or (None, None) if there is no sample
+    """
+    print_section_header("LOADING SAMPLE DATA")
+
+    # Try parquet first, then CSV
+    sample_file = SAMPLE_FILE
+    if not sample_file.exists():
+        sample_file = SAMPLE_FILE.with_suffix(".csv")
+
+    if not sample_file.exists():
+        print(f"\n❌ Error: Sample file not found at {sample_file}")
+        print("\nPlease run phase1_data_prep.py first to create the sample data:")
+        print("   python phase1_data_prep.py")
+        return None, None
+
+    print(f"📂 Loading sample data from: {sample_file}")
+    # Read just the header first - the full file holds several text columns
+    # (text, mistral_ocr, clean_text) and we only need one of them
+    if sample_file.suffix == ".parquet":
+        available_columns = pq.ParquetFile(sample_file).schema_arrow.names
+    else:
+        available_columns = list(pd.read_csv(sample_file, nrows=0).columns)
+
+    return sample_file, available_columns
+
+
+def _open_sample_reader(sample_file: Path, selected_columns, id_col: str = None):
+    """
+    Stream the chosen columns of the saved sample as PyArrow record batches.
+
+    Only one chunk of speeches is held in memory at a time.
+    """
+    if sample_file.suffix == ".parquet":
+        # Parquet stores each column separately, so the unused text columns
+        # are never read from disk
+        return pq.ParquetFile(sample_file).iter_batches(
+            batch_size=Config.PARQUET_CHUNK_ROWS, columns=selected_columns
+        )
+
+    # PyArrow's multithreaded CSV reader. Speeches contain line breaks, so
+    # newlines_in_values must be switched on. Every column is read as text
+    # so dates stay as they appear in the file.
+    return pa_csv.open_csv(
+        sample_file,
+        read_options=pa_csv.ReadOptions(block_size=Config.CSV_CHUNK_BYTES),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=selected_columns,
+            column_types={
+                col: pa.string() for col in selected_columns if col != id_col
+            },
+            strings_can_be_null=True,  # Empty cells become NaN, as with pandas
+        ),
+    )
+
+
+def _build_batch_file():
+    """
+    Stage "build": stream the saved sample into the batch request file.
+
+    Returns:
+        The batch file statistics, or None if the sample could not be used
+    """
+    sample_file, available_columns = _find_sample_file()
+    if sample_file is None:
+        return None
+
+    # ============================================================
+    # STEP 4: Build Batch Request File
+    # ============================================================
+    print_section_header("STEP 4: BUILD BATCH REQUEST FILE")
+
+    # Map actual dataset columns to what we need
+    # Dataset columns: 'date', 'author', 'country', 'title', 'description',
+    #                  'text', 'mistral_ocr', 'clean_text', 'url', 'year'
+
+    print(f"\n📋 Dataset columns available:")
+    for col in available_columns:
+        print(f"   - {col}")
+
+    # Find the column for each piece of information we need
+    columns = resolve_columns(available_columns, Config.COLUMN_CANDIDATES)
+
+    text_col = columns["text"]
+    if not text_col:
+        print("\n❌ Error: Could not find a speech text column")
+        print(f"   Available columns: {available_columns}")
+        return None
+    print(f"\n✓ Using '{text_col}' column for speech content")
+
+    # Work out which columns need a default value (filled in per chunk below)
+    id_col = columns["id"] or "id"
+    speaker_col = columns["speaker"] or "author"
+    institution_col = columns["institution"] or "country"
+    date_col = columns["date"] or "date"
+    missing_defaults = {}
+
+    if not columns["id"]:
+        print("✓ Creating 'id' column")
+
+    for role, col in [
+        ("speaker", speaker_col),
+        ("institution", institution_col),
+        ("date", date_col),
+    ]:
+        if not columns[role]:
+            missing_defaults[col] = "Unknown"
+            print(f"⚠️  '{col}' column missing, using 'Unknown'")
+
+    print(f"\n📋 Column mapping:")
+    print(f"   Speech text:  {text_col}")
+    print(f"   Speaker:      {speaker_col}")
+    print(f"   Institution:  {institution_col}")
+    print(f"   Date:         {date_col}")
+    print(f"   ID:           {id_col}")
+
+    # Stream only the columns we mapped
+    selected_columns = [
+        col
+        for col in [text_col, speaker_col, institution_col, date_col, id_col]
+        if col in available_columns
+    ]
+    reader = _open_sample_reader(sample_file, selected_columns, id_col)
+
+    # Build batch file
+    builder = BatchRequestBuilder()
+
+    print_section_header("BUILDING BATCH REQUEST FILE")
+    print(f"\n📝 Streaming speeches from {sample_file.name}...")
+
+    def jobs():
+        rows_read = 0
+        for record_batch in reader:
+            chunk = record_batch.to_pandas()
+
+            # Create ID column if it doesn't exist (continuing across chunks)
+            if id_col not in chunk.columns:
+                chunk[id_col] = range(rows_read, rows_read + len(chunk))
+            rows_read += len(chunk)
+
+            # Fill in missing columns with defaults
+            for col, default in missing_defaults.items():
+                chunk[col] = default
+
+            yield (chunk, text_col, id_col, speaker_col, institution_col, date_col)
+
+    workers = Config.BATCH_WORKERS or os.cpu_count() or 1
+
+    builder.open_batch_file(BATCH_FILE)
+    try:
+        if workers == 1:
+            for job in jobs():
+                builder.write_encoded(builder.encode_chunk(*job))
+        else:
+            # Build the requests for several chunks at once in separate
+            # processes, then write them to the file in their original order.
+            # Only a few chunks per worker are queued, so memory stays bounded.
+            print(f"   Using {workers} worker processes")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for job in jobs():
+                    pending.append(executor.submit(encode_chunk_in_worker, job))
+                    if len(pending) >= 2 * workers:
+                        builder.write_encoded(pending.popleft().result())
+                while pending:
+                    builder.write_encoded(pending.popleft().result())
+    except BaseException:
+        builder.abort_batch_file()
+        raise
+
+    stats = builder.close_batch_file()
+
+    # Validate the batch file
+    print_section_header("VALIDATING BATCH FILE")
+    builder.validate_batch_file(BATCH_FILE)
+
+    return stats
+
+
+def _preview_costs():
+    """
+    Estimate the batch statistics from the speech lengths alone.
+
+    Much quicker than building the batch file, but only a preview:
+    duplicates aren't removed and speaker/date text isn't counted.
+
+    Returns:
+        Estimated statistics (as from close_batch_file()), or None if the
+        sample could not be used
+    """
+    sample_file, available_columns = _find_sample_file()
+    if sample_file is None:
+        return None
+
+    print_section_header("STEP 4: ESTIMATE TOKENS (FAST PREVIEW)")
+
+    text_col = resolve_columns(available_columns, Config.COLUMN_CANDIDATES)["text"]
+    if not text_col:
+        print("\n❌ Error: Could not find a speech text column")
+        print(f"   Available columns: {available_columns}")
+        return None
+    print(f"\n✓ Using '{text_col}' column for speech content")
+
+    # Every prompt wraps the speech in the same instructions
+    template_chars = len(Config.get_sentiment_prompt("", "", "", ""))
+
+    num_requests = 0
+    total_input_tokens = 0
+    for record_batch in _open_sample_reader(sample_file, [text_col]):
+        # Count characters for a whole chunk at once (missing speeches are
+        # sent as "nan"), cut to the length we actually send
+        char_counts = pc.fill_null(pc.utf8_length(record_batch.column(0)), 3)
+        char_counts = np.minimum(char_counts.to_numpy(), Config.MAX_CHARS_ESTIMATE)
+        prompt_tokens = (char_counts + template_chars) // Config.CHARS_PER_TOKEN
+        total_input_tokens += int(prompt_tokens.sum())
+        num_requests += len(char_counts)
+
+    stats = BatchRequestBuilder.estimate_costs(
+        num_requests, total_input_tokens, num_requests * Config.OUTPUT_TOKENS_ESTIMATE
+    )
+    stats['cost_preview'] = True
+
+    print(f"\n📊 Speeches: {num_requests}")
+    print(f"📏 Estimated input tokens: {total_input_tokens:,}")
+    print("   (fast preview - no batch file was written)")
+
+    return stats
+
+
+def _compare_costs(stats) -> Path:
+    """
+    Stage "cost": show the cost comparison and save the statistics.
+    """
+    # ============================================================
+    # STEP 5: Cost Comparison Summary
+    # ============================================================
+    print_section_header("STEP 5: COST COMPARISON")
+
+    print_cost_comparison(stats)
+
+    # Save statistics
+    save_json(stats, STATS_FILE)
+
+    return STATS_FILE
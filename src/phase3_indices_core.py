@@ -0,0 +1,335 @@
+"""
+Shared Phase 3 index building used by phase3_build_indices.py,
+phase3_build_indices_no_fill.py and phase3_build_all.py.
+
+Building the indices is split into:
+- load_data(): Load the prepared data (or prepare it, see phase3_data_prep.py)
+- run():       Build, save and summarise the daily Fed and ECB indices, either
+               forward-filled (every day) or not (only dates with speeches)
+
+For beginners:
+- Loading the data is the slow part, so phase3_build_all.py loads it once and
+  calls run() twice, once for each kind of index
+- run() doesn't change the data it is given, so it can be reused
+- The other two scripts just load the data and build one kind of index
+"""
+
+import warnings
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from utils import load_table, print_section_header, save_table
+
+# Continuous metrics (calculate mean)
+CONTINUOUS_METRICS = [
+    'hawkish_dovish_score',
+    'uncertainty',
+    'forward_guidance_strength',
+    'topic_inflation',
+    'topic_growth',
+    'topic_financial_stability',
+    'topic_labor_market',
+    'topic_international'
+]
+
+# Market impact variables (calculate diffusion index)
+MARKET_METRICS = [
+    'market_impact_stocks',
+    'market_impact_bonds',
+    'market_impact_currency'
+]
+
+# Columns of the prepared data used to build the indices (the rest, e.g.
+# speech titles and summaries, isn't loaded), and the types to read them as
+PREPARED_COLUMNS = ['date', 'country'] + CONTINUOUS_METRICS + MARKET_METRICS
+PREPARED_DTYPES = {
+    'country': 'category',
+    **{col: 'float64' for col in CONTINUOUS_METRICS},
+    **{col: 'category' for col in MARKET_METRICS},
+}
+
+# Institutions to build indices for, and the prefix of their output files
+INSTITUTIONS = {
+    'United States': 'fed',
+    'Euro area': 'ecb'
+}
+
+
+def diffusion_weights(values):
+    """
+    Turn market impact labels into diffusion index weights.
+
+    'rise' counts 1, 'neutral' counts 0.5, and 'fall' (or anything else,
+    including missing values) counts 0. The mean weight x 100 is the
+    diffusion index, (% rise) + (0.5 * % neutral): 100 = all 'rise',
+    50 = neutral/mixed, 0 = all 'fall'.
+
+    Args:
+        values: Series or DataFrame with 'rise', 'fall', or 'neutral' values
+
+    Returns:
+        Weights (floats) in the same shape as values
+    """
+    # Comparing with a label runs over the whole column at once (for
+    # category columns, e.g. loaded from Parquet, only the small number
+    # codes are compared), so no Python code runs per value
+    return values.eq('rise') + 0.5 * values.eq('neutral')
+
+
+def aggregate_daily_scores(inst_df, institution):
+    """
+    Aggregate speeches to daily frequency for one institution.
+
+    Args:
+        inst_df: DataFrame with the institution's speeches
+        institution: 'United States' or 'Euro area'
+
+    Returns:
+        DataFrame with daily indices (only dates with speeches, as the index)
+    """
+    # Turn market impact labels into weights (see diffusion_weights): the
+    # mean weight per date x 100 is the diffusion index, so every metric
+    # can be averaged together
+    market_weights = diffusion_weights(inst_df[MARKET_METRICS])
+
+    # Rename market columns to indicate they're diffusion indices
+    market_weights.columns = [col.replace('market_impact_', '') + '_diffusion_index'
+                              for col in market_weights.columns]
+
+    # Group by date once, and get all metrics from the same groups
+    by_date = pd.concat([inst_df[CONTINUOUS_METRICS], market_weights], axis=1).groupby(inst_df['date'])
+    # (saved as float64, the same type as the diffusion indices)
+    daily_indices = by_date.mean().astype('float64')
+    daily_indices[market_weights.columns] *= 100
+
+    # Count speeches per day (the groups are already worked out for the
+    # mean, so counting them doesn't go over the dates again)
+    daily_indices['speech_count'] = by_date.size()
+
+    # Grouping sorts the dates, so the first and last are the date range
+    print(f"\n   Processing {institution}:")
+    print(f"   - Total speeches: {len(inst_df)}")
+    print(f"   - Date range: {daily_indices.index[0].date()} to {daily_indices.index[-1].date()}")
+    print(f"   - Unique dates with speeches: {len(daily_indices)}")
+    print(f"   - Days with multiple speeches: {(daily_indices['speech_count'] > 1).sum()}")
+
+    return daily_indices
+
+
+def create_full_date_range(daily_indices):
+    """
+    Create continuous daily series with forward fill for missing dates.
+
+    Args:
+        daily_indices: DataFrame with indices for dates that have speeches
+
+    Returns:
+        DataFrame with all days filled (forward fill for gaps)
+    """
+    # Get date range (the dates are sorted, from grouping)
+    start_date = daily_indices.index[0]
+    end_date = daily_indices.index[-1]
+
+    # Create full date range (all days, including weekends)
+    full_date_range = pd.date_range(start=start_date, end=end_date, freq='D')
+
+    print(f"\n   Creating continuous daily series:")
+    print(f"   - Start: {start_date.date()}")
+    print(f"   - End: {end_date.date()}")
+    print(f"   - Total days: {len(full_date_range)}")
+    print(f"   - Days with speeches: {len(daily_indices)}")
+    print(f"   - Days to fill: {len(full_date_range) - len(daily_indices)}")
+
+    # Forward fill all columns except speech_count
+    # (speech_count should be 0 for days with no speeches).
+    # Each day takes the values of the last date with speeches on or before
+    # it, picked for all days and columns at once. Missing values on dates
+    # with speeches are filled first, so they carry the last known value
+    # forward too
+    cols_to_fill = [col for col in daily_indices.columns if col != 'speech_count']
+    filled = daily_indices[cols_to_fill].ffill()
+    last_speech_date = daily_indices.index.searchsorted(full_date_range, side='right') - 1
+    full_indices = pd.DataFrame(
+        filled.to_numpy()[last_speech_date], index=full_date_range, columns=cols_to_fill
+    )
+
+    # Fill speech_count with 0 for days with no speeches
+    full_indices['speech_count'] = (
+        daily_indices['speech_count'].reindex(full_date_range, fill_value=0).astype(int)
+    )
+
+    # Reset index to make date a column
+    full_indices = full_indices.reset_index().rename(columns={'index': 'date'})
+
+    return full_indices
+
+
+def load_data(no_cache: bool = False, save_prepared: bool = False) -> Optional[pd.DataFrame]:
+    """
+    Load the prepared data (STEP 1 of the build scripts).
+
+    Args:
+        no_cache: Prepare the data from the sentiment results instead of
+            loading phase3_prepared_data
+        save_prepared: Also save the data prepared here (only with no_cache,
+            or when there is no prepared data yet)
+
+    Returns:
+        DataFrame with one row per speech, or None if it couldn't be prepared
+    """
+    print_section_header("STEP 1: LOAD PREPARED DATA", width=70)
+
+    data_file = Config.RESULTS_DIR / "phase3_prepared_data.csv"
+
+    if no_cache or not (data_file.exists() or data_file.with_suffix('.parquet').exists()):
+        # Prepare the data here, the same way as phase3_data_prep.py, and
+        # use it straight away rather than saving and re-reading it
+        # (phase3_data_prep.py sits next to the scripts that call this)
+        from phase3_data_prep import prepare_data
+
+        print(f"\n   Preparing data from the sentiment results (see phase3_data_prep.py)")
+        df = prepare_data()
+        if df is None:
+            return None
+        if save_prepared:
+            save_table(df, data_file)
+
+        print(f"\nOK Prepared data")
+    else:
+        df = load_table(data_file, parse_dates=['date'], columns=PREPARED_COLUMNS,
+                        dtype=PREPARED_DTYPES)
+
+        print(f"\nOK Loaded prepared data")
+        print(f"   File: {data_file.name}")
+    print(f"   Speeches: {len(df)}")
+    print(f"   Date range: {df['date'].min().date()} to {df['date'].max().date()}")
+    print(f"   Institutions: {df['country'].unique().tolist()}")
+
+    # Scores are at most -100 to 100, so float32 (half the memory of the
+    # default float64) is plenty: daily averages differ by less than 1e-6
+    df[CONTINUOUS_METRICS] = df[CONTINUOUS_METRICS].astype(np.float32)
+
+    # As a category, each country is compared as a small number code
+    # instead of as text when the speeches are split by institution
+    df['country'] = df['country'].astype('category')
+
+    return df
+
+
+def run(df: pd.DataFrame, fill: bool = True) -> Dict[str, Path]:
+    """
+    Build, save and summarise the daily indices (STEPs 2 and 3).
+
+    Args:
+        df: Prepared data from load_data()
+        fill: Forward fill the days without speeches (saved as
+            {fed,ecb}_daily_indices) or keep only the dates with speeches
+            (saved as {fed,ecb}_daily_indices_no_fill)
+
+    Returns:
+        Dictionary of file prefix ('fed' or 'ecb') -> saved CSV file
+    """
+    # ============================================================
+    # STEP 2: Build Indices for Each Institution
+    # ============================================================
+    print_section_header("STEP 2: BUILD DAILY INDICES BY INSTITUTION", width=70)
+    if not fill:
+        print("\n   NOTE: Only creating indices for dates with actual speeches")
+        print("   No forward filling of gaps")
+
+    # Where each institution's indices are saved
+    suffix = "" if fill else "_no_fill"
+    output_files = {
+        file_prefix: Config.RESULTS_DIR / f"{file_prefix}_daily_indices{suffix}.csv"
+        for file_prefix in INSTITUTIONS.values()
+    }
+
+    # Keep each institution's indices for the summary in STEP 3 (instead of
+    # reading back the CSV just saved)
+    results = {}
+
+    # Split the speeches by institution once
+    speeches_by_country = dict(list(df.groupby('country', observed=True)))
+
+    for institution_name, file_prefix in INSTITUTIONS.items():
+        print(f"\n--- {institution_name} ---")
+
+        # Aggregate to daily frequency
+        daily_indices = aggregate_daily_scores(speeches_by_country[institution_name], institution_name)
+
+        if fill:
+            # Create full date range with forward fill
+            indices_df = create_full_date_range(daily_indices)
+        else:
+            # Reset index to make date a column
+            indices_df = daily_indices.reset_index()
+
+        # Save to CSV (plus a Parquet copy, see save_table). The CSV is
+        # rounded to 4 decimals, which is much quicker to write
+        output_file = output_files[file_prefix]
+        save_table(indices_df, output_file, float_format='%.4f', date_format='%Y-%m-%d')
+        results[file_prefix] = indices_df
+
+        print(f"\nOK Saved indices")
+        print(f"   File: {output_file.name}")
+        print(f"   Rows: {len(indices_df)}")
+        print(f"   Columns: {len(indices_df.columns)}")
+
+    # ============================================================
+    # STEP 3: Summary Statistics
+    # ============================================================
+    print_section_header("STEP 3: INDEX SUMMARY STATISTICS", width=70)
+
+    for institution_name, file_prefix in INSTITUTIONS.items():
+        indices_df = results[file_prefix]
+
+        print(f"\n--- {institution_name} ({file_prefix.upper()}) ---")
+        print(f"\n   Date range: {indices_df['date'].iloc[0].date()} to {indices_df['date'].iloc[-1].date()}")
+        if fill:
+            print(f"   Total days: {len(indices_df)}")
+            print(f"   Days with speeches: {(indices_df['speech_count'] > 0).sum()}")
+            print(f"   Days forward-filled: {(indices_df['speech_count'] == 0).sum()}")
+        else:
+            print(f"   Total dates with speeches: {len(indices_df)}")
+            print(f"   Total speeches: {indices_df['speech_count'].sum():.0f}")
+            print(f"   Avg speeches per date: {indices_df['speech_count'].mean():.2f}")
+
+        print(f"\n   Index Statistics (mean ± std):")
+
+        # Continuous metrics
+        metrics = {
+            'Hawkish/Dovish': 'hawkish_dovish_score',
+            'Uncertainty': 'uncertainty',
+            'Forward Guidance': 'forward_guidance_strength',
+            'Inflation Topic': 'topic_inflation',
+            'Growth Topic': 'topic_growth'
+        }
+
+        diffusion_cols = ['stocks_diffusion_index', 'bonds_diffusion_index', 'currency_diffusion_index']
+        diffusion_cols = [col for col in diffusion_cols if col in indices_df.columns]
+
+        # Work out all the statistics in one go with NumPy, on one block of
+        # numbers (skipping missing values, like pandas)
+        stat_cols = list(metrics.values()) + diffusion_cols
+        values = indices_df[stat_cols].to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            # Columns with no values (or fewer than 2 for std) give nan
+            warnings.simplefilter('ignore', RuntimeWarning)
+            means = dict(zip(stat_cols, np.nanmean(values, axis=0)))
+            stds = dict(zip(stat_cols, np.nanstd(values, axis=0, ddof=1)))
+
+        for label, col in metrics.items():
+            print(f"      {label:<20}: {means[col]:>6.1f} ± {stds[col]:>5.1f}")
+
+        # Diffusion indices
+        print(f"\n   Diffusion Indices (mean, range 0-100, 50=neutral):")
+
+        for col in diffusion_cols:
+            label = col.replace('_diffusion_index', '').capitalize()
+            print(f"      {label:<20}: {means[col]:>6.1f}")
+
+    return output_files
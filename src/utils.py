@@ -9,8 +9,12 @@ For beginners:
 - Instead of repeating code, we write it once here and reuse it
 """
 
-import json
+import functools
+import os
+import sys
+import orjson
 import pandas as pd
+import pyarrow as pa
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -88,24 +92,80 @@ def format_cost(cost: float) -> str:
         return f"${cost:.2f}"  # Show 2 decimal places for dollars
 
 
-def save_json(data: Dict[Any, Any], file_path: Path):
+def print_cost_comparison(stats: Dict[str, Any]):
+    """
+    Print a detailed cost breakdown for a batch file.
+
+    Args:
+        stats: Statistics returned by BatchRequestBuilder.close_batch_file()
+
+    For beginners:
+    - The costs are already worked out when the batch file is built,
+      this just shows them side by side for the Batch and real-time APIs
+    """
+
+    print("\n💰 DETAILED COST BREAKDOWN")
+    print("=" * 60)
+
+    print(f"\n📊 Processing {stats['num_requests']} speeches")
+    print(f"   Input tokens:  {stats['total_input_tokens']:,}")
+    if stats['cached_input_tokens']:
+        print(f"   (of which {stats['cached_input_tokens']:,} from the prompt cache)")
+    print(f"   Output tokens: {stats['estimated_output_tokens']:,} (estimated)")
+
+    for api, title, total_key in [
+        ("batch", "BATCH API (50% discount)", "batch_cost_estimate"),
+        ("realtime", "REAL-TIME API (standard pricing)", "realtime_cost_estimate"),
+    ]:
+        costs = stats['cost_breakdown'][api]
+        print(f"\n💵 {title}:")
+        print(f"   Input cost:  ${costs['input']:.2f}")
+        if stats['cached_input_tokens']:
+            print(f"   Cached cost: ${costs['cached_input']:.2f}")
+        print(f"   Output cost: ${costs['output']:.2f}")
+        print(f"   TOTAL:       ${stats[total_key]:.2f}")
+
+    print(f"\n✅ SAVINGS WITH BATCH API:")
+    print(
+        f"   ${stats['savings']:.2f} "
+        f"({stats['savings']/stats['realtime_cost_estimate']*100:.0f}% discount)"
+    )
+
+
+# orjson settings for save_json: indented like json.dump(indent=2), number
+# (e.g. chunk number) dict keys allowed, and NumPy values written as numbers
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def save_json(data: Dict[Any, Any], file_path: Path, verbose: bool = True):
     """
     Save data to a JSON file.
 
     Args:
         data: Dictionary to save
         file_path: Where to save the file
+        verbose: Whether to print where the file was saved
 
     For beginners:
     - JSON is a common format for structured data
     - It's human-readable (you can open it in a text editor)
     - It's also easy for programs to read and write
+    - We use orjson, a much faster drop-in for Python's json module
+    - We write to a temporary file first and then swap it into place, so
+      a crash mid-write never leaves a half-written (broken) file behind
     """
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=JSON_OPTIONS))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
 
-    print(f"✓ Saved JSON to: {file_path}")
+    if verbose:
+        print(f"✓ Saved JSON to: {file_path}")
 
 
 def load_json(file_path: Path) -> Dict[Any, Any]:
@@ -119,12 +179,46 @@ def load_json(file_path: Path) -> Dict[Any, Any]:
         Dictionary with the loaded data
     """
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
 
     return data
 
 
+def load_chunk_manifest(manifest_file: Path) -> Dict[int, Dict[str, Any]]:
+    """
+    Load the info saved for each submitted chunk.
+
+    Args:
+        manifest_file: Path to the chunk manifest (Config.CHUNK_MANIFEST_FILE)
+
+    Returns:
+        Dictionary mapping chunk number to its chunk info, in chunk order
+        (empty if no chunks have been submitted)
+
+    For beginners:
+    - All chunks are saved together in one JSON file (the "manifest"),
+      so there is only one file to read and write
+    - Runs submitted before the manifest existed saved one
+      phase2_chunkNN_info.json file per chunk; those are read instead
+    """
+
+    manifest_file = Path(manifest_file)
+
+    if manifest_file.exists():
+        chunks = load_json(manifest_file).values()
+    else:
+        chunks = [
+            load_json(chunk_file)
+            for chunk_file in manifest_file.parent.glob("phase2_chunk*_info.json")
+        ]
+
+    return {
+        chunk_info["chunk_number"]: chunk_info
+        for chunk_info in sorted(chunks, key=lambda info: info["chunk_number"])
+    }
+
+
 def save_dataframe(df: pd.DataFrame, file_path: Path, format: str = 'csv'):
     """
     Save a pandas DataFrame to file.
@@ -204,9 +298,42 @@ def print_section_header(title: str, width: int = 60):
     - Visual separation between different sections
     """
 
-    print("\n" + "=" * width)
-    print(title.center(width))
-    print("=" * width)
+    line = "=" * width
+    print(f"\n{line}\n{title.center(width)}\n{line}")
+
+
+def confirm(prompt: str, default: bool = False, force: bool = False,
+            interactive: bool = True) -> bool:
+    """
+    Ask a yes/no question, without getting stuck when nobody can answer.
+
+    Args:
+        prompt: The question, e.g. "   Download again? (y/N): "
+        default: The answer used when the question isn't asked (or the
+            reply is left empty)
+        force: If True, answer yes without asking
+        interactive: If False, never ask and use the default
+
+    Returns:
+        True for yes, False for no
+
+    For beginners:
+    - When a script runs unattended (scheduled, or with its input
+      redirected) there is nobody to type a reply, and input() would
+      wait forever
+    - So the question is only asked in a real terminal; otherwise the
+      default answer is used
+    """
+
+    if force:
+        return True
+    if not interactive or not sys.stdin.isatty():
+        return default
+
+    response = input(prompt).strip().lower()
+    if not response:
+        return default
+    return response in ('y', 'yes')
 
 
 def print_progress_bar(current: int, total: int, prefix: str = "",
@@ -240,6 +367,124 @@ def print_progress_bar(current: int, total: int, prefix: str = "",
         print()  # New line when complete
 
 
+def count_lines(file_path: Path) -> int:
+    """
+    Count the lines in a file (e.g. the requests in a JSONL batch file).
+
+    Args:
+        file_path: The file to count
+
+    Returns:
+        Number of lines
+
+    For beginners:
+    - Instead of reading the file line by line in Python, this reads it in
+      big 1 MB blocks and counts the newline characters in each block
+      (bytes.count runs in fast C code)
+    - The answer is remembered until the file changes, so counting the
+      same file twice in one run is free
+    """
+    stat = Path(file_path).stat()
+    return _count_lines(str(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _count_lines(file_path: str, size: int, mtime_ns: int) -> int:
+    # size and mtime_ns are only part of the cache key
+    num_lines = 0
+    last_block = b''
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            num_lines += block.count(b'\n')
+            last_block = block
+
+    # Count a last line without a trailing newline too
+    if last_block and not last_block.endswith(b'\n'):
+        num_lines += 1
+    return num_lines
+
+
+def is_up_to_date(output_file: Path, source_file: Path) -> bool:
+    """
+    Check whether a file made from another file can be reused.
+
+    Args:
+        output_file: The file that was made (e.g. a parsed CSV)
+        source_file: The file it was made from (e.g. downloaded results)
+
+    Returns:
+        True if output_file exists and is at least as new as source_file
+
+    For beginners:
+    - If the source was changed (e.g. downloaded again) after the output
+      was made, the output is out of date and should be made again
+    """
+    try:
+        return Path(output_file).stat().st_mtime >= Path(source_file).stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def save_table(df: pd.DataFrame, csv_file: Path, float_format: Optional[str] = None,
+               date_format: Optional[str] = None):
+    """
+    Save a DataFrame as CSV, plus a Parquet copy next to it.
+
+    Args:
+        df: The DataFrame to save
+        csv_file: Where to save the CSV (the copy gets a .parquet suffix)
+        float_format: How to write numbers in the CSV, e.g. '%.4f' for 4
+                      decimals (default: all digits)
+        date_format: How to write dates in the CSV, e.g. '%Y-%m-%d'
+
+    For beginners:
+    - The CSV is for people (and other tools) to open
+    - The Parquet copy is what load_table reads: it loads much faster and
+      keeps column types, e.g. dates stay dates
+    - float_format only rounds the CSV; the Parquet copy keeps every digit
+    """
+    csv_file = Path(csv_file)
+    parquet_file = csv_file.with_suffix('.parquet')
+
+    df.to_csv(csv_file, index=False, float_format=float_format, date_format=date_format)
+    try:
+        df.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Some column mixes types (e.g. text in a number column), which
+        # Parquet can't store; remove any older copy so it isn't used instead
+        parquet_file.unlink(missing_ok=True)
+
+
+def load_table(csv_file: Path, parse_dates: Optional[list] = None,
+               columns: Optional[list] = None,
+               dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Load a table saved by save_table.
+
+    Args:
+        csv_file: The CSV file
+        parse_dates: Columns to read as dates (only needed for the CSV)
+        columns: Only load these columns (default: all)
+        dtype: Column types for the CSV, e.g. {'country': 'category'}
+               (the Parquet copy already keeps them)
+
+    Returns:
+        The DataFrame, from the Parquet copy if it's up to date, else the CSV
+
+    For beginners:
+    - If the CSV was changed after the Parquet copy was saved (e.g. edited
+      by hand), the CSV is read instead
+    - Leaving out columns you don't need (e.g. long text) saves both time
+      and memory
+    """
+    csv_file = Path(csv_file)
+    parquet_file = csv_file.with_suffix('.parquet')
+
+    if is_up_to_date(parquet_file, csv_file) or (parquet_file.exists() and not csv_file.exists()):
+        return pd.read_parquet(parquet_file, columns=columns)
+    return pd.read_csv(csv_file, parse_dates=parse_dates, usecols=columns, dtype=dtype)
+
+
 def validate_dataframe_columns(df: pd.DataFrame, required_columns: list,
                                df_name: str = "DataFrame") -> bool:
     """
@@ -272,6 +517,32 @@ def validate_dataframe_columns(df: pd.DataFrame, required_columns: list,
     return True
 
 
+def resolve_columns(columns, candidates: Dict[str, list]) -> Dict[str, Optional[str]]:
+    """
+    Match dataset columns to the roles we need (speech text, speaker, ...).
+
+    Args:
+        columns: Column names available in the dataset
+        candidates: For each role, possible column names in order of preference
+
+    Returns:
+        Dictionary mapping each role to the matching column name,
+        or None if none of its candidates exist
+
+    For beginners:
+    - Different versions of the dataset may name columns differently
+    - Matching ignores upper/lower case ('Date' matches 'date')
+    """
+
+    # Build the lookup once instead of scanning every column per role
+    cols_lower = {col.lower(): col for col in columns}
+
+    return {
+        role: next((cols_lower[name] for name in names if name in cols_lower), None)
+        for role, names in candidates.items()
+    }
+
+
 # Example usage
 if __name__ == "__main__":
     """
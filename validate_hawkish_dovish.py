@@ -3,15 +3,15 @@ Validate Hawkish/Dovish Scores Against Actual Speeches
 Compare model scores with actual speech content
 """
 
-import pandas as pd
 import json
 from pathlib import Path
 from src.config import Config
+from src.utils import load_table
 
 def load_results():
     """Load prepared data with speech IDs"""
     prepared_file = Config.RESULTS_DIR / "phase3_prepared_data.csv"
-    df = pd.read_csv(prepared_file, parse_dates=['date'])
+    df = load_table(prepared_file, parse_dates=['date'])
 
     # Split into Fed and ECB
     fed_df = df[df['country'] == 'United States'].copy()